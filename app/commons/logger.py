@@ -1,16 +1,161 @@
+import atexit
+import gzip
+import json
 import logging
 import os
+import queue
+import shutil
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(module)s.%(funcName)s - %(message)s'
+LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+# records written per flush of the file
+BATCH_SIZE = 256
+MAX_LOG_BYTES = 5 * 1024 * 1024
+LOG_BACKUPS = 5
 
-def setup_logger(name: str = "app_logger", log_file: str = "app.log", level: int = logging.INFO) -> logging.Logger:
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line, for log shippers and jq
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": self.formatTime(record, LOG_DATE_FORMAT),
+            "logger": record.name,
+            "level": record.levelname,
+            "where": f"{record.module}.{record.funcName}",
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False)
+
+
+class CompressedRotatingFileHandler(RotatingFileHandler):
+    """
+    Size based rotation that gzips the rotated files (app.log.1.gz, ...).
+    emit does not flush: the listener flushes once per batch of records.
+    """
+
+    def __init__(self, filename: str, max_bytes: int = MAX_LOG_BYTES, backup_count: int = LOG_BACKUPS) -> None:
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8', delay=True)
+        self.namer = lambda name: f"{name}.gz"
+        self.rotator = self._compress
+
+    @staticmethod
+    def _compress(source: str, dest: str) -> None:
+        with open(source, 'rb') as src, gzip.open(dest, 'wb') as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(source)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class InProcessQueueHandler(QueueHandler):
+    """
+    The queue never leaves the process, so records are enqueued as they are:
+    no copy and no formatting on the caller's thread, only the message is
+    frozen in case its arguments change before the listener formats it.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+class BatchingQueueListener(QueueListener):
+    """
+    Drains every queued record (up to BATCH_SIZE) before flushing the
+    handlers, so a burst of logs costs one write instead of one per record.
+    """
+
+    # what stop() enqueues to end the thread; QueueListener sets it but typeshed does not declare it
+    _sentinel = None
+
+    def __init__(self, log_queue: queue.SimpleQueue, *handlers: logging.Handler, batch_size: int = BATCH_SIZE) -> None:
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.batch_size = batch_size
+
+    def _monitor(self) -> None:
+        while True:
+            batch = [self.dequeue(True)]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.dequeue(False))
+                except queue.Empty:
+                    break
+            stop = False
+            for record in batch:
+                if record is self._sentinel:
+                    stop = True
+                    continue
+                self.handle(record)
+            for handler in self.handlers:
+                try:
+                    handler.flush()
+                except (OSError, ValueError):
+                    # closed stream (e.g. stderr at interpreter exit), records are lost like in emit
+                    pass
+            if stop:
+                return
+
+
+# listeners started by setup_logger by logger name, stopped (and flushed) at exit
+_listeners: dict[str, QueueListener] = {}
+
+
+def stop_logger(name: str) -> None:
+    """
+    Writes the queued records of the logger and stops its thread
+    """
+    listener = _listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+        logging.getLogger(name).handlers.clear()
+
+
+def stop_loggers() -> None:
+    for name in list(_listeners):
+        stop_logger(name)
+
+
+atexit.register(stop_loggers)
+
+
+def setup_logger(
+    name: str = "app_logger",
+    log_file: str = "app.log",
+    level: int = logging.INFO,
+    json_lines: Optional[bool] = None,
+    max_bytes: int = MAX_LOG_BYTES,
+    backup_count: int = LOG_BACKUPS,
+) -> logging.Logger:
     """
-    Set up a basic logger with FileHandler configuration
+    Set up a logger that only enqueues records; a background thread formats,
+    batches and writes them to a rotating, compressed log file
 
     Args:
         name: Logger name
         log_file: Path to log file
         level: Logging level
+        json_lines: Write JSON lines instead of text (default: LOG_FORMAT=json)
+        max_bytes: Size that rotates the log file
+        backup_count: Compressed rotated files kept
 
     Returns:
         Configured logger instance
@@ -23,27 +168,26 @@ def setup_logger(name: str = "app_logger", log_file: str = "app.log", level: int
     if logger.handlers:
         return logger
 
+    if json_lines is None:
+        json_lines = os.environ.get("LOG_FORMAT", "").lower() == "json"
+    formatter = JsonFormatter() if json_lines else logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+
     # Create file handler
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler = CompressedRotatingFileHandler(log_file, max_bytes=max_bytes, backup_count=backup_count)
     file_handler.setLevel(level)
+    file_handler.setFormatter(formatter)
 
     # Create console handler for critical errors
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.ERROR)
-
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(module)s.%(funcName)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-
-    # Add formatter to handlers
-    file_handler.setFormatter(formatter)
-    console_handler.setFormatter(formatter)
-
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    console_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT))
+
+    # the caller only pays for putting the record in the queue
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(InProcessQueueHandler(log_queue))
+    listener = BatchingQueueListener(log_queue, file_handler, console_handler)
+    listener.start()
+    _listeners[name] = listener
 
     return logger
 
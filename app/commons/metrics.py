@@ -0,0 +1,162 @@
+import asyncio
+import bisect
+import functools
+import inspect
+import os
+import time
+from typing import Any, Callable, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# seconds, from a dict lookup to a slow DynamoDB call
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        # one slot per bucket plus +Inf, not cumulative
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Upper bound of the bucket holding the q quantile (+Inf as the last bucket)
+        """
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+def _split_name(name: str) -> tuple[str, str]:
+    # 'dynamodb_seconds{op="get"}' -> ('dynamodb_seconds', 'op="get"')
+    base, _, labels = name.partition("{")
+    return base, labels.rstrip("}")
+
+
+def _with_labels(base: str, labels: str, extra: str = "") -> str:
+    labels = ",".join(label for label in (labels, extra) if label)
+    return f"{base}{{{labels}}}" if labels else base
+
+
+class Metrics:
+    """
+    Process wide timers, histograms and counters. While disabled every
+    recording call returns after reading one attribute, so the hot paths keep
+    their decorators in production.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.histograms: dict[str, Histogram] = {}
+        self.counters: dict[str, float] = {}
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def reset(self) -> None:
+        self.histograms.clear()
+        self.counters.clear()
+
+    def observe(self, name: str, value: float) -> None:
+        if not self.enabled:
+            return
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.observe(value)
+
+    def inc(self, name: str, value: float = 1) -> None:
+        if not self.enabled:
+            return
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def timed(self, name: str) -> Callable[[F], F]:
+        """
+        Records the duration in seconds (monotonic clock) of every call of
+        the decorated function or coroutine function, failed calls included.
+        """
+
+        def decorator(func: F) -> F:
+            if inspect.iscoroutinefunction(func):
+
+                @functools.wraps(func)
+                async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                    if not self.enabled:
+                        return await func(*args, **kwargs)
+                    start = time.perf_counter()
+                    try:
+                        return await func(*args, **kwargs)
+                    finally:
+                        self.observe(name, time.perf_counter() - start)
+
+                return async_wrapper  # type: ignore
+
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.observe(name, time.perf_counter() - start)
+
+            return wrapper  # type: ignore
+
+        return decorator
+
+    def render(self) -> str:
+        """
+        Prometheus text exposition format
+        """
+        lines = []
+        typed: set[str] = set()
+        for name in sorted(self.counters):
+            base, labels = _split_name(name)
+            if base not in typed:
+                typed.add(base)
+                lines.append(f"# TYPE {base} counter")
+            lines.append(f"{_with_labels(base, labels)} {self.counters[name]:g}")
+        for name in sorted(self.histograms):
+            histogram = self.histograms[name]
+            base, labels = _split_name(name)
+            if base not in typed:
+                typed.add(base)
+                lines.append(f"# TYPE {base} histogram")
+            cumulative = 0
+            for bound, count in zip(histogram.buckets + (float("inf"),), histogram.counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                le_label = f'le="{le}"'
+                lines.append(f"{_with_labels(base + '_bucket', labels, le_label)} {cumulative}")
+            lines.append(f"{_with_labels(base + '_sum', labels)} {histogram.sum:.6f}")
+            lines.append(f"{_with_labels(base + '_count', labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: str) -> None:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            file.write(self.render())
+        os.replace(tmp_path, path)
+
+    async def dump_every(self, path: str, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await asyncio.to_thread(self.dump, path)
+
+
+metrics = Metrics()
+timed = metrics.timed
@@ -0,0 +1,89 @@
+import asyncio
+import cProfile
+import io
+import os
+import pstats
+import time
+import tracemalloc
+
+from app.commons.logger import logger
+
+TOP_FUNCTIONS = 40
+TOP_ALLOCATIONS = 25
+# frames kept per allocation, enough to reach the caller of pydantic
+TRACEMALLOC_FRAMES = 10
+
+
+class Profiler:
+    """
+    Profiles the running register for a time window: cProfile on the event
+    loop thread (the view, the cron jobs and sync) and tracemalloc for the
+    allocations. When the window closes it writes a timestamped ``.prof``
+    (for snakeviz or pstats) and a ``.txt`` report with the top functions by
+    cumulative time and the top allocating lines.
+    """
+
+    def __init__(self, directory: str = "profiles") -> None:
+        self.directory = directory
+        self._profile: cProfile.Profile | None = None
+        self._timer: asyncio.TimerHandle | None = None
+        self._started_at = 0.0
+        self.last_report: str | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._profile is not None
+
+    def start(self, seconds: float) -> bool:
+        """
+        Returns False if a window is already open
+        """
+        if self.running:
+            return False
+        self._started_at = time.time()
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+        self._timer = asyncio.get_running_loop().call_later(seconds, self.stop)
+        logger.info(f"Profiling for {seconds} seconds")
+        return True
+
+    def stop(self) -> str | None:
+        """
+        Closes the window and writes the reports, returns the report path
+        """
+        if self._profile is None:
+            return None
+        profile, self._profile = self._profile, None
+        profile.disable()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        self.last_report = self._write_reports(profile, snapshot)
+        logger.info(f"Profile written to {self.last_report}")
+        return self.last_report
+
+    def _write_reports(self, profile: cProfile.Profile, snapshot: tracemalloc.Snapshot) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self._started_at))
+        base = os.path.join(self.directory, f"profile-{stamp}")
+        profile.dump_stats(f"{base}.prof")
+
+        report = io.StringIO()
+        report.write(f"window: {time.time() - self._started_at:.1f}s\n\n")
+        pstats.Stats(profile, stream=report).sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+        report.write(f"\nTop {TOP_ALLOCATIONS} allocating lines\n")
+        snapshot = snapshot.filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            )
+        )
+        for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]:
+            frame = stat.traceback[0]
+            report.write(f"{frame.filename}:{frame.lineno}  {stat.size / 1024:.1f} KiB  {stat.count} blocks\n")
+        with open(f"{base}.txt", "w", encoding="utf-8") as file:
+            file.write(report.getvalue())
+        return f"{base}.txt"
@@ -1,24 +1,107 @@
+import asyncio
 import time
-
 from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+DAY_SECONDS = 86400
+# Colombian time zone offset (UTC-5)
+COLOMBIA_UTC_OFFSET = -5 * 3600
+COLOMBIA_TZ = timezone(timedelta(seconds=COLOMBIA_UTC_OFFSET))
 
 
 def now() -> int:
     return time.time_ns()
 
 
-def get_posix_time_until_day() -> int:
-    # Define the Colombian time zone offset (UTC-5)
-    colombia_tz = timezone(timedelta(hours=-5))
+def get_day_start(posix_time: float, utc_offset: int = COLOMBIA_UTC_OFFSET) -> int:
+    # POSIX timestamp of the local midnight that starts the day of posix_time
+    return int((posix_time + utc_offset) // DAY_SECONDS * DAY_SECONDS - utc_offset)
+
+
+def get_day_from_date(date_str: str, date_format: str = "%d-%m-%Y") -> int:
+    # day id of a local date like 31-07-2025
+    return int(datetime.strptime(date_str, date_format).replace(tzinfo=COLOMBIA_TZ).timestamp())
+
+
+class Clock:
+    """
+    Keeps the id of the current day (POSIX time of its local midnight).
+
+    Reading ``current_day`` compares the wall clock with the cached day
+    bounds, no timezone or datetime work. Once ``start`` is called a timer on
+    the event loop also rolls the day over at local midnight so listeners run
+    even if nobody reads the day. The timer runs on monotonic time and fires
+    late after a suspend or a wall clock step; the check on read does not
+    depend on it.
+    """
+
+    def __init__(self, now: Callable[[], float] = time.time, utc_offset: int = COLOMBIA_UTC_OFFSET) -> None:
+        self._now = now
+        self._utc_offset = utc_offset
+        self._timer: asyncio.TimerHandle | None = None
+        self._listeners: list[Callable[[int, int], None]] = []
+        self._current_day = get_day_start(now(), utc_offset)
+        self._next_rollover = self._current_day + DAY_SECONDS
+
+    @property
+    def current_day(self) -> int:
+        now = self._now()
+        if now >= self._next_rollover or now < self._current_day:
+            self._roll_over()
+        return self._current_day
+
+    def on_rollover(self, listener: Callable[[int, int], None]) -> None:
+        """
+        ``listener(previous_day, current_day)`` runs every time the day changes.
+        """
+        self._listeners.append(listener)
 
-    # Get the current time in the Colombian time zone
-    current_time = datetime(hour=21,year=2025,month=7,day=2)
+    def start(self) -> None:
+        self.stop()
+        self._roll_over()
+        delay = max(self._next_rollover - self._now(), 0)
+        self._timer = asyncio.get_running_loop().call_later(delay, self.start)
 
-    # Create a new datetime with hours, minutes, and seconds set to zero
-    day_time = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
+    def stop(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _roll_over(self) -> None:
+        current_day = get_day_start(self._now(), self._utc_offset)
+        if current_day == self._current_day:
+            return
+        previous_day = self._current_day
+        self._current_day = current_day
+        self._next_rollover = current_day + DAY_SECONDS
+        for listener in self._listeners:
+            listener(previous_day, current_day)
+
+
+class ManualClock(Clock):
+    """
+    Clock driven by ``advance`` instead of the wall clock, to simulate days
+    of trading in tests and benchmarks.
+    """
+
+    def __init__(self, start_time: float, utc_offset: int = COLOMBIA_UTC_OFFSET) -> None:
+        self.time = start_time
+        super().__init__(now=lambda: self.time, utc_offset=utc_offset)
+
+    def advance(self, seconds: float) -> None:
+        self.time += seconds
+        self._roll_over()
+
+    def now_ns(self) -> int:
+        return int(self.time * 1_000_000_000)
+
+
+clock = Clock()
+
+
+def get_posix_time_until_day() -> int:
+    return clock.current_day
 
-    # Convert the datetime back to a POSIX timestamp
-    return int(day_time.timestamp())
 
 if __name__ == "__main__":
-    print(get_posix_time_until_day())
\ No newline at end of file
+    print(get_posix_time_until_day())
@@ -1,73 +1,693 @@
 import asyncio
 import json
+import os
+from collections import OrderedDict
+from collections.abc import Container, Iterable, Iterator, Mapping, MutableMapping
 from decimal import Decimal
+from typing import Any, cast
 
-import boto3
+import pydantic
 
 from app.commons import time
-from app.register import ports, model
+from app.commons.metrics import metrics, timed
+from app.register import ports, model, codec, serialization
 
-lock = asyncio.Lock()
+SUMMARY_SORT_KEY = "#summary"
+BATCH_WRITE_SIZE = 25
+SEGMENT_SUFFIX = ".seg"
+# bill ids of a segment, one per line, read to index the day without decoding it
+BILL_IDS_SUFFIX = ".ids"
+# summary of a segment (codec.summarize_daily_shift), read by the sync to check the day without decoding it
+SUMMARY_SUFFIX = ".sum"
 
 
-class InMemoryRepo(ports.Repository):
-    def __init__(self, path_file: str = "daily_shifts.json") -> None:
-        self._daily_shifts = self._load_daily_shifts_from_file(path_file)
+def _to_dynamo_item(data: dict | str | bytes) -> dict:
+    # this is a workaround to avoid serialization issues with Decimal
+    if isinstance(data, dict):
+        data = json.dumps(data)
+    return json.loads(data, parse_float=Decimal)  # type: ignore
 
-    @staticmethod
-    def _load_daily_shifts_from_file(path_file: str) -> dict[int, model.DailyShift]:
+
+def _get_table(table_name: str, access_key: str, secret_key: str) -> Any:
+    # boto3 takes a while to import, only pay for it when DynamoDB is built
+    import boto3
+
+    client = boto3.resource(
+        "dynamodb",
+        region_name="us-east-1",
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+    )
+    return client.Table(table_name)
+
+
+class BillIndex:
+    """
+    Bill id -> (day id, position in the day's bills). Bills are only ever
+    appended to a day, so a position never changes once indexed.
+    """
+
+    def __init__(self) -> None:
+        self._positions: dict[str, tuple[int, int]] = {}
+        self._days: dict[int, list[str]] = {}
+
+    def indexed(self, day_id: int) -> int:
+        return len(self._days.get(day_id, ()))
+
+    def extend(self, day_id: int, bill_ids: Iterable[str]) -> None:
+        day_bill_ids = self._days.setdefault(day_id, [])
+        for bill_id in bill_ids:
+            self._positions[bill_id] = (day_id, len(day_bill_ids))
+            day_bill_ids.append(bill_id)
+
+    def index_day(self, day_id: int, bill_ids: list[str]) -> None:
+        """
+        Indexes the bills of bill_ids not indexed yet, or the whole day again
+        when it has fewer bills than indexed (the day was replaced)
+        """
+        indexed = self.indexed(day_id)
+        if len(bill_ids) < indexed:
+            self.remove_day(day_id)
+            indexed = 0
+        self.extend(day_id, bill_ids[indexed:])
+
+    def remove_day(self, day_id: int) -> None:
+        for bill_id in self._days.pop(day_id, ()):
+            if self._positions.get(bill_id, (None,))[0] == day_id:
+                del self._positions[bill_id]
+
+    def day_ids(self) -> list[int]:
+        return list(self._days)
+
+    def get(self, bill_id: str) -> tuple[int, int] | None:
+        return self._positions.get(bill_id)
+
+    def __contains__(self, bill_id: object) -> bool:
+        return bill_id in self._positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+
+class SegmentStore(MutableMapping[int, model.DailyShift]):
+    """
+    Warm tier of the local storage: one compressed segment file per day
+    (see ``codec``) and a small LRU of decoded days, so old days cost disk
+    space instead of memory.
+    """
+
+    def __init__(self, directory: str, cache_size: int = 4) -> None:
+        self._directory = directory
+        self._cache_size = cache_size
+        self._cache: OrderedDict[int, model.DailyShift] = OrderedDict()
+        self._day_ids: set[int] | None = None
+
+    def _path(self, day_id: int) -> str:
+        return os.path.join(self._directory, f"{day_id}{SEGMENT_SUFFIX}")
+
+    def _load_day_ids(self) -> set[int]:
+        if self._day_ids is None:
+            try:
+                file_names = os.listdir(self._directory)
+            except FileNotFoundError:
+                file_names = []
+            self._day_ids = {
+                int(file_name.removesuffix(SEGMENT_SUFFIX))
+                for file_name in file_names
+                if file_name.endswith(SEGMENT_SUFFIX)
+            }
+        return self._day_ids
+
+    def _remember(self, daily_shift: model.DailyShift) -> None:
+        self._cache[daily_shift.id] = daily_shift
+        self._cache.move_to_end(daily_shift.id)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def __getitem__(self, day_id: int) -> model.DailyShift:
+        if day_id in self._cache:
+            self._cache.move_to_end(day_id)
+            return self._cache[day_id]
+        if day_id not in self._load_day_ids():
+            raise KeyError(day_id)
+        daily_shift = self.read(day_id)
+        self._remember(daily_shift)
+        return daily_shift
+
+    def read(self, day_id: int) -> model.DailyShift:
+        """
+        Decodes a stored day without going through the cache, so it can run
+        in a thread while the event loop keeps using the store
+        """
+        with open(self._path(day_id), "rb") as file:
+            return codec.decode_daily_shift(file.read())
+
+    def __contains__(self, day_id: object) -> bool:
+        # Mapping's default decodes the segment
+        return day_id in self._load_day_ids()
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(sorted(self._load_day_ids()))
+
+    def __len__(self) -> int:
+        return len(self._load_day_ids())
+
+    def _sidecar_path(self, day_id: int, suffix: str) -> str:
+        return self._path(day_id).removesuffix(SEGMENT_SUFFIX) + suffix
+
+    def _write_sidecar(self, day_id: int, suffix: str, data: str) -> None:
+        tmp_path = self._sidecar_path(day_id, suffix) + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            file.write(data)
+        os.replace(tmp_path, tmp_path.removesuffix(".tmp"))
+
+    def _write_bill_ids(self, day_id: int, bill_ids: list[str]) -> None:
+        self._write_sidecar(day_id, BILL_IDS_SUFFIX, "\n".join(bill_ids))
+
+    def bill_ids(self, day_id: int) -> list[str]:
+        """
+        Bill ids of a stored day in order, from the small ids file written next
+        to the segment (segments stored before it existed are decoded once)
+        """
         try:
-            with open(path_file, "r") as file:
-                data_loaded = json.load(file)
-                if not data_loaded:
-                    return {}
-                data_loaded = {
-                    int(k): model.DailyShift.parse_obj(v)
-                    for k, v in data_loaded.items()
-                }
-                return data_loaded  # type: ignore
-        except (FileNotFoundError, json.decoder.JSONDecodeError):
+            with open(self._sidecar_path(day_id, BILL_IDS_SUFFIX), encoding="utf-8") as file:
+                data = file.read()
+            return data.split("\n") if data else []
+        except FileNotFoundError:
+            bill_ids = [bill.id for bill in self.read(day_id).bills]
+            self._write_bill_ids(day_id, bill_ids)
+            return bill_ids
+
+    def summary(self, day_id: int) -> dict:
+        """
+        Total, bills count, last bill id and digest of a stored day, from the
+        summary file written next to the segment (older segments are decoded
+        once). Does not use the cache, so it can run in a thread.
+        """
+        try:
+            with open(self._sidecar_path(day_id, SUMMARY_SUFFIX), encoding="utf-8") as file:
+                return cast(dict, json.load(file))
+        except FileNotFoundError:
+            summary = codec.summarize_daily_shift(self.read(day_id))
+            self._write_sidecar(day_id, SUMMARY_SUFFIX, json.dumps(summary))
+            return summary
+
+    def write(self, daily_shift: model.DailyShift) -> None:
+        """
+        Writes the files of a day without adding it to the store (see ``add``),
+        so it can run in a thread while the event loop keeps using the store
+        """
+        os.makedirs(self._directory, exist_ok=True)
+        # ids and summary first: a segment never exists without them (unless stored by an older version)
+        self._write_bill_ids(daily_shift.id, [bill.id for bill in daily_shift.bills])
+        self._write_sidecar(daily_shift.id, SUMMARY_SUFFIX, json.dumps(codec.summarize_daily_shift(daily_shift)))
+        tmp_path = self._path(daily_shift.id) + ".tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(codec.encode_daily_shift(daily_shift))
+        os.replace(tmp_path, self._path(daily_shift.id))
+
+    def add(self, day_id: int) -> None:
+        self._load_day_ids().add(day_id)
+        # a cached copy would hide the day just written
+        self._cache.pop(day_id, None)
+
+    def put(self, daily_shift: model.DailyShift) -> None:
+        self.write(daily_shift)
+        self.add(daily_shift.id)
+
+    def __setitem__(self, day_id: int, daily_shift: model.DailyShift) -> None:
+        if day_id != daily_shift.id:
+            raise ValueError(f"Day {daily_shift.id} stored as {day_id}")
+        self.put(daily_shift)
+
+    def __delitem__(self, day_id: int) -> None:
+        if day_id not in self:
+            raise KeyError(day_id)
+        self.remove(day_id)
+
+    def remove(self, day_id: int) -> None:
+        self._cache.pop(day_id, None)
+        self._load_day_ids().discard(day_id)
+        for path in (self._path(day_id), *(self._sidecar_path(day_id, suffix) for suffix in (BILL_IDS_SUFFIX, SUMMARY_SUFFIX))):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+class InMemoryRepo(ports.Repository, ports.BillLookup):
+    """
+    Hot tier: the current day plus the ``hot_days`` most recent days live as
+    objects and in ``path_file``. Older days are moved to ``warm_days``.
+    """
+
+    def __init__(
+        self,
+        path_file: str = "daily_shifts.json",
+        hot_days: int = 2,
+        segments_dir: str = "daily_shifts_segments",
+        warm_cache_size: int = 4,
+        lazy: bool = False,
+        clock: time.Clock | None = None,
+    ) -> None:
+        super().__init__()
+        self._clock = clock or time.clock
+        self._path_file = path_file
+        self._hot_days = hot_days
+        self.warm_days = SegmentStore(segments_dir, cache_size=warm_cache_size)
+        # checksum of the last file contents this repo wrote (or loaded as is)
+        self._written_checksum: str | None = None
+        self._deferred_days: dict[int, dict] = {}
+        # group commit: changes staged in memory and how many are on disk; one
+        # write at a time stores every change staged before it started
+        self._write_lock = asyncio.Lock()
+        self._staged = 0
+        self._written = 0
+        self._daily_shifts = self._load_daily_shifts_from_file(path_file, lazy)
+        # hot days are indexed now (their bills are already in memory), warm
+        # days from their ids files on the first lookup or by load_deferred_days
+        self.bill_index = BillIndex()
+        self._warm_days_indexed = False
+        for day_id, daily_shift in self._daily_shifts.items():
+            self.bill_index.index_day(day_id, [bill.id for bill in daily_shift.bills])
+        for day_id, raw_daily_shift in self._deferred_days.items():
+            self.bill_index.index_day(day_id, [bill["id"] for bill in raw_daily_shift["bills"]])
+        cold_days = self._get_cold_days()
+        if cold_days:
+            self._write_daily_shifts(cold_days, self._snapshot(exclude={daily_shift.id for daily_shift in cold_days}))
+            self._move_to_warm_days(cold_days)
+
+    def _load_daily_shifts_from_file(self, path_file: str, lazy: bool) -> dict[int, model.DailyShift]:
+        try:
+            with open(path_file, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return {}
+        try:
+            if not lazy:
+                daily_shifts = serialization.load_daily_shifts(data)
+                self._written_checksum = serialization.checksum(data)
+                return daily_shifts
+            # with lazy only the current day is validated, the rest waits for load_deferred_days
+            data_loaded = serialization.load_raw_daily_shifts(data)
+        except json.decoder.JSONDecodeError:
+            return {}
+        except pydantic.ValidationError as error:
+            if error.errors()[0]["type"] == "json_invalid":
+                return {}
+            raise
+        current_id_shift = self._clock.current_day
+        self._deferred_days = {k: v for k, v in data_loaded.items() if k != current_id_shift}
+        if current_id_shift not in data_loaded:
             return {}
+        return {current_id_shift: model.DailyShift.model_validate(data_loaded[current_id_shift])}
+
+    async def load_deferred_days(self) -> None:
+        deferred_days = dict(self._deferred_days)
+        loaded = await asyncio.to_thread(
+            lambda: {k: model.DailyShift.model_validate(v) for k, v in deferred_days.items()}
+        )
+        for k, daily_shift in loaded.items():
+            if self._deferred_days.pop(k, None) is not None:
+                self._daily_shifts.setdefault(k, daily_shift)
+        if self._get_cold_days():
+            await self._flush()
+        await self._index_warm_days()
+
+    async def _index_warm_days(self) -> None:
+        if self._warm_days_indexed:
+            return
+        self._warm_days_indexed = True
+        warm_day_ids = [day_id for day_id in self.warm_days if not self.bill_index.indexed(day_id)]
+        # files are read in a thread, the index is only changed on the event loop
+        bill_ids = await asyncio.to_thread(lambda: {day_id: self.warm_days.bill_ids(day_id) for day_id in warm_day_ids})
+        for day_id, day_bill_ids in bill_ids.items():
+            if day_id in self.warm_days:
+                self.bill_index.index_day(day_id, day_bill_ids)
+
+    async def find_bill(self, bill_id: str) -> tuple[model.DailyShift, model.Bill] | None:
+        """
+        Day and bill with that id among the days stored in this machine: an
+        index lookup plus the day itself (from memory, or decoded from its
+        segment for warm days).
+        """
+        await self._index_warm_days()
+        location = self.bill_index.get(bill_id)
+        if location is None:
+            return None
+        day_id, position = location
+        daily_shift = await self.get(day_id)
+        if daily_shift is None or position >= len(daily_shift.bills) or daily_shift.bills[position].id != bill_id:
+            return None
+        return daily_shift, daily_shift.bills[position]
 
     async def get(self, id_: int) -> model.DailyShift | None:
-        return self._daily_shifts.get(id_, None)
+        if id_ in self._deferred_days:
+            self._daily_shifts[id_] = model.DailyShift.model_validate(self._deferred_days.pop(id_))
+        daily_shift = self._daily_shifts.get(id_, None)
+        if daily_shift is None and id_ in self.warm_days:
+            daily_shift = await asyncio.to_thread(self.warm_days.get, id_)
+        return daily_shift
 
+    @timed("repo_save_seconds")
     async def save(self, daily_shift: model.DailyShift) -> None:
+        # stored before the first await, the next lane to take the day lock finds it
         self._daily_shifts[daily_shift.id] = daily_shift
-        await asyncio.to_thread(self._write_daily_shift_to_file)
+        indexed = self.bill_index.indexed(daily_shift.id)
+        if indexed <= len(daily_shift.bills):
+            self.bill_index.extend(daily_shift.id, (bill.id for bill in daily_shift.bills[indexed:]))
+        else:
+            self.bill_index.index_day(daily_shift.id, [bill.id for bill in daily_shift.bills])
+        await self._flush()
 
-    def _write_daily_shift_to_file(self) -> None:
-        with open("daily_shifts.json", "w") as file:
-            serialized_daily_shifts = {
-                k: v.model_dump() for k, v in self._daily_shifts.items()
-            }
-            json.dump(serialized_daily_shifts, file)
+    async def _flush(self) -> None:
+        """
+        Returns once the current state is on disk. Saves arriving while a
+        write is running wait for it and are then stored together by the
+        next one, so N lanes saving at once cost about two writes, not N.
+        """
+        self._staged += 1
+        change = self._staged
+        async with self._write_lock:
+            if self._written >= change:
+                return
+            staged = self._staged
+            cold_days = [self._copy(daily_shift) for daily_shift in self._get_cold_days()]
+            snapshot = self._snapshot(exclude={daily_shift.id for daily_shift in cold_days})
+            # only the files are written in the thread, the tiers change on the event loop
+            await asyncio.to_thread(self._write_daily_shifts, cold_days, snapshot)
+            self._move_to_warm_days(cold_days)
+            self._written = staged
+        metrics.inc("repo_writes_total")
+
+    def _snapshot(self, exclude: Container[int] = ()) -> dict[int, Any]:
+        # copied on the event loop: the lanes keep adding bills while the thread dumps
+        return {
+            **self._deferred_days,
+            **{
+                k: self._copy(daily_shift)
+                for k, daily_shift in self._daily_shifts.items()
+                if k not in exclude
+            },
+        }
+
+    @staticmethod
+    def _copy(daily_shift: model.DailyShift) -> model.DailyShift:
+        return daily_shift.model_copy(update={"bills": list(daily_shift.bills)})
+
+    def _get_cold_days(self) -> list[model.DailyShift]:
+        current_id_shift = self._clock.current_day
+        past_days = sorted((k for k in self._daily_shifts if k != current_id_shift), reverse=True)
+        return [self._daily_shifts[k] for k in past_days[self._hot_days :]]
+
+    def _write_daily_shifts(self, cold_days: list[model.DailyShift], snapshot: dict[int, Any]) -> None:
+        # segments first, so a day is never missing from both files
+        for daily_shift in cold_days:
+            self.warm_days.write(daily_shift)
+        self._write_daily_shift_to_file(snapshot)
+
+    def _move_to_warm_days(self, cold_days: list[model.DailyShift]) -> None:
+        for cold_day in cold_days:
+            self.warm_days.add(cold_day.id)
+            daily_shift = self._daily_shifts.get(cold_day.id)
+            # a day saved again while its segment was written stays hot until the next write
+            if daily_shift is not None and len(daily_shift.bills) == len(cold_day.bills):
+                del self._daily_shifts[cold_day.id]
+
+    def _write_daily_shift_to_file(self, snapshot: dict[int, Any] | None = None) -> None:
+        if snapshot is None:
+            snapshot = {**self._deferred_days, **self._daily_shifts}
+        data = serialization.dump_daily_shifts(snapshot)
+        tmp_path = self._path_file + ".tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(data)
+        os.replace(tmp_path, self._path_file)
+        self._written_checksum = serialization.checksum(data)
+
+    def read_stored_days(self) -> dict[int, model.DailyShift]:
+        """
+        Days currently stored in ``path_file``. While the file is still the one
+        this repo wrote (same checksum) the live objects are returned instead
+        of parsing and validating it again.
+        """
+        try:
+            with open(self._path_file, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return {}
+        if not self._deferred_days and serialization.checksum(data) == self._written_checksum:
+            return dict(self._daily_shifts)
+        return serialization.load_daily_shifts(data)
+
+    async def remove_daily_shifts(self, day_ids: Iterable[int], read_days: Mapping[int, model.DailyShift] | None = None) -> None:
+        """
+        Removes those days from memory and ``path_file``. Only the given days
+        are touched: bills saved while the caller was deciding stay stored.
+        ``read_days`` (what the caller read with ``read_stored_days``) adds the
+        days of a file written behind the repo's back that are not in memory.
+        """
+        day_ids = set(day_ids)
+        async with self._write_lock:
+            for day_id, daily_shift in (read_days or {}).items():
+                if day_id not in day_ids and day_id not in self._daily_shifts:
+                    self._daily_shifts[day_id] = daily_shift
+                    self._deferred_days.pop(day_id, None)
+            for day_id in day_ids:
+                self._daily_shifts.pop(day_id, None)
+                self._deferred_days.pop(day_id, None)
+            self._unindex_removed_days()
+            await asyncio.to_thread(self._write_daily_shift_to_file, self._snapshot())
+            self._written = self._staged
+
+    async def seal_day(self, id_: int) -> bool:
+        """
+        Seals a closed day and stores it again. Returns False when there was
+        nothing to seal.
+        """
+        async with self.day_lock(id_):
+            daily_shift = await self.get(id_)
+            if daily_shift is None or daily_shift.sealed:
+                return False
+            daily_shift.seal()
+        if id_ in self._daily_shifts:
+            await self._flush()
+        else:
+            await asyncio.to_thread(self.warm_days.write, daily_shift)
+            self.warm_days.add(daily_shift.id)
+        return True
+
+    def stored_day_ids(self) -> list[int]:
+        return sorted({*self._daily_shifts, *self._deferred_days, *self.warm_days})
+
+    def remove_warm_days(self, day_ids: Iterable[int]) -> None:
+        for day_id in day_ids:
+            self.warm_days.remove(day_id)
+            self.bill_index.remove_day(day_id)
 
     def clean_daily_shifts(self) -> None:
-        current_id_shift = time.get_posix_time_until_day()
+        current_id_shift = self._clock.current_day
         if not self._daily_shifts.get(current_id_shift):
             return
         self._daily_shifts = {current_id_shift: self._daily_shifts[current_id_shift]}
+        self._unindex_removed_days()
+
+    def _unindex_removed_days(self) -> None:
+        stored_day_ids = set(self.stored_day_ids())
+        for day_id in self.bill_index.day_ids():
+            if day_id not in stored_day_ids:
+                self.bill_index.remove_day(day_id)
+
+
+class StoredDays:
+    """
+    Read-only view of the files of an ``InMemoryRepo`` for tools that run
+    next to the register (the audit): unlike the repo it never moves cold
+    days, rewrites the file or creates segments.
+    """
+
+    def __init__(self, path_file: str = "daily_shifts.json", segments_dir: str = "daily_shifts_segments") -> None:
+        self._path_file = path_file
+        self._warm_days = SegmentStore(segments_dir)
+        self._hot_days: dict[int, model.DailyShift] | None = None
+
+    def _load_hot_days(self) -> dict[int, model.DailyShift]:
+        try:
+            with open(self._path_file, "rb") as file:
+                return serialization.load_daily_shifts(file.read())
+        except FileNotFoundError:
+            return {}
+
+    async def get(self, day_id: int) -> model.DailyShift | None:
+        if self._hot_days is None:
+            self._hot_days = await asyncio.to_thread(self._load_hot_days)
+        if day_id in self._hot_days:
+            return self._hot_days[day_id]
+        if day_id in self._warm_days:
+            return await asyncio.to_thread(self._warm_days.read, day_id)
+        return None
 
 
 class DynamoDb(ports.Repository):
-    def __init__(self, table_name: str, access_key: str, secret_key: str) -> None:
-        self._client = boto3.resource(
-            "dynamodb",
-            region_name="us-east-1",
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
-        )
-        self._table = self._client.Table(table_name)
+    """
+    Day layout: one item per DailyShift, keyed by ``id``. With ``compress`` the
+    bills go in a zlib compressed binary ``payload`` attribute (see ``codec``)
+    next to an uncompressed summary (total, bills_count, last_bill_id).
+    """
+
+    def __init__(self, table_name: str, access_key: str, secret_key: str, compress: bool = False, table: Any = None) -> None:
+        super().__init__()
+        self._table = table if table is not None else _get_table(table_name, access_key, secret_key)
+        self._compress = compress
 
+    @timed('dynamodb_seconds{op="get"}')
     async def get(self, id_: int) -> model.DailyShift | None:
-        response = self._table.get_item(Key={"id": id_})
+        response = await asyncio.to_thread(self._table.get_item, Key={"id": id_})
         if "Item" not in response:
             return None
-        return model.DailyShift.parse_obj(response["Item"])  # type: ignore
+        item = response["Item"]
+        if "payload" in item:
+            # boto3 returns binary attributes wrapped in a Binary object
+            return codec.decode_daily_shift(getattr(item["payload"], "value", item["payload"]))
+        return model.DailyShift.model_validate(item)
 
+    @timed('dynamodb_seconds{op="get_digest"}')
+    async def get_digest(self, id_: int) -> str | None:
+        response = await asyncio.to_thread(
+            self._table.get_item,
+            Key={"id": id_},
+            ProjectionExpression="#digest",
+            ExpressionAttributeNames={"#digest": "digest"},
+        )
+        return cast(str | None, response.get("Item", {}).get("digest"))
+
+    @timed('dynamodb_seconds{op="save"}')
     async def save(self, daily_shift: model.DailyShift) -> None:
+        if self._compress:
+            item = _to_dynamo_item(codec.summarize_daily_shift(daily_shift))
+            item["payload"] = codec.encode_daily_shift(daily_shift)
+        else:
+            item = _to_dynamo_item(serialization.dump_daily_shift(daily_shift))
+        await asyncio.to_thread(self._table.put_item, Item=item)
+
+
+class DynamoDbBills(ports.Repository):
+    """
+    Bill layout: partition key ``day``, sort key ``bill_id`` and one small
+    summary item per day (``bill_id == SUMMARY_SORT_KEY``). A save only writes
+    the bills DynamoDB does not have yet, in parallel batches, so the write
+    cost grows with the new bills and not with the size of the day.
+    """
+
+    def __init__(
+        self,
+        table_name: str,
+        access_key: str,
+        secret_key: str,
+        max_parallel_writes: int = 4,
+        table: Any = None,
+    ) -> None:
+        super().__init__()
+        self._table = table if table is not None else _get_table(table_name, access_key, secret_key)
+        self._max_parallel_writes = max_parallel_writes
+        # bill ids already stored in DynamoDB per day, filled lazily
+        self._synced_bill_ids: dict[int, set[str]] = {}
+
+    @timed('dynamodb_seconds{op="get_bills"}')
+    async def get(self, id_: int) -> model.DailyShift | None:
+        items = await asyncio.to_thread(self._query_day, id_)
+        summary = None
+        bills = []
+        for item in items:
+            if item["bill_id"] == SUMMARY_SORT_KEY:
+                summary = item
+            else:
+                bills.append(model.Bill.model_validate({**item, "id": item["bill_id"]}))
+        if summary is None and not bills:
+            return None
+        bills.sort(key=lambda bill: bill.created_at)
+        self._synced_bill_ids[id_] = {bill.id for bill in bills}
+        total = float(summary["total"]) if summary else sum(bill.total for bill in bills)
+        digest = summary.get("digest") if summary else None
+        return model.DailyShift(id=id_, bills=bills, total=total, sealed=digest is not None, digest=digest)
+
+    @timed('dynamodb_seconds{op="save_bills"}')
+    async def save(self, daily_shift: model.DailyShift) -> None:
+        synced_bill_ids = self._synced_bill_ids.get(daily_shift.id)
+        if synced_bill_ids is None:
+            synced_bill_ids = await asyncio.to_thread(self._query_bill_ids, daily_shift.id)
+            self._synced_bill_ids[daily_shift.id] = synced_bill_ids
+
+        new_bills = [bill for bill in daily_shift.bills if bill.id not in synced_bill_ids]
+        if not new_bills and not daily_shift.sealed:
+            return
+
+        semaphore = asyncio.Semaphore(self._max_parallel_writes)
+
+        async def write_chunk(chunk: list[model.Bill]) -> None:
+            async with semaphore:
+                await asyncio.to_thread(self._write_bills, daily_shift.id, chunk)
+            synced_bill_ids.update(bill.id for bill in chunk)
+
+        await asyncio.gather(
+            *(
+                write_chunk(new_bills[start : start + BATCH_WRITE_SIZE])
+                for start in range(0, len(new_bills), BATCH_WRITE_SIZE)
+            )
+        )
+        # the summary goes last so it never counts bills that are not stored
         await asyncio.to_thread(
             self._table.put_item,
-            Item=json.loads(json.dumps(daily_shift.model_dump()), parse_float=Decimal),
-        )  # this is a workaround to avoid serialization issues with Decimal
+            Item=_to_dynamo_item(
+                {
+                    "day": daily_shift.id,
+                    "bill_id": SUMMARY_SORT_KEY,
+                    "total": daily_shift.total,
+                    "bills_count": len(daily_shift.bills),
+                    "last_bill_id": daily_shift.bills[-1].id if daily_shift.bills else None,
+                    "digest": daily_shift.digest,
+                }
+            ),
+        )
+
+    @timed('dynamodb_seconds{op="get_digest"}')
+    async def get_digest(self, id_: int) -> str | None:
+        response = await asyncio.to_thread(
+            self._table.get_item,
+            Key={"day": id_, "bill_id": SUMMARY_SORT_KEY},
+            ProjectionExpression="#digest",
+            ExpressionAttributeNames={"#digest": "digest"},
+        )
+        return cast(str | None, response.get("Item", {}).get("digest"))
+
+    async def repair(self, daily_shift: model.DailyShift, bill_ids: set[str]) -> None:
+        # rewrite the given bills even if DynamoDB already has an item for them
+        self._synced_bill_ids.get(daily_shift.id, set()).difference_update(bill_ids)
+        await self.save(daily_shift)
+
+    def _write_bills(self, day_id: int, bills: list[model.Bill]) -> None:
+        with self._table.batch_writer() as batch:
+            for bill in bills:
+                item = _to_dynamo_item(bill.model_dump_json())
+                item["bill_id"] = item.pop("id")
+                item["day"] = day_id
+                batch.put_item(Item=item)
+
+    def _query_day(self, day_id: int, **kwargs: Any) -> list[dict]:
+        from boto3.dynamodb.conditions import Key
+
+        items: list[dict] = []
+        query_kwargs: dict[str, Any] = {"KeyConditionExpression": Key("day").eq(day_id), **kwargs}
+        while True:
+            response = self._table.query(**query_kwargs)
+            items.extend(response.get("Items", []))
+            if "LastEvaluatedKey" not in response:
+                return items
+            query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    def _query_bill_ids(self, day_id: int) -> set[str]:
+        items = self._query_day(
+            day_id,
+            ProjectionExpression="#bill_id",
+            ExpressionAttributeNames={"#bill_id": "bill_id"},
+        )
+        return {item["bill_id"] for item in items if item["bill_id"] != SUMMARY_SORT_KEY}
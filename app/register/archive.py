@@ -0,0 +1,188 @@
+"""
+Columnar archive of the days cleaned from the local store, so local history
+questions do not need DynamoDB. Append-only, one fixed-width little endian
+file per column with a row per bill, plus the rows of each day:
+
+    created_at.i8   bill created_at (ns)
+    totals.f8       bill totals
+    items.u4        items per bill
+    days.idx        day id, first row, bills (three int64 per day)
+
+A day is written column by column and only counts once its row is in
+``days.idx``; column bytes past the rows of the table (a write cut short)
+are truncated when the archive is opened. Readers map the files and get
+views (NumPy arrays; numpy is installed with streamlit, and a copy without
+it falls back to memoryviews), so scanning months of bills neither parses
+nor copies them.
+"""
+
+import array
+import mmap
+import os
+import sys
+from typing import Any, Literal, NamedTuple
+
+from app.register import model
+
+try:
+    import numpy as np
+except ImportError:
+    # comes with streamlit; without it the columns are memoryviews over the same maps
+    np = None
+
+# column -> (file name, array typecode, numpy dtype)
+COLUMNS: dict[str, tuple[str, Literal["q", "d", "I"], str]] = {
+    "created_at": ("created_at.i8", "q", "<i8"),
+    "totals": ("totals.f8", "d", "<f8"),
+    "items": ("items.u4", "I", "<u4"),
+}
+DAYS_FILE = "days.idx"
+_DAY_ROW = 3 * array.array("q").itemsize
+
+
+class Columns(NamedTuple):
+    created_at: Any
+    totals: Any
+    items: Any
+
+    def rows(self, start: int, stop: int) -> "Columns":
+        # slices of maps and memoryviews are views too
+        return Columns(*(column[start:stop] for column in self))
+
+
+def _sum(column: Any) -> float:
+    return float(column.sum() if np is not None else sum(column))
+
+
+class DayArchive:
+    def __init__(self, directory: str = "daily_shifts_archive") -> None:
+        self._directory = directory
+        # day id -> (first row, bills)
+        self._days: dict[int, tuple[int, int]] = {}
+        self._rows = 0
+        self._columns: Columns | None = None
+        self._load()
+
+    def _path(self, file_name: str) -> str:
+        return os.path.join(self._directory, file_name)
+
+    def _load(self) -> None:
+        try:
+            with open(self._path(DAYS_FILE), "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return
+        complete = len(data) - len(data) % _DAY_ROW
+        table = array.array("q", data[:complete])
+        if sys.byteorder != "little":
+            table.byteswap()
+        for i in range(0, len(table), 3):
+            self._days[table[i]] = (table[i + 1], table[i + 2])
+            self._rows = table[i + 1] + table[i + 2]
+        self._truncate_days()
+        self._truncate_columns()
+
+    def _truncate_days(self) -> None:
+        # a day row cut short would be read as a day, and the rows after it shifted
+        size = len(self._days) * _DAY_ROW
+        try:
+            if os.path.getsize(self._path(DAYS_FILE)) > size:
+                os.truncate(self._path(DAYS_FILE), size)
+        except FileNotFoundError:
+            pass
+
+    def _truncate_columns(self) -> None:
+        for file_name, typecode, _ in COLUMNS.values():
+            size = self._rows * array.array(typecode).itemsize
+            try:
+                if os.path.getsize(self._path(file_name)) > size:
+                    os.truncate(self._path(file_name), size)
+            except FileNotFoundError:
+                pass
+
+    def __contains__(self, day_id: object) -> bool:
+        return day_id in self._days
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+    def day_ids(self) -> list[int]:
+        return sorted(self._days)
+
+    def append(self, daily_shift: model.DailyShift) -> bool:
+        """
+        Archives a day, False when it was already archived
+        """
+        if daily_shift.id in self._days:
+            return False
+        os.makedirs(self._directory, exist_ok=True)
+        bills = daily_shift.bills
+        values: dict[str, list[Any]] = {
+            "created_at": [bill.created_at for bill in bills],
+            "totals": [bill.total for bill in bills],
+            "items": [len(bill.items) for bill in bills],
+        }
+        day_row = array.array("q", [daily_shift.id, self._rows, len(bills)])
+        try:
+            # no fsync: only days already in DynamoDB are archived
+            for name, (file_name, typecode, _) in COLUMNS.items():
+                self._write(file_name, array.array(typecode, values[name]))
+            self._write(DAYS_FILE, day_row)
+        except BaseException:
+            # the next day must start right after the last complete one
+            self._truncate_days()
+            self._truncate_columns()
+            raise
+        self._days[daily_shift.id] = (self._rows, len(bills))
+        self._rows += len(bills)
+        # maps are only as long as the files were, map them again on the next read
+        self._columns = None
+        return True
+
+    def _write(self, file_name: str, values: array.array) -> None:
+        if sys.byteorder != "little":
+            values.byteswap()
+        with open(self._path(file_name), "ab") as file:
+            values.tofile(file)
+
+    def _map(self, name: str) -> Any:
+        file_name, typecode, dtype = COLUMNS[name]
+        size = self._rows * array.array(typecode).itemsize
+        if np is not None:
+            if not size:
+                return np.empty(0, dtype=dtype)
+            return np.memmap(self._path(file_name), dtype=dtype, mode="r", shape=(self._rows,))
+        if not size:
+            return memoryview(array.array(typecode))
+        with open(self._path(file_name), "rb") as file:
+            # the map stays valid after the file is closed
+            mapped = mmap.mmap(file.fileno(), size, access=mmap.ACCESS_READ)
+        return memoryview(mapped).cast(typecode)
+
+    def columns(self) -> Columns:
+        """
+        Every archived bill, in the order the days were archived
+        """
+        if self._columns is None:
+            self._columns = Columns(*(self._map(name) for name in COLUMNS))
+        return self._columns
+
+    def day(self, day_id: int) -> Columns | None:
+        if day_id not in self._days:
+            return None
+        start, bills = self._days[day_id]
+        return self.columns().rows(start, start + bills)
+
+    def daily_totals(self, start_day: int | None = None, end_day: int | None = None) -> dict[int, dict]:
+        """
+        Bills, total and items of every archived day between start_day and end_day (inclusive)
+        """
+        columns = self.columns()
+        result = {}
+        for day_id in self.day_ids():
+            if (start_day is not None and day_id < start_day) or (end_day is not None and day_id > end_day):
+                continue
+            start, bills = self._days[day_id]
+            day = columns.rows(start, start + bills)
+            result[day_id] = {"bills": bills, "total": float(_sum(day.totals)), "items": int(_sum(day.items))}
+        return result
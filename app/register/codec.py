@@ -0,0 +1,83 @@
+"""
+Compact encoding for stored DailyShifts.
+
+Bills are stored column by column (ids, created_at, totals, item counts and the
+flattened item columns) instead of one JSON object per bill, ``created_at`` is
+delta encoded and the result is compressed with zlib.
+"""
+
+import json
+import zlib
+
+from app.register import model
+
+FORMAT_VERSION = 1
+
+
+def encode_daily_shift(daily_shift: model.DailyShift, level: int = 6) -> bytes:
+    created_at_deltas = []
+    previous = 0
+    item_ids, prices, quantities = [], [], []
+    for bill in daily_shift.bills:
+        created_at_deltas.append(bill.created_at - previous)
+        previous = bill.created_at
+        for item in bill.items:
+            item_ids.append(str(item.id))
+            prices.append(item.price)
+            quantities.append(item.quantity)
+
+    columns = {
+        "v": FORMAT_VERSION,
+        "id": daily_shift.id,
+        "total": daily_shift.total,
+        "sealed": daily_shift.sealed,
+        "digest": daily_shift.digest,
+        "bill_ids": [bill.id for bill in daily_shift.bills],
+        "created_at": created_at_deltas,
+        "totals": [bill.total for bill in daily_shift.bills],
+        "items_count": [len(bill.items) for bill in daily_shift.bills],
+        "item_ids": item_ids,
+        "prices": prices,
+        "quantities": quantities,
+    }
+    return zlib.compress(json.dumps(columns, separators=(",", ":")).encode(), level)
+
+
+def decode_daily_shift(payload: bytes) -> model.DailyShift:
+    columns = json.loads(zlib.decompress(payload))
+    if columns["v"] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported daily shift encoding version {columns['v']}")
+
+    bills = []
+    created_at = 0
+    item_position = 0
+    item_ids, prices, quantities = columns["item_ids"], columns["prices"], columns["quantities"]
+    for bill_id, delta, total, items_count in zip(columns["bill_ids"], columns["created_at"], columns["totals"], columns["items_count"]):
+        created_at += delta
+        end = item_position + items_count
+        items = [{"id": item_ids[i], "price": prices[i], "quantity": quantities[i]} for i in range(item_position, end)]
+        item_position = end
+        bills.append({"id": bill_id, "created_at": created_at, "items": items, "total": total})
+
+    return model.DailyShift.model_validate(
+        {
+            "id": columns["id"],
+            "bills": bills,
+            "total": columns["total"],
+            "sealed": columns.get("sealed", False),
+            "digest": columns.get("digest"),
+        }
+    )
+
+
+def summarize_daily_shift(daily_shift: model.DailyShift) -> dict:
+    """
+    Small uncompressed attributes stored next to the payload for the reporter.
+    """
+    return {
+        "id": daily_shift.id,
+        "total": daily_shift.total,
+        "bills_count": len(daily_shift.bills),
+        "last_bill_id": daily_shift.bills[-1].id if daily_shift.bills else None,
+        "digest": daily_shift.digest,
+    }
@@ -1,3 +1,5 @@
+import functools
+
 import pydantic_settings
 
 
@@ -10,6 +12,39 @@ class Configs(pydantic_settings.BaseSettings):
     aws_secret_access_key: str
     time_to_sync: int
     time_to_clean: int
+    # dynamodb layout: "day" (one item per day) or "bill" (one item per bill)
+    dynamo_layout: str = "day"
+    dynamo_table_name: str = "daily_shifts"
+    # store day items as a compressed columnar payload (day layout only)
+    dynamo_compress: bool = False
+    # local storage: days kept as objects besides the current one, older ones go to compressed segments
+    hot_days: int = 2
+    warm_cache_size: int = 4
+    # printer: "win32", "win32raw" (ESC/POS to a Windows queue, path = printer name), "file" (file or named pipe)
+    # or "device" (raw device node like /dev/usb/lp0)
+    printer_backend: str = "win32"
+    printer_path: str | None = None
+    print_max_attempts: int = 3
+    # latency metrics, dumped in Prometheus text format every metrics_dump_interval seconds
+    metrics_enabled: bool = False
+    metrics_file: str = "metrics.prom"
+    metrics_dump_interval: int = 60
+    # profile the first profile_seconds after startup (0 = off), reports go to profiles_dir
+    profile_seconds: int = 0
+    profiles_dir: str = "profiles"
+    # append every command typed to this file, to replay the session later
+    record_session_file: str | None = None
+    # local API for other clients (scanners, touch screens): a Unix socket path, or a 127.0.0.1 port
+    api_socket: str | None = None
+    api_port: int | None = None
+    # bill events (items, saves, credit notes) are appended to one file per day here, the dashboard follows them
+    journal_dir: str = "journal"
+    journal_keep_days: int = 7
+    # days removed by the cleanup are appended to a columnar archive here for local history
+    archive_dir: str = "daily_shifts_archive"
 
 
-configs = Configs()
+@functools.cache
+def get_configs() -> Configs:
+    # built on first use so importing the app does not read .env
+    return Configs()  # type: ignore
@@ -1,7 +1,9 @@
+from app.register.entrypoints.api import RegisterServer
 from app.register.entrypoints.cron import set_up_sync_process, Sync
 from app.register.entrypoints.view.view import start_view
 
 __all__ = [
+    "RegisterServer",
     "Sync",
     "start_view",
     "set_up_sync_process",
@@ -0,0 +1,271 @@
+"""
+Local API of the register: newline delimited JSON over a Unix socket (or
+127.0.0.1 TCP where there are no Unix sockets), so scanners, touch screens
+or another terminal can drive the lanes of this process.
+
+Each line is a request, each response line carries the same ``id``:
+
+    {"id": 1, "lane": "2", "op": "add_item", "price": 12000}
+    {"id": 1, "ok": true, "result": {"items": 1, "total": 12000.0}}
+
+Requests can be pipelined (sent without waiting for the responses). The
+requests of a lane run in the order they arrive, different lanes run
+concurrently, so responses may come back out of order. Requests without a
+``lane`` go to the "api" lane, never to the bill typed at the console.
+"""
+
+import asyncio
+import inspect
+import itertools
+import json
+import os
+from typing import Any, Callable
+
+from app.commons.logger import logger
+from app.commons.metrics import metrics
+from app.register import model, usecases
+
+READ_SIZE = 64 * 1024
+# longer lines are not requests, the connection is closed
+MAX_LINE = 64 * 1024
+# requests without a lane; not "1", the lane of the console (see main)
+DEFAULT_LANE = "api"
+
+
+class ApiError(Exception):
+    pass
+
+
+def _bill_summary(bill: model.Bill | None) -> dict:
+    if bill is None:
+        return {"items": 0, "total": 0}
+    return {"items": len(bill.items), "total": bill.total}
+
+
+def _add_item(register: usecases.Register, request: dict) -> dict:
+    register.add_item(price=float(request["price"]), quantity=float(request.get("quantity", 1)))
+    return _bill_summary(register.get_current_bill())
+
+
+def _remove_last_item(register: usecases.Register, request: dict) -> dict:
+    register.remove_last_item()
+    return _bill_summary(register.get_current_bill())
+
+
+def _current_bill(register: usecases.Register, request: dict) -> dict | None:
+    bill = register.get_current_bill()
+    return bill.model_dump(mode="json") if bill else None
+
+
+async def _save_bill(register: usecases.Register, request: dict) -> dict | None:
+    bill = await register.save_bill()
+    return {"id": bill.id, "total": bill.total} if bill else None
+
+
+async def _credit_note(register: usecases.Register, request: dict) -> dict:
+    bill = await register.issue_credit_note(float(request["value"]))
+    return {"id": bill.id, "total": bill.total}
+
+
+async def _daily_shift(register: usecases.Register, request: dict) -> dict:
+    daily_shift = await register.get_daily_shift()
+    return {"id": daily_shift.id, "bills": len(daily_shift.bills), "total": daily_shift.total}
+
+
+OPERATIONS: dict[str, Callable[[usecases.Register, dict], Any]] = {
+    "ping": lambda register, request: "pong",
+    "add_item": _add_item,
+    "remove_last_item": _remove_last_item,
+    "current_bill": _current_bill,
+    "save_bill": _save_bill,
+    "credit_note": _credit_note,
+    "daily_shift": _daily_shift,
+}
+
+
+class _Connection:
+    """
+    Responses of a connection, written together once per loop iteration
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        self.writer = writer
+        self.pending: set[asyncio.Task] = set()
+        self._responses: list[bytes] = []
+
+    def send(self, response: dict) -> None:
+        if not self._responses:
+            asyncio.get_running_loop().call_soon(self._flush)
+        self._responses.append(json.dumps(response).encode() + b"\n")
+
+    def _flush(self) -> None:
+        responses, self._responses = self._responses, []
+        if not self.writer.is_closing():
+            self.writer.write(b"".join(responses))
+
+
+class RegisterServer:
+    def __init__(self, lanes: usecases.Lanes) -> None:
+        self.lanes = lanes
+        # last request of each lane, the next one waits for it
+        self._lane_tails: dict[str, asyncio.Task] = {}
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self, path: str | None = None, port: int | None = None) -> None:
+        if path and hasattr(asyncio, "start_unix_server"):
+            if os.path.exists(path):
+                # left behind by a previous run
+                os.remove(path)
+            self._server = await asyncio.start_unix_server(self._handle_connection, path=path, limit=MAX_LINE)
+        elif port is not None:
+            # localhost only: the API has no authentication
+            self._server = await asyncio.start_server(self._handle_connection, "127.0.0.1", port, limit=MAX_LINE)
+        else:
+            raise ValueError("A socket path (Unix) or a port is required")
+        logger.info(f"Register API listening on {path if path else port}")
+
+    async def serve(self, path: str | None = None, port: int | None = None) -> None:
+        await self.start(path=path, port=port)
+        assert self._server is not None
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection = _Connection(writer)
+        buffer = b""
+        try:
+            # whole chunks are read and every complete line in them is dispatched,
+            # pipelined clients cost one read per chunk instead of one per request
+            while chunk := await reader.read(READ_SIZE):
+                *lines, buffer = (buffer + chunk).split(b"\n")
+                for line in lines:
+                    if line.strip():
+                        self._dispatch(line, connection)
+                if len(buffer) > MAX_LINE:
+                    connection.send({"id": None, "ok": False, "error": "Request too long"})
+                    break
+                await writer.drain()
+            if connection.pending:
+                await asyncio.wait(connection.pending)
+            # let the last responses be flushed
+            await asyncio.sleep(0)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def _dispatch(self, line: bytes, connection: _Connection) -> None:
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            operation = OPERATIONS[request["op"]]
+            lane = str(request.get("lane", DEFAULT_LANE))
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            connection.send({"id": request_id, "ok": False, "error": f"Invalid request: {e!r}"})
+            return
+        metrics.inc(f'api_requests_total{{op="{request["op"]}"}}')
+        previous = self._lane_tails.get(lane)
+        if previous is None or previous.done():
+            # nothing queued in the lane: synchronous operations answer right away
+            try:
+                result = operation(self.lanes.get(lane), request)
+            except Exception as e:
+                self._fail(connection, request, e)
+                return
+            if not inspect.isawaitable(result):
+                connection.send({"id": request_id, "ok": True, "result": result})
+                return
+            task = asyncio.ensure_future(self._finish(result, connection, request))
+        else:
+            task = asyncio.ensure_future(self._run_after(previous, operation, lane, connection, request))
+        self._lane_tails[lane] = task
+        connection.pending.add(task)
+        task.add_done_callback(connection.pending.discard)
+
+    async def _run_after(
+        self,
+        previous: asyncio.Task,
+        operation: Callable[[usecases.Register, dict], Any],
+        lane: str,
+        connection: _Connection,
+        request: dict,
+    ) -> None:
+        # the outcome of the previous request was already sent to its client
+        await asyncio.wait([previous])
+        try:
+            result = operation(self.lanes.get(lane), request)
+        except Exception as e:
+            self._fail(connection, request, e)
+            return
+        await self._finish(result, connection, request)
+
+    async def _finish(self, result: Any, connection: _Connection, request: dict) -> None:
+        try:
+            if inspect.isawaitable(result):
+                result = await result
+        except Exception as e:
+            self._fail(connection, request, e)
+            return
+        connection.send({"id": request.get("id"), "ok": True, "result": result})
+
+    @staticmethod
+    def _fail(connection: _Connection, request: dict, error: Exception) -> None:
+        logger.warning(f"API request {request.get('op')} failed: {error}")
+        connection.send({"id": request.get("id"), "ok": False, "error": str(error)})
+
+
+class RegisterClient:
+    """
+    Pipelined client of RegisterServer: ``call`` sends the request right away
+    and many calls can be awaited at the same time over one connection.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader = reader
+        self._writer = writer
+        self._ids = itertools.count(1)
+        self._waiting: dict[int, asyncio.Future] = {}
+        self._receiver = asyncio.ensure_future(self._receive())
+
+    @classmethod
+    async def connect(cls, path: str | None = None, port: int | None = None) -> "RegisterClient":
+        if path and hasattr(asyncio, "open_unix_connection"):
+            reader, writer = await asyncio.open_unix_connection(path, limit=MAX_LINE)
+        else:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port, limit=MAX_LINE)
+        return cls(reader, writer)
+
+    async def _receive(self) -> None:
+        try:
+            while line := await self._reader.readline():
+                response = json.loads(line)
+                future = self._waiting.pop(response["id"], None)
+                if future is None or future.done():
+                    continue
+                if response["ok"]:
+                    future.set_result(response["result"])
+                else:
+                    future.set_exception(ApiError(response["error"]))
+        finally:
+            for future in self._waiting.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Register API connection closed"))
+            self._waiting.clear()
+
+    async def call(self, op: str, lane: str = DEFAULT_LANE, **params: Any) -> Any:
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[request_id] = future
+        self._writer.write(json.dumps({"id": request_id, "op": op, "lane": lane, **params}).encode() + b"\n")
+        return await future
+
+    async def close(self) -> None:
+        self._writer.close()
+        await self._writer.wait_closed()
+        await self._receiver
@@ -0,0 +1,119 @@
+"""
+Bill level reconciliation between the local store and DynamoDB.
+
+    python -m app.register.entrypoints.audit --start 01-07-2025 --end 31-07-2025 [--repair]
+"""
+
+import argparse
+import asyncio
+import json
+
+import pydantic
+
+from app.commons import time
+from app.commons.logger import logger
+from app.register import adapters, model, ports
+
+
+class DayAudit(pydantic.BaseModel):
+    day_id: int
+    # local bills DynamoDB does not have
+    missing: list[str] = []
+    # DynamoDB bills the local store does not have
+    extra: list[str] = []
+    # same id, different content
+    mismatched: list[str] = []
+    # the day is no longer stored locally (already cleaned), nothing to compare
+    local_missing: bool = False
+
+    def is_consistent(self) -> bool:
+        return not (self.missing or self.extra or self.mismatched)
+
+
+class AuditReport(pydantic.BaseModel):
+    days: list[DayAudit]
+    repaired: list[int] = []
+
+    def inconsistent_days(self) -> list[DayAudit]:
+        return [day for day in self.days if not day.local_missing and not day.is_consistent()]
+
+
+def diff_bills(day_id: int, local_bills: list[model.Bill], remote_bills: list[model.Bill]) -> DayAudit:
+    """
+    Sorted merge of both bill lists by id.
+    """
+    audit = DayAudit(day_id=day_id)
+    local_sorted = sorted(local_bills, key=lambda bill: bill.id)
+    remote_sorted = sorted(remote_bills, key=lambda bill: bill.id)
+    i = j = 0
+    while i < len(local_sorted) and j < len(remote_sorted):
+        local_bill, remote_bill = local_sorted[i], remote_sorted[j]
+        if local_bill.id == remote_bill.id:
+            if local_bill != remote_bill:
+                audit.mismatched.append(local_bill.id)
+            i += 1
+            j += 1
+        elif local_bill.id < remote_bill.id:
+            audit.missing.append(local_bill.id)
+            i += 1
+        else:
+            audit.extra.append(remote_bill.id)
+            j += 1
+    audit.missing.extend(bill.id for bill in local_sorted[i:])
+    audit.extra.extend(bill.id for bill in remote_sorted[j:])
+    return audit
+
+
+class Auditor:
+    def __init__(self, db: ports.Repository, stored_days: adapters.StoredDays, batch_size: int = 16) -> None:
+        self.db = db
+        self.stored_days = stored_days
+        self._batch_size = batch_size
+
+    async def audit(self, start_day: int, end_day: int, repair: bool = False) -> AuditReport:
+        """
+        Compares every day in [start_day, end_day]. With repair, days with
+        missing or mismatched bills are pushed again from the local copy;
+        extra remote bills are only reported.
+        """
+        day_ids = list(range(start_day, end_day + 1, time.DAY_SECONDS))
+        report = AuditReport(days=[])
+        for start in range(0, len(day_ids), self._batch_size):
+            batch = day_ids[start : start + self._batch_size]
+            remote_days = await asyncio.gather(*(self.db.get(day_id) for day_id in batch))
+            for day_id, remote_day in zip(batch, remote_days):
+                local_day = await self.stored_days.get(day_id)
+                if local_day is None:
+                    report.days.append(DayAudit(day_id=day_id, local_missing=True))
+                    continue
+                day_audit = diff_bills(day_id, local_day.bills, remote_day.bills if remote_day else [])
+                report.days.append(day_audit)
+                if repair and (day_audit.missing or day_audit.mismatched):
+                    await self.db.repair(local_day, set(day_audit.missing) | set(day_audit.mismatched))
+                    report.repaired.append(day_id)
+                    logger.info(f"Day {day_id} repaired (missing={len(day_audit.missing)}, mismatched={len(day_audit.mismatched)})")
+        return report
+
+
+async def main() -> None:
+    from app.register.configurations import get_configs
+    from app.register.main import build_dynamo_db
+
+    parser = argparse.ArgumentParser(description="Compara las facturas locales con DynamoDB")
+    parser.add_argument("--start", required=True, help="fecha inicial dd-mm-aaaa")
+    parser.add_argument("--end", required=True, help="fecha final dd-mm-aaaa")
+    parser.add_argument("--repair", action="store_true", help="vuelve a subir las facturas faltantes o distintas")
+    parser.add_argument("--batch-size", type=int, default=16)
+    args = parser.parse_args()
+
+    configs = get_configs()
+    # read only: the register may be running on the same files
+    auditor = Auditor(db=build_dynamo_db(configs), stored_days=adapters.StoredDays(), batch_size=args.batch_size)
+    report = await auditor.audit(time.get_day_from_date(args.start), time.get_day_from_date(args.end), repair=args.repair)
+    print(
+        json.dumps({"inconsistent_days": [day.model_dump() for day in report.inconsistent_days()], "repaired": report.repaired}, indent=2)
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
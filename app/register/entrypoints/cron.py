@@ -1,4 +1,6 @@
+import asyncio
 import json
+from collections.abc import Mapping
 from os import path
 from typing import Callable
 
@@ -7,35 +9,69 @@ import aiofiles  # type: ignore
 
 from app.commons import time
 from app.commons.logger import logger
-from app.register import model, ports, adapters
+from app.commons.metrics import metrics, timed
+from app.register import codec, model, ports, adapters
+from app.register.archive import DayArchive
 
 
 class Sync:
     def __init__(
-        self, db: ports.Repository, in_memory_repo: adapters.InMemoryRepo
+        self,
+        db: ports.Repository | None,
+        in_memory_repo: adapters.InMemoryRepo,
+        archive: DayArchive | None = None,
+        clock: time.Clock | None = None,
     ) -> None:
+        self._clock = clock or time.clock
+        # db puede llegar después del arranque (se construye en segundo plano)
         self.db = db
         self.in_memory_repo = in_memory_repo
+        # los días limpiados pasan al archivo columnar para consultas locales
+        self.archive = archive
+        # días sellados cuyo digest ya coincide con DynamoDB
+        self._confirmed_days: set[int] = set()
+        # días cuya verificación falló en el último ciclo (p. ej. DynamoDB caído)
+        self._unchecked_days: set[int] = set()
+        self._tasks: set[asyncio.Task] = set()
+
+    def on_day_closed(self, previous_day: int, current_day: int) -> None:
+        """
+        Listener del reloj: al pasar la medianoche sella el día anterior
+        """
+        task = asyncio.get_running_loop().create_task(self.seal_closed_days())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
 
+    async def seal_closed_days(self) -> None:
+        """
+        Sella todos los días guardados excepto el actual
+        """
+        current_day = self._clock.current_day
+        for day_id in self.in_memory_repo.stored_day_ids():
+            if day_id != current_day and await self.in_memory_repo.seal_day(day_id):
+                logger.info(f"Day {day_id} sealed")
+
+    @timed("sync_bills_seconds")
     async def sync_bills(self) -> None:
         """
         Sincroniza todos los días que no están sincronizados con DynamoDB
         """
-        # load daily shifts from file
-        async with aiofiles.open("daily_shifts.json", "r") as file:
-            data_loaded = json.loads(await file.read())
-            daily_shifts = {
-                int(k): model.DailyShift.parse_obj(v) for k, v in data_loaded.items()
-            }
+        if self.db is None:
+            logger.debug("DynamoDB not ready yet, skipping sync")
+            return
+
+        # load daily shifts from file, older days are checked by their summaries and only decoded to be sent
+        hot_shifts = await asyncio.to_thread(self.in_memory_repo.read_stored_days)
+        summaries = await self._summarize_days(hot_shifts)
 
-        if not daily_shifts:
+        if not summaries:
             return
 
         # Obtener días que NO están sincronizados
-        unsynced_days = await self._get_unsynced_days(daily_shifts)
+        unsynced_days = await self._get_unsynced_days(summaries)
 
         if not unsynced_days:
-            logger.info("All days are already synced")
+            logger.debug("All days are already synced")
             return
 
         logger.info(f"Found {len(unsynced_days)} unsynced days")
@@ -44,18 +80,24 @@ class Sync:
         synced_count = 0
         last_synced_bill_id = None
 
-        # Ordenar días para sincronizar en orden cronológico
-        sorted_unsynced_days = sorted(unsynced_days)
+        # Ordenar días para sincronizar en orden cronológico; los que no se
+        # pudieron verificar esperan al próximo ciclo en vez de decodificarse
+        # y enviarse a un DynamoDB que no responde
+        sorted_unsynced_days = sorted(unsynced_days - self._unchecked_days)
 
         for day_id in sorted_unsynced_days:
-            daily_shift = daily_shifts.get(day_id)
-            if not daily_shift or not daily_shift.bills:
+            daily_shift = hot_shifts.get(day_id)
+            if daily_shift is None:
+                # segmento decodificado en un hilo, no en el loop
+                daily_shift = await asyncio.to_thread(self.in_memory_repo.warm_days.read, day_id)
+            if not daily_shift.bills:
                 continue
 
             try:
                 # Intentar sincronización del día
                 await self.db.save(daily_shift=daily_shift)
                 synced_count += 1
+                metrics.inc("sync_days_synced_total")
 
                 # Actualizar el último bill_id sincronizado con el último bill de este día
                 last_bill_of_day = daily_shift.bills[-1]
@@ -65,6 +107,7 @@ class Sync:
 
             except Exception as e:
                 logger.error(f"Failed to sync day {day_id} (day_id={day_id}, error={str(e)})")
+                metrics.inc("sync_days_failed_total")
                 # Si falla la sincronización de un día, continuar con los siguientes
                 continue
 
@@ -99,70 +142,99 @@ class Sync:
         """
         Cleanup conservador: mantiene día actual + días NO sincronizados
         """
-        current_day = time.get_posix_time_until_day()
+        if self.db is None:
+            logger.debug("DynamoDB not ready yet, skipping cleanup")
+            return
+
+        current_day = self._clock.current_day
 
         # Cargar datos actuales
-        async with aiofiles.open("daily_shifts.json", "r") as file:
-            data_loaded = json.loads(await file.read())
-            daily_shifts = {
-                int(k): model.DailyShift.parse_obj(v) for k, v in data_loaded.items()
-            }
+        hot_shifts = await asyncio.to_thread(self.in_memory_repo.read_stored_days)
+        warm_shifts = self.in_memory_repo.warm_days
+        summaries = await self._summarize_days(hot_shifts)
 
-        if not daily_shifts:
+        if not summaries:
             return
 
         # Obtener días que NO están sincronizados
-        unsynced_days = await self._get_unsynced_days(daily_shifts)
+        unsynced_days = await self._get_unsynced_days(summaries)
 
         # ✅ CORRECTO - Mantener día actual + días NO sincronizados
         days_to_keep = {current_day} | unsynced_days
 
         # Aplicar filtro conservador
         cleaned_shifts = {
-            k: v for k, v in daily_shifts.items() 
+            k: v for k, v in hot_shifts.items()
             if k in days_to_keep
         }
+        warm_days_to_remove = [k for k in warm_shifts if k not in days_to_keep]
 
         # Solo escribir si hay cambios
-        if len(cleaned_shifts) != len(daily_shifts):
-            await self._write_cleaned_shifts(cleaned_shifts)
-            days_removed = len(daily_shifts) - len(cleaned_shifts)
-            logger.info(f"Conservative cleanup completed (days_kept={len(cleaned_shifts)}, days_removed={days_removed})")
+        if len(cleaned_shifts) != len(hot_shifts) or warm_days_to_remove:
+            days_kept = len(cleaned_shifts) + len(warm_shifts) - len(warm_days_to_remove)
+            days_removed = len(hot_shifts) - len(cleaned_shifts) + len(warm_days_to_remove)
+            if self.archive is not None:
+                # archivados antes de borrarlos, un día nunca falta en ambos lados
+                removed_day_ids = [k for k in sorted(summaries) if k not in days_to_keep]
+                await asyncio.to_thread(self._archive_days, hot_shifts, removed_day_ids)
+            await self._write_cleaned_shifts([k for k in hot_shifts if k not in days_to_keep], hot_shifts)
+            self.in_memory_repo.remove_warm_days(warm_days_to_remove)
+            logger.info(f"Conservative cleanup completed (days_kept={days_kept}, days_removed={days_removed})")
         else:
-            logger.info("No cleanup required")
+            logger.debug("No cleanup required")
+
+    async def _summarize_days(self, hot_shifts: dict[int, model.DailyShift]) -> dict[int, dict]:
+        """
+        Resumen (codec.summarize_daily_shift) de cada día guardado: los días
+        tibios se leen de sus archivos de resumen en un hilo, sin decodificar
+        los segmentos
+        """
+        warm_days = self.in_memory_repo.warm_days
+        warm_day_ids = [k for k in warm_days if k not in hot_shifts]
+        summaries = await asyncio.to_thread(lambda: {k: warm_days.summary(k) for k in warm_day_ids})
+        summaries.update((k, codec.summarize_daily_shift(v)) for k, v in hot_shifts.items())
+        return summaries
 
-    async def _get_unsynced_days(self, daily_shifts: dict) -> set[int]:
+    async def _get_unsynced_days(self, summaries: Mapping[int, dict]) -> set[int]:
         """
         Identifica qué días NO están sincronizados con DynamoDB
         """
         unsynced_days = set()
+        current_day = self._clock.current_day
+        self._unchecked_days = set()
 
         # Cargar último bill_id sincronizado
         last_synced_bill_id = await self._load_bill_id()
 
-        for day_id, daily_shift in daily_shifts.items():
-            if not daily_shift.bills:
+        for day_id in summaries:
+            if day_id in self._confirmed_days:
+                # día sellado y ya confirmado en DynamoDB, no cambia más
+                continue
+            summary = summaries[day_id]
+            if not summary["bills_count"]:
                 continue
 
-            # Si el último bill del día no coincide con el último sincronizado,
-            # significa que este día tiene datos no sincronizados
-            last_bill_of_day = daily_shift.bills[-1]
-
-            if day_id == time.get_posix_time_until_day():
-                # Para el día actual, verificar si hay bills nuevos
-                if last_bill_of_day.id != last_synced_bill_id:
+            if day_id == current_day:
+                # Si el último bill del día no coincide con el último sincronizado,
+                # significa que este día tiene datos no sincronizados
+                if summary["last_bill_id"] != last_synced_bill_id:
                     unsynced_days.add(day_id)
             else:
                 # Para días anteriores, verificar si fueron sincronizados
-                if not await self._is_day_synced(day_id, daily_shift):
+                if not await self._is_day_synced(day_id, summary):
                     unsynced_days.add(day_id)
 
         return unsynced_days
 
-    async def _is_day_synced(self, day_id: int, daily_shift: model.DailyShift) -> bool:
+    async def _is_day_synced(self, day_id: int, summary: dict) -> bool:
         """
         Verifica si un día específico está sincronizado con DynamoDB
         """
+        if self.db is None:
+            return False
+        if summary["digest"] is not None:
+            # solo los días sellados tienen digest
+            return await self._is_sealed_day_synced(day_id, summary["digest"])
         try:
             # Intentar obtener el día desde DynamoDB
             dynamo_shift = await self.db.get(day_id)
@@ -171,14 +243,14 @@ class Sync:
                 return False
 
             # Comparar número de bills y último bill ID
-            local_bills_count = len(daily_shift.bills)
+            local_bills_count = summary["bills_count"]
             dynamo_bills_count = len(dynamo_shift.bills)
 
             if local_bills_count != dynamo_bills_count:
                 return False
 
-            if daily_shift.bills and dynamo_shift.bills:
-                local_last_bill = daily_shift.bills[-1].id
+            if local_bills_count and dynamo_shift.bills:
+                local_last_bill: str = summary["last_bill_id"]
                 dynamo_last_bill = dynamo_shift.bills[-1].id
                 return local_last_bill == dynamo_last_bill
 
@@ -186,22 +258,42 @@ class Sync:
 
         except Exception as e:
             logger.error(f"Error verifying sync status for day {day_id}: {str(e)}")
+            self._unchecked_days.add(day_id)
             # En caso de error, asumir que NO está sincronizado (conservador)
             return False
 
-    async def _write_cleaned_shifts(self, cleaned_shifts: dict) -> None:
+    async def _is_sealed_day_synced(self, day_id: int, digest: str) -> bool:
+        """
+        Un día sellado está sincronizado si DynamoDB tiene su mismo digest
+        """
+        if self.db is None:
+            return False
+        try:
+            dynamo_digest = await self.db.get_digest(day_id)
+        except Exception as e:
+            logger.error(f"Error verifying digest for day {day_id}: {str(e)}")
+            self._unchecked_days.add(day_id)
+            return False
+        if dynamo_digest != digest:
+            return False
+        self._confirmed_days.add(day_id)
+        return True
+
+    def _archive_days(self, hot_shifts: dict[int, model.DailyShift], day_ids: list[int]) -> None:
+        # corre en un hilo: los días tibios se decodifican aquí, sin tocar el cache del loop
+        for day_id in day_ids:
+            daily_shift = hot_shifts.get(day_id)
+            if daily_shift is None:
+                daily_shift = self.in_memory_repo.warm_days.read(day_id)
+            if self.archive.append(daily_shift):  # type: ignore
+                logger.info(f"Day {daily_shift.id} archived (bills={len(daily_shift.bills)})")
+
+    async def _write_cleaned_shifts(self, removed_day_ids: list[int], hot_shifts: dict[int, model.DailyShift]) -> None:
         """
         Escribe los datos limpios de forma segura
         """
-        # Escribir al archivo
-        async with aiofiles.open("daily_shifts.json", "w") as file:
-            serialized_shifts = {
-                k: v.model_dump() for k, v in cleaned_shifts.items()
-            }
-            await file.write(json.dumps(serialized_shifts, indent=2))
-
-        # Actualizar memoria
-        self.in_memory_repo._daily_shifts = cleaned_shifts
+        # solo se borran los días limpiados: los bills guardados mientras se consultaba DynamoDB se conservan
+        await self.in_memory_repo.remove_daily_shifts(removed_day_ids, hot_shifts)
 
 
 async def set_up_sync_process(
@@ -0,0 +1,71 @@
+"""
+Live sales of the day for the manager, fed by the bill journal of the
+register running on this machine.
+
+    streamlit run app/register/entrypoints/dashboard.py [-- --journal-dir journal --refresh 5]
+"""
+
+import argparse
+import datetime
+
+import streamlit as st
+
+from app.commons import time as tm
+from app.register.journal import SalesTail
+
+
+def _args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--journal-dir", default="journal")
+    parser.add_argument("--refresh", type=int, default=5, help="segundos entre actualizaciones")
+    return parser.parse_args()
+
+
+@st.cache_resource
+def get_tail(journal_dir: str) -> SalesTail:
+    # one tail for every open browser tab, each refresh only reads the new lines
+    return SalesTail(journal_dir)
+
+
+def _money(value: float) -> str:
+    return f"${value:,.0f}"
+
+
+def _hour(created_at: int) -> str:
+    return datetime.datetime.fromtimestamp(created_at / 1_000_000_000, tm.COLOMBIA_TZ).strftime("%H:%M:%S")
+
+
+args = _args()
+st.set_page_config(page_title="Ventas del día", layout="wide")
+st.title("Ventas del día")
+
+
+@st.fragment(run_every=args.refresh)
+def show_sales() -> None:
+    tail = get_tail(args.journal_dir)
+    tail.poll()
+    sales = tail.snapshot()
+    total, bills, average, credit_notes = st.columns(4)
+    total.metric("Total", _money(sales["total"]))
+    bills.metric("Facturas", sales["bills"])
+    average.metric("Ticket promedio", _money(sales["average_ticket"]))
+    credit_notes.metric("Notas crédito", _money(-sales["credit_notes_total"]))
+    st.caption(f"{sales['credit_notes']} notas crédito, {sales['items_removed']} ítems borrados antes de facturar")
+
+    by_hour = sales["by_hour"]
+    st.subheader("Por hora")
+    st.bar_chart(
+        {
+            "hora": [f"{hour:02}:00" for hour in by_hour],
+            "facturas": [bills for bills, _ in by_hour.values()],
+        },
+        x="hora",
+        y="facturas",
+    )
+    st.subheader("Últimas facturas")
+    st.table(
+        [{"hora": _hour(bill.created_at), "items": len(bill.items), "total": _money(bill.total)} for bill in reversed(sales["last_bills"])]
+    )
+
+
+show_sales()
@@ -0,0 +1,37 @@
+"""
+Sales per day from the local archive of cleaned days, without DynamoDB.
+
+    python -m app.register.entrypoints.history --start 01-07-2025 --end 31-07-2025
+"""
+
+import argparse
+import json
+
+from app.commons import time
+from app.register.archive import DayArchive
+
+
+def main() -> None:
+    from app.register.configurations import get_configs
+
+    parser = argparse.ArgumentParser(description="Ventas por día del archivo local")
+    parser.add_argument("--start", required=True, help="fecha inicial dd-mm-aaaa")
+    parser.add_argument("--end", required=True, help="fecha final dd-mm-aaaa")
+    args = parser.parse_args()
+
+    archive = DayArchive(get_configs().archive_dir)
+    days = archive.daily_totals(time.get_day_from_date(args.start), time.get_day_from_date(args.end))
+    print(
+        json.dumps(
+            {
+                "days": days,
+                "bills": sum(day["bills"] for day in days.values()),
+                "total": sum(day["total"] for day in days.values()),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
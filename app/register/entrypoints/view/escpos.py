@@ -0,0 +1,63 @@
+import datetime
+
+from app.register import model
+from app.register.entrypoints.view import money_format
+
+# ESC/POS commands
+INIT = b"\x1b@"
+ALIGN_LEFT = b"\x1ba\x00"
+ALIGN_CENTER = b"\x1ba\x01"
+NORMAL_SIZE = b"\x1d!\x00"
+DOUBLE_HEIGHT = b"\x1d!\x01"
+# feed 3 lines and partial cut
+CUT = b"\x1dV\x42\x03"
+# ESC p 0: pulse on the drawer kick connector
+DRAWER_KICK = b"\x1bp\x00\x19\xfa"
+
+STORE_HEADER = ["CACHARRERIA MUNOZ", "Cra 12a # 2-23", "Nit. 1.062.309.077"]
+STORE_FOOTER = ["GRACIAS POR SU COMPRA", "VUELVA PRONTO!"]
+
+
+class ReceiptTemplate:
+    """
+    Receipt layout compiled to ESC/POS bytes once. Rendering a bill only
+    encodes its date, item prices and total between the precompiled parts
+    and returns the whole receipt as one buffer, written to the printer in a
+    single operation.
+    """
+
+    def __init__(
+        self,
+        header: list[str] = STORE_HEADER,
+        footer: list[str] = STORE_FOOTER,
+        title: str = "CUENTA DE COBRO",
+        encoding: str = "cp437",
+    ) -> None:
+        self.encoding = encoding
+        self._header = INIT + ALIGN_CENTER + DOUBLE_HEIGHT + self._lines(header)
+        self._title = self._lines([title, " ", " "]) + NORMAL_SIZE + ALIGN_LEFT + self._lines(["Productos: "])
+        self._total = ALIGN_CENTER + self._lines(["Total"]) + ALIGN_LEFT
+        self._footer = ALIGN_CENTER + DOUBLE_HEIGHT + self._lines(footer) + NORMAL_SIZE + self._lines([" ", " "]) + CUT
+
+    def _lines(self, lines: list[str]) -> bytes:
+        return "".join(f"{line}\n" for line in lines).encode(self.encoding, errors="replace")
+
+    def render(self, bill: model.Bill, printed_at: datetime.datetime | None = None, open_drawer: bool = False) -> bytes:
+        date = printed_at or datetime.datetime.today()
+        prices = [money_format.SetMoneda(item.price) for item in bill.items]  # type: ignore
+        return b"".join(
+            (
+                self._header,
+                self._lines([f"{date.day}-{date.month}-{date.year} {date.hour}:{date.minute}:{date.second}"]),
+                self._title,
+                self._lines(prices),
+                self._total,
+                self._lines([money_format.SetMoneda(bill.total)]),  # type: ignore
+                self._footer,
+                DRAWER_KICK if open_drawer else b"",
+            )
+        )
+
+
+# compiled when the view is imported, every receipt reuses it
+RECEIPT = ReceiptTemplate()
@@ -0,0 +1,254 @@
+import abc
+import asyncio
+import collections
+import datetime
+import enum
+import os
+
+import pydantic
+
+from app.commons.logger import logger
+from app.register import model
+from app.register.entrypoints.view import escpos, money_format
+
+SMALL_FONT = 11
+BIG_FONT = 14
+
+
+class Receipt(pydantic.BaseModel):
+    # None for a drawer kick alone
+    bill: model.Bill | None = None
+    printed_at: datetime.datetime | None = None
+    open_drawer: bool = False
+
+
+def bill_receipt(bill: model.Bill) -> Receipt:
+    return Receipt(bill=bill, printed_at=datetime.datetime.today())
+
+
+def drawer_kick() -> Receipt:
+    return Receipt(open_drawer=True)
+
+
+class PrinterBackend(abc.ABC):
+    """
+    Sends a receipt to a printer. Backends are blocking, the spooler calls
+    them from a worker thread.
+    """
+
+    @abc.abstractmethod
+    def print_receipt(self, receipt: Receipt) -> None:
+        pass
+
+
+class Win32Backend(PrinterBackend):
+    """
+    Default Windows printer through the win32printing GDI driver, one text
+    call per line. The drawer opens when the printer gets a job, so a drawer
+    kick is an empty line.
+    """
+
+    def print_receipt(self, receipt: Receipt) -> None:
+        from win32printing import Printer
+
+        with Printer(linegap=1) as printer:
+            if receipt.bill is None:
+                printer.text("", align="center", font_config={"height": 15})
+                return
+            for text, align, height in self._lines(receipt.bill, receipt.printed_at):
+                printer.text(text, align=align, font_config={"height": height})
+
+    def _lines(self, bill: model.Bill, printed_at: datetime.datetime | None) -> list[tuple[str, str, int]]:
+        date = printed_at or datetime.datetime.today()
+        date_line = f"{date.day}-{date.month}-{date.year} {date.hour}:{date.minute}:{date.second}"
+        lines = [(text, "center", BIG_FONT) for text in escpos.STORE_HEADER + [date_line, "CUENTA DE COBRO"]]
+        lines += [(" ", "center", SMALL_FONT), (" ", "center", SMALL_FONT), ("Productos: ", "left", SMALL_FONT)]
+        lines += [(money_format.SetMoneda(item.price), "left", SMALL_FONT) for item in bill.items]  # type: ignore
+        lines += [("Total", "center", SMALL_FONT), (money_format.SetMoneda(bill.total), "left", SMALL_FONT)]  # type: ignore
+        lines += [(text, "center", BIG_FONT) for text in escpos.STORE_FOOTER]
+        lines += [(" ", "center", SMALL_FONT), (" ", "center", SMALL_FONT)]
+        return lines
+
+
+class RawBackend(PrinterBackend):
+    """
+    Printers that take ESC/POS bytes: the receipt is rendered from a
+    precompiled template and sent in one write.
+    """
+
+    def __init__(self, template: escpos.ReceiptTemplate = escpos.RECEIPT) -> None:
+        self.template = template
+
+    def render(self, receipt: Receipt) -> bytes:
+        if receipt.bill is None:
+            return escpos.DRAWER_KICK if receipt.open_drawer else b""
+        return self.template.render(receipt.bill, receipt.printed_at, receipt.open_drawer)
+
+    def print_receipt(self, receipt: Receipt) -> None:
+        self.write(self.render(receipt))
+
+    @abc.abstractmethod
+    def write(self, data: bytes) -> None:
+        pass
+
+
+class Win32RawBackend(RawBackend):
+    """
+    ESC/POS bytes straight to a Windows printer queue (pywin32), skipping the
+    GDI driver. Without a name the default printer is used.
+    """
+
+    def __init__(self, printer_name: str | None = None, template: escpos.ReceiptTemplate = escpos.RECEIPT) -> None:
+        super().__init__(template)
+        self.printer_name = printer_name
+
+    def write(self, data: bytes) -> None:
+        import win32print
+
+        handle = win32print.OpenPrinter(self.printer_name or win32print.GetDefaultPrinter())
+        try:
+            win32print.StartDocPrinter(handle, 1, ("Factura", None, "RAW"))
+            try:
+                win32print.StartPagePrinter(handle)
+                win32print.WritePrinter(handle, data)
+                win32print.EndPagePrinter(handle)
+            finally:
+                win32print.EndDocPrinter(handle)
+        finally:
+            win32print.ClosePrinter(handle)
+
+
+class FileBackend(RawBackend):
+    """
+    Appends receipts to a file or a named pipe (a spool file read by another
+    program, or a FIFO served by CUPS or a serial bridge).
+    """
+
+    def __init__(self, path: str, template: escpos.ReceiptTemplate = escpos.RECEIPT) -> None:
+        super().__init__(template)
+        self.path = path
+
+    def write(self, data: bytes) -> None:
+        with open(self.path, "ab") as file:
+            file.write(data)
+
+
+class DeviceBackend(FileBackend):
+    """
+    Raw printer device node on Linux (/dev/usb/lp0, /dev/ttyUSB0). Unlike a
+    file it is never created: an unplugged printer fails the job so it is
+    retried.
+    """
+
+    def write(self, data: bytes) -> None:
+        view = memoryview(data)
+        fd = os.open(self.path, os.O_WRONLY)
+        try:
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+
+
+def build_printer_backend(kind: str, path: str | None = None) -> PrinterBackend:
+    if kind == "win32":
+        return Win32Backend()
+    if kind == "win32raw":
+        return Win32RawBackend(path)
+    if not path:
+        raise ValueError(f"Printer backend {kind} requires a path")
+    if kind == "file":
+        return FileBackend(path)
+    if kind == "device":
+        return DeviceBackend(path)
+    raise ValueError(f"Unknown printer backend {kind}")
+
+
+class JobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    PRINTING = "printing"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class PrintJob(pydantic.BaseModel):
+    id: str = pydantic.Field(default_factory=model.generate_uuid)
+    receipt: Receipt
+    status: JobStatus = JobStatus.QUEUED
+    attempts: int = 0
+    error: str | None = None
+
+
+class PrintSpooler:
+    """
+    Print queue served by a background task. ``submit`` returns right away,
+    the worker prints one job at a time in a thread and retries failed jobs
+    with a growing delay before marking them as failed.
+    """
+
+    def __init__(
+        self,
+        backend: PrinterBackend,
+        max_attempts: int = 3,
+        retry_delay: float = 1.0,
+        history_size: int = 50,
+    ) -> None:
+        self.backend = backend
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self._history_size = history_size
+        self._queue: asyncio.Queue[PrintJob] = asyncio.Queue()
+        # most recent jobs, oldest first
+        self.jobs: collections.OrderedDict[str, PrintJob] = collections.OrderedDict()
+        self._worker: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    def submit(self, receipt: Receipt) -> PrintJob:
+        job = PrintJob(receipt=receipt)
+        self.jobs[job.id] = job
+        while len(self.jobs) > self._history_size:
+            self.jobs.popitem(last=False)
+        self._queue.put_nowait(job)
+        return job
+
+    async def join(self) -> None:
+        await self._queue.join()
+
+    async def _run(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._print(job)
+            finally:
+                self._queue.task_done()
+
+    async def _print(self, job: PrintJob) -> None:
+        while True:
+            job.status = JobStatus.PRINTING
+            job.attempts += 1
+            try:
+                await asyncio.to_thread(self.backend.print_receipt, job.receipt)
+            except Exception as error:
+                job.error = str(error)
+                if job.attempts >= self.max_attempts:
+                    job.status = JobStatus.FAILED
+                    logger.error(f"Print job {job.id} failed after {job.attempts} attempts: {error}")
+                    return
+                logger.warning(f"Print job {job.id} attempt {job.attempts} failed: {error}")
+                await asyncio.sleep(self.retry_delay * job.attempts)
+            else:
+                job.status = JobStatus.DONE
+                job.error = None
+                return
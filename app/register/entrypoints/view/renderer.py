@@ -0,0 +1,84 @@
+import shutil
+import sys
+from typing import TextIO
+
+from app.register import model
+from app.register.entrypoints.view import money_format
+
+CLEAR_SCREEN = "\x1b[2J\x1b[H"
+CLEAR_TO_END = "\x1b[J"
+HEADER = ["+++++++++++++", "L I S T A  D E  P R O D U C T O S"]
+FOOTER = "+++++++++++++"
+# subtotal, footer and the prompt line with what the cashier types
+BOTTOM_ROWS = 4
+
+
+def move_to(row: int) -> str:
+    return f"\x1b[{row};1H"
+
+
+class BillRenderer:
+    """
+    Paints the current bill with ANSI escape sequences instead of clearing
+    the screen. It remembers the item lines on screen, so adding or removing
+    an item only repaints from that line down (the line, the subtotal and the
+    footer). Bills taller than the terminal show their last items.
+    """
+
+    def __init__(self, out: TextIO = sys.stdout, rows: int | None = None) -> None:
+        self._out = out
+        self._rows = rows
+        self._bill_id: str | None = None
+        # formatted item lines of the bill being painted
+        self._lines: list[str] = []
+        # leading item lines on screen that are still right, None when the screen is not ours
+        self._painted: int | None = None
+
+    def invalidate(self) -> None:
+        self._painted = None
+
+    def render(self, bill: model.Bill) -> None:
+        unchanged = self._update_lines(bill)
+        max_items = self._terminal_rows() - len(HEADER) - BOTTOM_ROWS
+        if self._painted is None or len(self._lines) > max_items:
+            buffer = self._full_paint(max_items)
+        else:
+            buffer = self._partial_paint(min(self._painted, unchanged))
+        buffer.append(f"Subtotal:  {money_format.SetMoneda(bill.get_total())}\n{FOOTER}\n")  # type: ignore
+        self._out.write("".join(buffer))
+        self._out.flush()
+
+    def _update_lines(self, bill: model.Bill) -> int:
+        """
+        Formats only the new items (the register only appends or pops them)
+        and returns how many leading lines did not change.
+        """
+        if bill.id != self._bill_id:
+            self._bill_id = bill.id
+            self._lines = []
+        unchanged = min(len(self._lines), len(bill.items))
+        del self._lines[unchanged:]
+        self._lines.extend(money_format.SetMoneda(item.price) for item in bill.items[unchanged:])  # type: ignore
+        return unchanged
+
+    def _full_paint(self, max_items: int) -> list[str]:
+        lines = self._lines
+        buffer = [CLEAR_SCREEN, "\n".join(HEADER), "\n"]
+        if len(lines) > max_items:
+            hidden = len(lines) - max_items + 1
+            lines = [f"... {hidden} productos más"] + lines[hidden:]
+            # a cut list is repainted whole next time
+            self._painted = None
+        else:
+            self._painted = len(lines)
+        buffer.extend(line + "\n" for line in lines)
+        return buffer
+
+    def _partial_paint(self, first_changed: int) -> list[str]:
+        buffer = [move_to(len(HEADER) + first_changed + 1), CLEAR_TO_END]
+        buffer.extend(line + "\n" for line in self._lines[first_changed:])
+        self._painted = len(self._lines)
+        return buffer
+
+    def _terminal_rows(self) -> int:
+        return self._rows or shutil.get_terminal_size().lines
@@ -0,0 +1,98 @@
+import collections
+import shutil
+import sys
+from typing import Callable, TextIO
+
+from app.commons import time as tm
+from app.register import model
+from app.register.entrypoints.view import money_format
+from app.register.entrypoints.view.renderer import CLEAR_SCREEN
+
+HOUR_NS = 3600 * 1_000_000_000
+HEADER = ["+++++++++++++", "V E N T A  T O T A L", "Id  |  Valor  |  Fecha"]
+# page line, count, total, last hour, footer and the prompt line
+BOTTOM_ROWS = 6
+
+
+class SalesScreen:
+    """
+    Daily sales screen of the ``t`` command. The formatted row of every bill
+    is cached and the count, total and last hour figures are kept as running
+    counters, so each call only formats the bills added since the last one
+    and paints a single page.
+    """
+
+    def __init__(self, out: TextIO = sys.stdout, rows: int | None = None, now: Callable[[], int] = tm.now) -> None:
+        self._out = out
+        self._rows = rows
+        self._now = now
+        self._day_id: int | None = None
+        self._rows_cache: list[str] = []
+        self._total = 0.0
+        # (created_at, total) of the bills of the last hour, oldest first
+        self._last_hour: collections.deque[tuple[int, float]] = collections.deque()
+        self._last_hour_total = 0.0
+
+    @property
+    def bills_count(self) -> int:
+        return len(self._rows_cache)
+
+    @property
+    def total(self) -> float:
+        return self._total
+
+    @property
+    def last_hour_total(self) -> float:
+        self._expire_last_hour()
+        return self._last_hour_total
+
+    def page_size(self) -> int:
+        rows = self._rows or shutil.get_terminal_size().lines
+        return max(rows - len(HEADER) - BOTTOM_ROWS, 1)
+
+    def pages(self) -> int:
+        return max(-(-self.bills_count // self.page_size()), 1)
+
+    def update(self, daily_shift: model.DailyShift) -> None:
+        """
+        Appends the bills of daily_shift that are not cached yet. Bills are
+        only appended to a day, a different day (or a shorter one) starts over.
+        """
+        if daily_shift.id != self._day_id or len(daily_shift.bills) < self.bills_count:
+            self._reset(daily_shift.id)
+        for bill in daily_shift.bills[self.bills_count :]:
+            self._rows_cache.append(f"{bill.id} {money_format.SetMoneda(bill.total)} {bill.get_date_in_isoformat()}")  # type: ignore
+            self._total += bill.total
+            self._last_hour.append((bill.created_at, bill.total))
+            self._last_hour_total += bill.total
+
+    def show(self, daily_shift: model.DailyShift, page: int | None = None) -> None:
+        """
+        Paints one page of the day, the last one (newest bills) by default.
+        """
+        self.update(daily_shift)
+        pages = self.pages()
+        page = pages if page is None else min(max(page, 1), pages)
+        size = self.page_size()
+        buffer = [CLEAR_SCREEN, "\n".join(HEADER), "\n"]
+        buffer.extend(row + "\n" for row in self._rows_cache[(page - 1) * size : page * size])
+        buffer.append(f"Página {page} de {pages} (t [página])\n")
+        buffer.append(f"Facturas: {self.bills_count}\n")
+        buffer.append(f"Total:  {money_format.SetMoneda(self._total)}\n")  # type: ignore
+        buffer.append(f"Última hora:  {money_format.SetMoneda(self.last_hour_total)}\n")  # type: ignore
+        buffer.append("+++++++++++++\n")
+        self._out.write("".join(buffer))
+        self._out.flush()
+
+    def _reset(self, day_id: int) -> None:
+        self._day_id = day_id
+        self._rows_cache = []
+        self._total = 0.0
+        self._last_hour.clear()
+        self._last_hour_total = 0.0
+
+    def _expire_last_hour(self) -> None:
+        since = self._now() - HOUR_NS
+        while self._last_hour and self._last_hour[0][0] < since:
+            _, total = self._last_hour.popleft()
+            self._last_hour_total -= total
@@ -0,0 +1,39 @@
+import time
+from typing import Awaitable, Callable
+
+import aioconsole
+
+ReadCommand = Callable[[str], Awaitable[str]]
+
+
+def parse_session_line(line: str) -> tuple[float | None, str]:
+    """
+    A session line is the command as typed, optionally after the seconds
+    waited since the previous one and a tab (an empty command is Enter).
+    """
+    line = line.rstrip("\n")
+    delay, tab, command = line.partition("\t")
+    if not tab:
+        return None, line
+    return float(delay), command
+
+
+def recording_input(path: str, read_command: ReadCommand | None = None) -> ReadCommand:
+    """
+    Wraps the keyboard input to append every command to path, so a real
+    session can be replayed later with benchmarks.replay_session.
+    """
+    read_command = read_command or aioconsole.ainput
+    file = open(path, "a", encoding="utf-8")
+    last = time.monotonic()
+
+    async def read(prompt: str) -> str:
+        nonlocal last
+        command = await read_command(prompt)
+        now = time.monotonic()
+        file.write(f"{now - last:.3f}\t{command}\n")
+        file.flush()
+        last = now
+        return command
+
+    return read
@@ -1,94 +1,55 @@
 import datetime
-import os
-from os import system
+import sys
 
+from app.commons.metrics import Metrics
 from app.register import model
-from app.register.entrypoints.view import money_format
-
-try:
-    from win32printing import Printer
-except Exception as error:
-    print(error)
+from app.register.entrypoints.view import money_format, printing
+from app.register.entrypoints.view.renderer import CLEAR_SCREEN
 
 
 def clear() -> None:
-    if os.name == "posix":
-        clear_command = "clear"
-    else:
-        clear_command = "cls"
-    system(clear_command)
+    # ANSI clear instead of spawning a "clear"/"cls" process
+    sys.stdout.write(CLEAR_SCREEN)
 
 
-def show_items_value(bill: model.Bill) -> None:
+def show_print_jobs(jobs: list[printing.PrintJob]) -> None:
     clear()
     print("+++++++++++++")
-    print("L I S T A  D E  P R O D U C T O S")
-    for i in bill.items:
-        print(money_format.SetMoneda(i.price))  # type: ignore
-    print("Subtotal: ", money_format.SetMoneda(bill.get_total()))  # type: ignore
+    print("C O L A  D E  I M P R E S I O N")
+    for job in jobs[-10:]:
+        kind = "cajón" if job.receipt.bill is None else "factura"
+        error = f" - {job.error}" if job.error else ""
+        print(f"{job.id[:8]}  {kind}  {job.status.value}  intentos: {job.attempts}{error}")
     print("+++++++++++++")
 
 
-def show_total_sales(daily_shift: model.DailyShift) -> None:
+def show_metrics(metrics: Metrics) -> None:
     clear()
     print("+++++++++++++")
-    print("V E N T A  T O T A L")
-    print("Id  |  Valor  |  Fecha")
-    for i in daily_shift.bills:
-        print(i.id, money_format.SetMoneda(i.total), i.get_date_in_isoformat())  # type: ignore
-    print("Total: ", money_format.SetMoneda(daily_shift.total))  # type: ignore
+    print("M E T R I C A S")
+    if not metrics.enabled:
+        print("Métricas deshabilitadas (METRICS_ENABLED=true)")
+    for name, histogram in sorted(metrics.histograms.items()):
+        avg_ms = histogram.sum / histogram.count * 1000 if histogram.count else 0
+        p99_ms = histogram.quantile(0.99) * 1000
+        print(f"{name}  n={histogram.count}  prom={avg_ms:.2f}ms  p99<={p99_ms:g}ms")
+    for name, value in sorted(metrics.counters.items()):
+        print(f"{name}  {value:g}")
     print("+++++++++++++")
 
 
-def print_last(bill: model.Bill) -> None:
-    font = {
-        "height": 11,
-    }
-    fontg = {
-        "height": 14,
-    }
-    date = datetime.datetime.today()
-    string = (
-        "       "
-        + str(date.day)
-        + "-"
-        + str(date.month)
-        + "-"
-        + str(date.year)
-        + " "
-        + str(date.hour)
-        + ":"
-        + str(date.minute)
-        + ":"
-        + str(date.second)
-    )
-    with Printer(linegap=1) as printer:
-        printer.text("       CACHARRERIA MUNOZ", align="center", font_config=fontg)
-        printer.text("        Cra 12a # 2-23", align="center", font_config=fontg)
-        printer.text("      Nit. 1.062.309.077", align="center", font_config=fontg)
-        printer.text(string, align="center", font_config=fontg)
-        printer.text("        CUENTA DE COBRO", align="center", font_config=fontg)
-        printer.text(" ", align="center", font_config=font)
-        printer.text(" ", align="center", font_config=font)
-        printer.text("Productos: ", align="left", font_config=font)
-        for i in bill.items:
-            printer.text(
-                money_format.SetMoneda(i.price), align="left", font_config=font  # type: ignore
-            )
-        printer.text("Total", align="center", font_config=font)
-        printer.text(money_format.SetMoneda(bill.total), align="left", font_config=font)  # type: ignore
-        printer.text("    GRACIAS POR SU COMPRA", align="center", font_config=fontg)
-        printer.text("       VUELVA PRONTO!", align="center", font_config=fontg)
-        printer.text(" ", align="center", font_config=font)
-        printer.text(" ", align="center", font_config=font)
-
-
-def open_register() -> None:
-    font = {
-        "height": 15,
-    }
-    with Printer(linegap=1) as printer:
-        printer.text("", align="center", font_config=font)
+def show_bill(daily_shift: model.DailyShift, bill: model.Bill, voided: bool = False) -> None:
+    clear()
+    print("+++++++++++++")
+    day = datetime.datetime.fromtimestamp(daily_shift.id, datetime.timezone.utc).strftime("%d-%m-%Y")
+    print(f"F A C T U R A  {bill.id}")
+    print(f"Día: {day}  Hora: {bill.get_date_in_isoformat()}")
+    for item in bill.items:
+        print(f"{item.quantity:g} x {money_format.SetMoneda(item.price)}")  # type: ignore
+    print(f"Total: {money_format.SetMoneda(bill.total)}")  # type: ignore
+    if voided:
+        print("ANULADA")
+    print("+++++++++++++")
 
 
 def show_commands() -> None:
@@ -97,11 +58,16 @@ def show_commands() -> None:
     print("C O M A N D O S  D I S P O N I B L E S")
     print("1. [number] - Agregar un producto con el valor especificado")
     print("2. b - Eliminar el último producto agregado")
-    print("3. t | - - Mostrar las ventas totales del día")
+    print("3. t | - - Mostrar las ventas totales del día (t [página] para ver otra página)")
     print("4. [enter] - Guardar la factura actual")
     print("5. nt - Ingresar una nota de crédito")
-    print("6. p | + - Imprimir la última factura")
+    print("6. p | + - Imprimir la última factura (p [factura] para reimprimir cualquiera)")
     print("7. . - Abrir la caja registradora")
     print("8. h | help - Mostrar los comandos disponibles")
     print("9. sync | s - Sincronizar manualmente con DynamoDB")
+    print("10. cola - Mostrar el estado de las impresiones")
+    print("11. m | metricas - Mostrar las métricas de latencia")
+    print("12. prof [segundos] - Perfilar la caja (CPU y memoria) y guardar el reporte en profiles/")
+    print("13. ver [factura] - Ver una factura de los días guardados")
+    print("14. anular [factura] - Anular una factura con una nota crédito por su total")
     print("+++++++++++++")
@@ -1,75 +1,136 @@
+from typing import Awaitable, Callable
+
 import aioconsole
-from colorama import Fore, Back, Style
+from colorama import Fore, Back, Style, just_fix_windows_console
 
+from app.commons.logger import logger
+from app.commons.metrics import metrics
+from app.commons.profiling import Profiler
 from app.register import usecases
-from app.register.entrypoints.view import utils
+from app.register.entrypoints.view import printing, utils
+from app.register.entrypoints.view.renderer import BillRenderer
+from app.register.entrypoints.view.sales import SalesScreen
 from app.register.entrypoints.cron import Sync
 
 
-async def start_view(register: usecases.Register, syncronizer: Sync = None) -> None:
+async def start_view(
+    register: usecases.Register,
+    syncronizer: Sync | None = None,
+    renderer: BillRenderer | None = None,
+    sales_screen: SalesScreen | None = None,
+    spooler: printing.PrintSpooler | None = None,
+    profiler: Profiler | None = None,
+    read_command: Callable[[str], Awaitable[str]] | None = None,
+) -> None:
+    # lets the Windows console understand the ANSI sequences of the renderer
+    just_fix_windows_console()
+    renderer = renderer or BillRenderer()
+    sales_screen = sales_screen or SalesScreen()
+    # receipts and drawer kicks are queued, printing never blocks the prompt
+    spooler = spooler or printing.PrintSpooler(printing.Win32Backend())
+    spooler.start()
+    profiler = profiler or Profiler()
+    # the keyboard by default, scripts in the replay tool
+    read_command = read_command or aioconsole.ainput
     while True:
         cmd = None
         try:
-            command = str(await aioconsole.ainput("Digita el valor Producto: "))
+            command = str(await read_command("Digita el valor Producto: "))
             match command:
                 case _ if command.isdigit():
                     cmd = "number"
                     if 500_000 > int(command) > 0:
                         register.add_item(price=float(command))
-                        utils.show_items_value(bill=register.get_current_bill())  # type: ignore
+                        renderer.render(bill=register.get_current_bill())  # type: ignore
                     elif int(command) >= 500000:
+                        renderer.invalidate()
                         print(
                             Style.BRIGHT
                             + Back.YELLOW
                             + Fore.BLACK
                             + "presione + y doble enter para registrar este valor mayor a $500.000, de lo contrario enter"
                         )
-                        if str(await aioconsole.ainput("")) == "+":
-                            register.add_item(price=float(command))
-                            utils.show_items_value(bill=register.get_current_bill())  # type: ignore
+                        if str(await read_command("")) == "+":
+                            register.add_item(price=float(command), confirmed=True)
                             print(Style.RESET_ALL)
+                            renderer.render(bill=register.get_current_bill())  # type: ignore
                         print(Style.RESET_ALL)
                 case "b":
                     cmd = "b"
                     register.remove_last_item()
-                    utils.show_items_value(bill=register.get_current_bill())  # type: ignore
+                    renderer.render(bill=register.get_current_bill())  # type: ignore
                 case "t" | "-":
                     cmd = "t"
                     daily_shift = await register.get_daily_shift()
                     if not daily_shift:
                         raise Exception("No hay ventas")
-                    utils.show_total_sales(daily_shift=daily_shift)
+                    sales_screen.show(daily_shift=daily_shift)
+                case _ if command.startswith("t ") and command[2:].strip().isdigit():
+                    cmd = "t"
+                    daily_shift = await register.get_daily_shift()
+                    sales_screen.show(daily_shift=daily_shift, page=int(command[2:]))
                 case "":
                     cmd = "enter"
                     await register.save_bill()
-                    utils.open_register()
+                    spooler.submit(printing.drawer_kick())
                 case "nt":
                     cmd = "nt"
                     value = float(
-                        await aioconsole.ainput(
+                        await read_command(
                             "Ingrese el valor para la nota credito: "
                         )
                     )
-                    if value >= 0:
-                        register.add_item(price=-value)
-                        await register.save_bill()
-                    else:
-                        raise Exception("Valor invalido")
+                    await register.issue_credit_note(value)
                 case "p" | "+":
                     cmd = "p"
                     daily_shift = await register.get_daily_shift()
                     last_bill = daily_shift.bills[-1]
-                    utils.print_last(bill=last_bill)
-
+                    spooler.submit(printing.bill_receipt(last_bill))
+                case _ if command.startswith("p ") and command[2:].strip():
+                    cmd = "p"
+                    found = await register.find_bill(command[2:].strip())
+                    if found is None:
+                        raise Exception("Factura no encontrada")
+                    spooler.submit(printing.bill_receipt(found[1]))
+                case _ if command.startswith("ver ") and command[4:].strip():
+                    cmd = "ver"
+                    found = await register.find_bill(command[4:].strip())
+                    if found is None:
+                        raise Exception("Factura no encontrada")
+                    utils.show_bill(*found)
+                case _ if command.startswith("anular ") and command[7:].strip():
+                    cmd = "anular"
+                    bill_id = command[7:].strip()
+                    found = await register.find_bill(bill_id)
+                    if found is None:
+                        raise Exception("Factura no encontrada")
+                    utils.show_bill(*found)
+                    print("presione + y enter para anular esta factura, de lo contrario enter")
+                    if str(await read_command("")) == "+":
+                        await register.void_bill(bill_id)
+                        print(f"Factura {bill_id} anulada")
                 case ".":
                     cmd = "."
-                    utils.open_register()
+                    spooler.submit(printing.drawer_kick())
+                case "m" | "metricas":
+                    cmd = "m"
+                    utils.show_metrics(metrics)
+                case _ if command == "prof" or command.startswith("prof "):
+                    cmd = "prof"
+                    seconds = int(command[5:] or 60)
+                    if profiler.start(seconds):
+                        print(f"Perfilando durante {seconds} segundos...")
+                    else:
+                        print("Ya hay un perfilado en curso")
+                case "cola":
+                    cmd = "cola"
+                    utils.show_print_jobs(list(spooler.jobs.values()))
                 case "h" | "help":
                     cmd = "h"
                     utils.show_commands()
                 case "sync" | "s":
                     cmd = "sync"
-                    if syncronizer:
+                    if syncronizer and syncronizer.db:
                         print("Iniciando sincronización manual...")
                         await syncronizer.sync_bills()
                         print("Sincronización completada.")
@@ -77,9 +138,13 @@ async def start_view(register: usecases.Register, syncronizer: Sync = None) -> N
                         print("Error: Sincronizador no disponible")
                 case _:
                     print("Comando no encontrado")
+            if cmd not in ("number", "b"):
+                # other screens and messages move the cursor, repaint the bill from scratch
+                renderer.invalidate()
         except Exception as e:
-            # write log to file with the traceback and the command
-            with open("error.log", "a") as file:
-                file.write(f"{e} - {cmd}\n")
+            renderer.invalidate()
+            # the record goes to the log queue, the file is written by the log thread;
+            # warning keeps the traceback off the cashier screen (console shows ERROR)
+            logger.warning(f"Command {cmd} failed: {e}", exc_info=True)
 
             print("Error: ", e)
@@ -0,0 +1,57 @@
+"""
+Bill lifecycle events. The register records every change of a lane's bill
+as an event; the current bill, the journal and the dashboard aggregates are
+projections of them (see ``projections``).
+
+The events do not drive storage: saved days still go to ``InMemoryRepo``
+and DynamoDB as whole DailyShifts, which remain the source of truth. The
+journal is a side log for readers such as the dashboard and may lag or
+miss events (it is written after the day is stored).
+"""
+
+from typing import Annotated, Literal
+
+import pydantic
+
+from app.commons import time as tm
+from app.register import model
+
+
+class _Event(pydantic.BaseModel):
+    lane: str = "1"
+    day: int
+    at: int = pydantic.Field(default_factory=tm.now)
+
+
+class ItemAdded(_Event):
+    type: Literal["item_added"] = "item_added"
+    bill_id: str
+    item: model.Item
+
+
+class ItemRemoved(_Event):
+    type: Literal["item_removed"] = "item_removed"
+    bill_id: str
+
+
+class BillSaved(_Event):
+    type: Literal["bill_saved"] = "bill_saved"
+    bill: model.Bill
+
+
+class CreditNoteIssued(_Event):
+    type: Literal["credit_note_issued"] = "credit_note_issued"
+    # stored in the day as a bill with one negative item
+    bill: model.Bill
+
+
+Event = Annotated[ItemAdded | ItemRemoved | BillSaved | CreditNoteIssued, pydantic.Field(discriminator="type")]
+event_adapter: pydantic.TypeAdapter[Event] = pydantic.TypeAdapter(Event)
+
+
+def dump_event(event: Event) -> bytes:
+    return event.__pydantic_serializer__.to_json(event) + b"\n"
+
+
+def load_event(line: bytes) -> Event:
+    return event_adapter.validate_json(line)
@@ -0,0 +1,186 @@
+"""
+Append-only journal of the bill events (see ``events``): one file of JSON
+lines per day, so readers such as the dashboard follow them by file offset
+instead of re-reading daily_shifts.json. It is not a write path: the
+stored days do not depend on it.
+"""
+
+import os
+import queue
+import threading
+from typing import BinaryIO
+
+from app.commons import time as tm
+from app.commons.logger import logger
+from app.register import events, projections
+
+JOURNAL_SUFFIX = ".ndjson"
+# lines written by the writer thread before each flush, at most
+BATCH_SIZE = 100
+
+
+def _day_from_file_name(file_name: str) -> int | None:
+    if not file_name.endswith(JOURNAL_SUFFIX):
+        return None
+    try:
+        return int(file_name.removesuffix(JOURNAL_SUFFIX))
+    except ValueError:
+        return None
+
+
+class EventJournal:
+    """
+    ``append`` only queues the event line: a writer thread writes every queued
+    line (up to ``batch_size``) and flushes once, like the logger's
+    BatchingQueueListener, so the event loop never waits on the file.
+    """
+
+    def __init__(self, directory: str = "journal", keep_days: int = 7, batch_size: int = BATCH_SIZE) -> None:
+        self._directory = directory
+        self._keep_days = keep_days
+        self._batch_size = batch_size
+        self._day_id: int | None = None
+        self._file: BinaryIO | None = None
+        # (day id, line) per event, None stops the writer
+        self._queue: queue.Queue[tuple[int, bytes] | None] = queue.Queue()
+        self._writer: threading.Thread | None = None
+
+    def path(self, day_id: int) -> str:
+        return os.path.join(self._directory, f"{day_id}{JOURNAL_SUFFIX}")
+
+    def _open(self, day_id: int) -> BinaryIO:
+        if self._file is None or self._day_id != day_id:
+            self._close_file()
+            os.makedirs(self._directory, exist_ok=True)
+            self._file = open(self.path(day_id), "ab")
+            self._day_id = day_id
+            self._prune(day_id)
+        return self._file
+
+    def _prune(self, day_id: int) -> None:
+        oldest = day_id - self._keep_days * tm.DAY_SECONDS
+        for file_name in os.listdir(self._directory):
+            file_day = _day_from_file_name(file_name)
+            if file_day is not None and file_day < oldest:
+                os.remove(os.path.join(self._directory, file_name))
+
+    def append(self, event: events.Event) -> None:
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_queued, name="event-journal", daemon=True)
+            self._writer.start()
+        # dumped here, the event may change once the register moves on
+        self._queue.put((event.day, events.dump_event(event)))
+
+    def _write_queued(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                for entry in batch:
+                    if entry is not None:
+                        day_id, line = entry
+                        self._open(day_id).write(line)
+                # no fsync, daily_shifts.json is the durable copy; flushed so readers see the lines
+                if self._file is not None:
+                    self._file.flush()
+            except OSError as error:
+                # a side log: the lines are lost, the stored days are not
+                logger.error(f"Error writing the journal: {error}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if None in batch:
+                self._close_file()
+                return
+
+    def flush(self) -> None:
+        """
+        Waits until every appended event is written and flushed
+        """
+        self._queue.join()
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def close(self) -> None:
+        """
+        Writes the queued events and stops the writer thread
+        """
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+        self._close_file()
+
+
+class SalesTail:
+    """
+    Today's ``DaySales`` projection fed from the journal. ``poll`` reads only
+    the bytes appended since the previous call (a stat when nothing changed)
+    and starts over when the day changes.
+    """
+
+    def __init__(self, directory: str = "journal", last_bills: int = 10, clock: tm.Clock | None = None) -> None:
+        self._directory = directory
+        self._clock = clock or tm.clock
+        self._lock = threading.Lock()
+        self._last_bills = last_bills
+        self._reset(None)
+
+    def _reset(self, day_id: int | None) -> None:
+        self.day_id = day_id
+        self.offset = 0
+        self.sales = projections.DaySales(self._last_bills)
+
+    def poll(self) -> bool:
+        """
+        Returns True when new events were read
+        """
+        # streamlit reruns share the tail between sessions, one poll at a time
+        with self._lock:
+            day_id = self._clock.current_day
+            if day_id != self.day_id:
+                self._reset(day_id)
+            path = os.path.join(self._directory, f"{day_id}{JOURNAL_SUFFIX}")
+            try:
+                size = os.stat(path).st_size
+            except FileNotFoundError:
+                return False
+            if size < self.offset:
+                # the file was replaced, read it again
+                self._reset(day_id)
+            if size == self.offset:
+                return False
+            with open(path, "rb") as file:
+                file.seek(self.offset)
+                data = file.read(size - self.offset)
+            # a line still being written stays for the next poll
+            complete = data[: data.rfind(b"\n") + 1]
+            for line in complete.splitlines():
+                self.sales.apply(events.load_event(line))
+            self.offset += len(complete)
+            return bool(complete)
+
+    def snapshot(self) -> dict:
+        """
+        Copy of the aggregates, consistent even while another thread polls
+        """
+        with self._lock:
+            sales = self.sales
+            return {
+                "day_id": self.day_id,
+                "bills": sales.bills,
+                "total": sales.total,
+                "average_ticket": sales.average_ticket,
+                "credit_notes": sales.credit_notes,
+                "credit_notes_total": sales.credit_notes_total,
+                "items_removed": sales.items_removed,
+                "by_hour": {hour: tuple(values) for hour, values in sorted(sales.by_hour.items())},
+                "last_bills": list(sales.last_bills),
+            }
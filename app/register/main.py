@@ -1,31 +1,92 @@
 import asyncio
 
-from app.register import entrypoints, usecases, adapters
-from app.register.configurations import configs
+from app.commons import time
+from app.commons.metrics import metrics
+from app.commons.profiling import Profiler
+from app.register import entrypoints, usecases, adapters, ports
+from app.register.configurations import Configs, get_configs
+from app.register.archive import DayArchive
+from app.register.journal import EventJournal
+from app.register.entrypoints.view import printing, session
 
 
-async def start_app() -> None:
-    # bootstrap
-    in_memory_repo = adapters.InMemoryRepo()
-    register = usecases.Register(repo=in_memory_repo)
-
-    dynamo_db = adapters.DynamoDb(
-        table_name="daily_shifts",
+def build_dynamo_db(configs: Configs) -> ports.Repository:
+    if configs.dynamo_layout == "bill":
+        return adapters.DynamoDbBills(
+            table_name=configs.dynamo_table_name,
+            access_key=configs.aws_access_key_id,
+            secret_key=configs.aws_secret_access_key,
+        )
+    return adapters.DynamoDb(
+        table_name=configs.dynamo_table_name,
         access_key=configs.aws_access_key_id,
         secret_key=configs.aws_secret_access_key,
+        compress=configs.dynamo_compress,
     )
-    syncronizer = entrypoints.Sync(db=dynamo_db, in_memory_repo=in_memory_repo)
-
-    await asyncio.gather(
-        entrypoints.set_up_sync_process(
-            sync_bills=syncronizer.sync_bills,
-            clean_daily_shifts=syncronizer.clean_daily_shifts,
-            time_sync=configs.time_to_sync,
-            time_clean=configs.time_to_clean,
-        ),
-        entrypoints.start_view(register=register, syncronizer=syncronizer),
+
+
+async def start_background(
+    configs: Configs, in_memory_repo: adapters.InMemoryRepo, syncronizer: entrypoints.Sync
+) -> None:
+    # everything the cashier does not need to type the first item
+    await in_memory_repo.load_deferred_days()
+    # days closed while the register was off
+    await syncronizer.seal_closed_days()
+    syncronizer.db = await asyncio.to_thread(build_dynamo_db, configs)
+    await entrypoints.set_up_sync_process(
+        sync_bills=syncronizer.sync_bills,
+        clean_daily_shifts=syncronizer.clean_daily_shifts,
+        time_sync=configs.time_to_sync,
+        time_clean=configs.time_to_clean,
     )
 
 
+async def start_app() -> None:
+    # bootstrap: only the current day is loaded before the prompt shows up
+    configs = get_configs()
+    time.clock.start()
+    if configs.metrics_enabled:
+        metrics.enable()
+    profiler = Profiler(configs.profiles_dir)
+    if configs.profile_seconds:
+        profiler.start(configs.profile_seconds)
+    in_memory_repo = adapters.InMemoryRepo(
+        hot_days=configs.hot_days, warm_cache_size=configs.warm_cache_size, lazy=True, clock=time.clock
+    )
+    # the console drives one lane, more lanes can share the same repo
+    journal = EventJournal(configs.journal_dir, keep_days=configs.journal_keep_days)
+    lanes = usecases.Lanes(repo=in_memory_repo, clock=time.clock, journal=journal)
+    register = lanes.get("1")
+    syncronizer = entrypoints.Sync(db=None, in_memory_repo=in_memory_repo, archive=DayArchive(configs.archive_dir), clock=time.clock)
+    time.clock.on_rollover(syncronizer.on_day_closed)
+    spooler = printing.PrintSpooler(
+        printing.build_printer_backend(configs.printer_backend, configs.printer_path),
+        max_attempts=configs.print_max_attempts,
+    )
+
+    read_command = session.recording_input(configs.record_session_file) if configs.record_session_file else None
+
+    tasks = [
+        start_background(configs, in_memory_repo, syncronizer),
+        entrypoints.start_view(
+            register=register,
+            syncronizer=syncronizer,
+            spooler=spooler,
+            profiler=profiler,
+            read_command=read_command,
+        ),
+    ]
+    if configs.api_socket or configs.api_port:
+        api = entrypoints.RegisterServer(lanes)
+        tasks.append(api.serve(path=configs.api_socket, port=configs.api_port))
+    if metrics.enabled:
+        tasks.append(metrics.dump_every(configs.metrics_file, configs.metrics_dump_interval))
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        # the events still queued for the journal
+        journal.close()
+
+
 if __name__ == "__main__":
     asyncio.run(start_app())
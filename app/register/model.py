@@ -1,3 +1,4 @@
+import hashlib
 import time
 from typing import cast
 
@@ -44,15 +45,30 @@ class Bill(pydantic.BaseModel):
         )
 
 
+bills_adapter: pydantic.TypeAdapter[list[Bill]] = pydantic.TypeAdapter(list[Bill])
+
+
 # Aggregates
 class DailyShift(pydantic.BaseModel):
     id: int = pydantic.Field(default_factory=tm.get_posix_time_until_day)
     bills: list[Bill]
     total: float
+    # closed days are sealed: no more bills and a digest of their content
+    sealed: bool = False
+    digest: str | None = None
 
     def add_bill(self, bill: Bill) -> None:
+        if self.sealed:
+            raise ValueError(f"Daily shift {self.id} is sealed")
         self.bills.append(bill)
         self.total += bill.total
 
     def get_total(self) -> float:
         return self.total
+
+    def compute_digest(self) -> str:
+        return hashlib.blake2b(bills_adapter.dump_json(self.bills), digest_size=16).hexdigest()
+
+    def seal(self) -> None:
+        self.digest = self.compute_digest()
+        self.sealed = True
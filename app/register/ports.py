@@ -1,9 +1,13 @@
 import abc
+import asyncio
 
 from app.register import model
 
 
 class Repository(abc.ABC):
+    def __init__(self) -> None:
+        self._day_locks: dict[int, asyncio.Lock] = {}
+
     @abc.abstractmethod
     async def get(self, id_: int) -> model.DailyShift | None:
         pass
@@ -11,3 +15,31 @@ class Repository(abc.ABC):
     @abc.abstractmethod
     async def save(self, daily_shift: model.DailyShift) -> None:
         pass
+
+    def day_lock(self, id_: int) -> asyncio.Lock:
+        """
+        Held while a day is read and a bill added to it, so the registers
+        (checkout lanes) sharing this repository do not lose each other's bills.
+        """
+        if id_ not in self._day_locks:
+            self._day_locks[id_] = asyncio.Lock()
+        return self._day_locks[id_]
+
+    async def get_digest(self, id_: int) -> str | None:
+        daily_shift = await self.get(id_)
+        return daily_shift.digest if daily_shift else None
+
+    async def repair(self, daily_shift: model.DailyShift, bill_ids: set[str]) -> None:
+        """
+        Stores daily_shift again so the given bills match the local copy.
+        """
+        await self.save(daily_shift)
+
+
+class BillLookup(abc.ABC):
+    @abc.abstractmethod
+    async def find_bill(self, bill_id: str) -> tuple[model.DailyShift, model.Bill] | None:
+        """
+        Day and bill with that id among the retained days, None when it is not there
+        """
+        pass
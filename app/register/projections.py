@@ -0,0 +1,77 @@
+"""
+State computed from the bill events, one event at a time: projections keep
+their own aggregates up to date with ``apply`` so nothing has to read the
+history again. A new view is a new projection fed from the journal.
+"""
+
+import collections
+from typing import Protocol
+
+from app.register import events, model
+
+
+class Projection(Protocol):
+    def apply(self, event: events.Event) -> None: ...
+
+
+class CurrentBill:
+    """
+    Bill a lane is typing. Items go into the open bill; the first item after
+    a save opens a new one.
+    """
+
+    def __init__(self) -> None:
+        self.bill = model.Bill(items=[], total=0)
+        self.open = False
+
+    def apply(self, event: events.Event) -> None:
+        match event:
+            case events.ItemAdded():
+                if not self.open or event.bill_id != self.bill.id:
+                    self.bill = model.Bill(id=event.bill_id, created_at=event.at, items=[], total=0)
+                    self.open = True
+                self.bill.add_item(event.item)
+            case events.ItemRemoved() if self.open and event.bill_id == self.bill.id:
+                self.bill.remove_last_item()
+            case events.BillSaved() if event.bill.id == self.bill.id:
+                self.open = False
+
+
+class DaySales:
+    """
+    Sales of a day: saved bills, credit notes and removed items
+    """
+
+    def __init__(self, last_bills: int = 10) -> None:
+        self.bills = 0
+        self.sales = 0.0
+        self.credit_notes = 0
+        self.credit_notes_total = 0.0
+        self.items_removed = 0
+        # local hour -> [bills, sales]
+        self.by_hour: dict[int, list[float]] = collections.defaultdict(lambda: [0, 0.0])
+        self.last_bills: collections.deque[model.Bill] = collections.deque(maxlen=last_bills)
+
+    @property
+    def total(self) -> float:
+        # what the DailyShift total shows: sales minus credit notes
+        return self.sales + self.credit_notes_total
+
+    @property
+    def average_ticket(self) -> float:
+        return self.sales / self.bills if self.bills else 0.0
+
+    def apply(self, event: events.Event) -> None:
+        match event:
+            case events.BillSaved(bill=bill):
+                hour = int((bill.created_at // 1_000_000_000 - event.day) // 3600)
+                self.bills += 1
+                self.sales += bill.total
+                self.by_hour[hour][0] += 1
+                self.by_hour[hour][1] += bill.total
+                self.last_bills.append(bill)
+            case events.CreditNoteIssued(bill=bill):
+                self.credit_notes += 1
+                self.credit_notes_total += bill.total
+            case events.ItemRemoved():
+                self.items_removed += 1
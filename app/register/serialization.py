@@ -0,0 +1,60 @@
+"""
+(De)serialization of stored DailyShifts, done by pydantic-core straight
+from/to JSON bytes without building intermediate dicts.
+"""
+
+import contextlib
+import gc
+import hashlib
+import json
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+import pydantic
+import pydantic_core
+
+from app.register import model
+
+daily_shifts_adapter: pydantic.TypeAdapter[dict[int, model.DailyShift]] = pydantic.TypeAdapter(dict[int, model.DailyShift])
+
+
+@contextlib.contextmanager
+def _gc_paused() -> Iterator[None]:
+    # bulk loads allocate many objects and no cycles, the collector only adds passes
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def checksum(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def dump_daily_shifts(daily_shifts: Mapping[int, Any]) -> bytes:
+    """
+    Values can be DailyShifts or raw dicts (days not validated yet).
+    """
+    if all(isinstance(daily_shift, model.DailyShift) for daily_shift in daily_shifts.values()):
+        return daily_shifts_adapter.dump_json(dict(daily_shifts))
+    return pydantic_core.to_json(daily_shifts)
+
+
+def load_daily_shifts(data: bytes) -> dict[int, model.DailyShift]:
+    if not data.strip():
+        return {}
+    with _gc_paused():
+        return daily_shifts_adapter.validate_json(data)
+
+
+def load_raw_daily_shifts(data: bytes) -> dict[int, dict]:
+    if not data.strip():
+        return {}
+    return {int(k): v for k, v in json.loads(data).items()}
+
+
+def dump_daily_shift(daily_shift: model.DailyShift) -> bytes:
+    return daily_shift.__pydantic_serializer__.to_json(daily_shift)
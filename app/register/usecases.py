@@ -1,44 +1,166 @@
-import app.commons.time
+import math
+
 from app.commons import time
-from app.register import ports, model
+from app.commons.metrics import metrics, timed
+from app.register import events, ports, model, projections
+from app.register.journal import EventJournal
+
+# id of the credit note voiding a bill: the prefix plus the bill id
+VOID_PREFIX = "void-"
+# prices from here on need the cashier's confirmation (see view)
+MAX_PRICE = 500_000
+
+
+def _check_value(value: float) -> None:
+    # NaN would be stored as null and the day would not load again
+    if not math.isfinite(value) or value <= 0:
+        raise ValueError("Valor invalido")
 
 
 class Register:
-    def __init__(self, repo: ports.Repository):
+    """
+    Every change of the bill is recorded as an event: the current bill is a
+    projection of them and the journal, when given, gets each one appended.
+    """
+
+    def __init__(
+        self,
+        repo: ports.Repository,
+        clock: time.Clock | None = None,
+        journal: EventJournal | None = None,
+        lane: str = "1",
+        bills: ports.BillLookup | None = None,
+    ):
         self.repo = repo
-        self._current_bill: model.Bill = model.Bill(items=[], total=0)
-        self._new_bill_required = True
+        # retained bills are looked up in bills, by default the repo when it has an index (InMemoryRepo)
+        if bills is None and isinstance(repo, ports.BillLookup):
+            bills = repo
+        self.bills = bills
+        self.lane = lane
+        self._clock = clock or time.clock
+        self._journal = journal
+        self._bill = projections.CurrentBill()
 
-    def _create_bill(self) -> None:
-        self._current_bill = model.Bill(items=[], total=0)
+    def _record(self, event: events.Event) -> None:
+        self._bill.apply(event)
+        if self._journal is not None:
+            self._journal.append(event)
 
-    def add_item(self, price: float, id_: str = "1", quantity: float = 1) -> None:
-        if self._new_bill_required:
-            self._create_bill()
-            self._new_bill_required = False
+    @timed("register_add_item_seconds")
+    def add_item(self, price: float, id_: str = "1", quantity: float = 1, confirmed: bool = False) -> None:
+        """
+        Adds an item to the open bill. Prices of MAX_PRICE or more are only
+        taken when the cashier ``confirmed`` them.
+        """
+        _check_value(price)
+        _check_value(quantity)
+        if price >= MAX_PRICE and not confirmed:
+            raise ValueError(f"Valor mayor a {MAX_PRICE} sin confirmar")
+        bill_id = self._bill.bill.id if self._bill.open else model.generate_uuid()
         item = model.Item(id=id_, price=price, quantity=quantity)
-        self._current_bill.add_item(item)
+        self._record(events.ItemAdded(lane=self.lane, day=self._clock.current_day, bill_id=bill_id, item=item))
 
     def remove_last_item(self) -> None:
-        self._current_bill.remove_last_item()
-
-    async def save_bill(self) -> None:
-        if self._new_bill_required:
-            return
-        daily_shift = await self.repo.get(app.commons.time.get_posix_time_until_day())
-        if daily_shift is None:
-            daily_shift = model.DailyShift(bills=[], total=0)
-        daily_shift.add_bill(self._current_bill)
+        # a saved bill is not changed anymore
+        if self._bill.open and self._bill.bill.items:
+            self._record(events.ItemRemoved(lane=self.lane, day=self._clock.current_day, bill_id=self._bill.bill.id))
+
+    async def _store(self, day_id: int, bill: model.Bill) -> None:
+        async with self.repo.day_lock(day_id):
+            daily_shift = await self.repo.get(day_id)
+            if daily_shift is None:
+                daily_shift = model.DailyShift(id=day_id, bills=[], total=0)
+            daily_shift.add_bill(bill)
+        # outside the lock: the other lanes add their bills while this one is
+        # written and InMemoryRepo stores them all in one write
         await self.repo.save(daily_shift=daily_shift)
-        self._new_bill_required = True
+        metrics.inc("register_bills_saved_total")
 
-    def get_current_bill(self) -> model.Bill | None:
-        if not self._current_bill:
+    @timed("register_save_bill_seconds")
+    async def save_bill(self) -> model.Bill | None:
+        """
+        Stores the current bill and returns it, None when there was nothing to save
+        """
+        if not self._bill.open:
+            return None
+        day_id = self._clock.current_day
+        bill = self._bill.bill
+        await self._store(day_id, bill)
+        self._record(events.BillSaved(lane=self.lane, day=day_id, bill=bill))
+        return bill
+
+    async def issue_credit_note(self, value: float) -> model.Bill:
+        """
+        Stores a credit note as a bill with one negative item; the bill being
+        typed in the lane stays open.
+        """
+        _check_value(value)
+        day_id = self._clock.current_day
+        bill = model.Bill(items=[model.Item(id="1", price=-value, quantity=1)], total=-value)
+        await self._store(day_id, bill)
+        self._record(events.CreditNoteIssued(lane=self.lane, day=day_id, bill=bill))
+        return bill
+
+    async def find_bill(self, bill_id: str) -> tuple[model.DailyShift, model.Bill, bool] | None:
+        """
+        Day and bill with that id, plus whether it was voided
+        """
+        if self.bills is None:
+            raise ValueError("No hay indice de facturas")
+        found = await self.bills.find_bill(bill_id)
+        if found is None:
             return None
-        return self._current_bill
+        daily_shift, bill = found
+        return daily_shift, bill, await self.bills.find_bill(VOID_PREFIX + bill_id) is not None
+
+    async def void_bill(self, bill_id: str) -> model.Bill:
+        """
+        Voids a retained bill with a credit note for its total, stored in
+        today's shift with id ``void-<bill id>`` so a bill is voided only once.
+        """
+        found = await self.find_bill(bill_id)
+        if found is None:
+            raise ValueError(f"Factura {bill_id} no encontrada")
+        _, bill, voided = found
+        if voided:
+            raise ValueError(f"La factura {bill_id} ya fue anulada")
+        if bill.total <= 0:
+            raise ValueError(f"La factura {bill_id} es una nota credito")
+        day_id = self._clock.current_day
+        credit_note = model.Bill(
+            id=VOID_PREFIX + bill_id, items=[model.Item(id="1", price=-bill.total, quantity=1)], total=-bill.total
+        )
+        await self._store(day_id, credit_note)
+        self._record(events.CreditNoteIssued(lane=self.lane, day=day_id, bill=credit_note))
+        return credit_note
+
+    def get_current_bill(self) -> model.Bill | None:
+        return self._bill.bill
 
     async def get_daily_shift(self) -> model.DailyShift:
-        daily_shift = await self.repo.get(time.get_posix_time_until_day())
+        day_id = self._clock.current_day
+        daily_shift = await self.repo.get(day_id)
         if not daily_shift:
-            daily_shift = model.DailyShift(bills=[], total=0)
+            daily_shift = model.DailyShift(id=day_id, bills=[], total=0)
         return daily_shift
+
+
+class Lanes:
+    """
+    Checkout lanes of one store: each lane is a Register with its own current
+    bill, all of them saving into the same repository.
+    """
+
+    def __init__(self, repo: ports.Repository, clock: time.Clock | None = None, journal: EventJournal | None = None):
+        self.repo = repo
+        self._clock = clock
+        self._journal = journal
+        self._registers: dict[str, Register] = {}
+
+    def get(self, lane_id: str) -> Register:
+        if lane_id not in self._registers:
+            self._registers[lane_id] = Register(repo=self.repo, clock=self._clock, journal=self._journal, lane=lane_id)
+        return self._registers[lane_id]
+
+    def ids(self) -> list[str]:
+        return sorted(self._registers)
@@ -1,30 +1,59 @@
+import os
+from typing import Any
+
 import boto3
 from boto3.dynamodb.conditions import Key
 
+from app.commons import time
 from app.reporter import utils
 from app.commons.logger import setup_console_logger
 
 # Use console-only logger for reporter app (no file logging)
 logger = setup_console_logger("reporter_logger")
 
+# "day" -> one item per day keyed by id, "bill" -> day/bill_id items plus a summary item per day
+TABLE_NAME = os.environ.get("DAILY_SHIFTS_TABLE", "daily_shifts")
+TABLE_LAYOUT = os.environ.get("DAILY_SHIFTS_LAYOUT", "day")
+SUMMARY_SORT_KEY = "#summary"
 
-def get_monthly_report() -> str | dict:
-    logger.info("Starting get_monthly_report")
-    first_day, last_day = utils.get_first_and_last_day_posix()
-    logger.info(f"Querying monthly report from {first_day} to {last_day}")
+
+def get_table() -> Any:
     client = boto3.resource("dynamodb")
-    table = client.Table("daily_shifts")
+    return client.Table(TABLE_NAME)
 
+
+def get_shift_summary(table, day: int) -> dict | None:  # type: ignore
+    if TABLE_LAYOUT == "bill":
+        response = table.get_item(Key={"day": day, "bill_id": SUMMARY_SORT_KEY})
+    else:
+        response = table.get_item(Key={"id": day})
+    item: dict | None = response.get("Item")
+    return item
+
+
+def get_shift_summaries(table, first_day: int, last_day: int) -> list:  # type: ignore
     # Use query operations for each day in the range instead of scan
     items = []
     current_day = first_day
     while current_day <= last_day:
-        response = table.query(
-            KeyConditionExpression=Key('id').eq(current_day)
-        )
+        if TABLE_LAYOUT == "bill":
+            response = table.query(
+                KeyConditionExpression=Key("day").eq(current_day) & Key("bill_id").eq(SUMMARY_SORT_KEY)
+            )
+        else:
+            response = table.query(KeyConditionExpression=Key("id").eq(current_day))
         if "Items" in response and response["Items"]:
             items.extend(response["Items"])
         current_day += 86400  # Add one day in seconds
+    return items
+
+
+def get_monthly_report(table=None) -> str | dict:  # type: ignore
+    logger.info("Starting get_monthly_report")
+    first_day, last_day = utils.get_first_and_last_day_posix()
+    logger.info(f"Querying monthly report from {first_day} to {last_day}")
+    table = table if table is not None else get_table()
+    items = get_shift_summaries(table, first_day, last_day)
 
     logger.info(f"Found {len(items)} items for monthly report")
     if not items:
@@ -41,19 +70,18 @@ def get_monthly_report() -> str | dict:
     return result
 
 
-def get_daily_report(params: dict | None) -> str | dict:
+def get_daily_report(params: dict | None, table=None) -> str | dict:  # type: ignore
     logger.info(f"Starting get_daily_report with params: {params}")
-    client = boto3.resource("dynamodb")
-    table = client.Table("daily_shifts")
+    table = table if table is not None else get_table()
     if not params:
         logger.info("Getting daily report for current day (no params provided)")
-        id_shift = utils.get_posix_time_until_day()
+        id_shift = time.get_posix_time_until_day()
         logger.info(f"Querying for shift ID: {id_shift}")
-        response = table.get_item(Key={"id": id_shift})
-        if "Item" not in response:
+        item = get_shift_summary(table, id_shift)
+        if item is None:
             logger.warning("No data found for current day")
             return "No data found"
-        response = response["Item"].get("total")
+        response = item.get("total")
         result = {
             "total": utils.SetMoneda(response),
             "max": None,
@@ -70,16 +98,7 @@ def get_daily_report(params: dict | None) -> str | dict:
     end_date_posix = utils.convert_to_posix(end_date)  # type: ignore
     logger.info(f"Converted to posix: {start_date_posix} to {end_date_posix}")
 
-    # Use query operations for each day in the range instead of scan
-    items = []
-    current_day = start_date_posix
-    while current_day <= end_date_posix:
-        response = table.query(
-            KeyConditionExpression=Key('id').eq(current_day)
-        )
-        if "Items" in response and response["Items"]:
-            items.extend(response["Items"])
-        current_day += 86400  # Add one day in seconds
+    items = get_shift_summaries(table, start_date_posix, end_date_posix)
 
     logger.info(f"Found {len(items)} items for date range report")
     if not items:
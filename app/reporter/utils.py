@@ -1,20 +1,6 @@
 from datetime import timezone, timedelta, datetime
 
 
-def get_posix_time_until_day() -> int:
-    # Define the Colombian time zone offset (UTC-5)
-    colombia_tz = timezone(timedelta(hours=-5))
-
-    # Get the current time in the Colombian time zone
-    current_time = datetime.now(colombia_tz)
-
-    # Create a new datetime with hours, minutes, and seconds set to zero
-    day_time = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
-
-    # Convert the datetime back to a POSIX timestamp
-    return int(day_time.timestamp())
-
-
 def convert_to_posix(date_str: str) -> int:
     # Define the date format
     date_format = "%d-%m-%Y"
@@ -0,0 +1,84 @@
+"""
+Register API over a Unix socket (TCP on Windows): N clients, one lane each,
+selling bills of a few items either waiting for every response
+(``sequential``) or sending a whole bill before waiting (``pipelined``).
+Reports bills per second and the latency of a bill seen by the client.
+
+    python -m benchmarks.bench_api [--clients 1 4 16] [--bills 200]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Iterator
+
+from app.register import adapters, usecases
+from app.register.entrypoints import api
+from benchmarks import report
+
+ITEMS_PER_BILL = 3
+PORT = 8765
+
+
+@contextlib.contextmanager
+def _workdir() -> Iterator[str]:
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            yield directory
+        finally:
+            os.chdir(cwd)
+
+
+async def _sell(client: api.RegisterClient, lane: str, bills: int, pipelined: bool, timings: list[float]) -> None:
+    for i in range(bills):
+        start = time.perf_counter()
+        if pipelined:
+            await asyncio.gather(
+                *(client.call("add_item", lane=lane, price=1000 + i) for _ in range(ITEMS_PER_BILL)),
+                client.call("save_bill", lane=lane),
+            )
+        else:
+            for _ in range(ITEMS_PER_BILL):
+                await client.call("add_item", lane=lane, price=1000 + i)
+            await client.call("save_bill", lane=lane)
+        timings.append(time.perf_counter() - start)
+
+
+async def _bench(clients: int, bills: int, pipelined: bool) -> dict:
+    path, port = ("register.sock", None) if sys.platform != "win32" else (None, PORT)
+    server = api.RegisterServer(usecases.Lanes(repo=adapters.InMemoryRepo()))
+    await server.start(path=path, port=port)
+    connections = [await api.RegisterClient.connect(path=path, port=port) for _ in range(clients)]
+    timings: list[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(*(_sell(client, str(lane), bills, pipelined, timings) for lane, client in enumerate(connections, 1)))
+    elapsed = time.perf_counter() - start
+    for client in connections:
+        await client.close()
+    await server.close()
+    return {"bills_per_s": round(clients * bills / elapsed, 1), "bill": report.latency_summary(timings)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--bills", type=int, default=200, help="bills per client")
+    args = parser.parse_args()
+
+    results = []
+    for clients in args.clients:
+        for mode in ("sequential", "pipelined"):
+            with _workdir():
+                results.append({"clients": clients, "mode": mode, **asyncio.run(_bench(clients, args.bills, mode == "pipelined"))})
+    print(json.dumps({"benchmark": "api", "environment": report.environment(), "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Daily totals of months of history: the columnar archive against loading the
+same days from JSON.
+
+    python -m benchmarks.bench_archive [--days 30 90 180] [--bills 1000]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Callable
+
+from app.register import archive, serialization
+from benchmarks import report, synthetic
+
+
+def _measure(func: Callable[[], dict[int, float]]) -> tuple[dict[int, float], float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def _json_totals(path: str) -> dict[int, float]:
+    with open(path, "rb") as file:
+        daily_shifts = serialization.load_daily_shifts(file.read())
+    return {day_id: sum(bill.total for bill in day.bills) for day_id, day in daily_shifts.items()}
+
+
+def _archive_totals(directory: str) -> dict[int, float]:
+    # opened cold, as the history command does
+    return {day_id: day["total"] for day_id, day in archive.DayArchive(directory).daily_totals().items()}
+
+
+def run(days_options: list[int], bills_per_day: int) -> list[dict]:
+    results = []
+    for days in days_options:
+        backlog = synthetic.make_backlog(days, bills_per_day, synthetic.FIRST_DAY + days * synthetic.DAY_SECONDS)
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = os.path.join(directory, "daily_shifts.json")
+            with open(json_path, "wb") as file:
+                file.write(serialization.dump_daily_shifts(backlog))
+            archive_dir = os.path.join(directory, "archive")
+            day_archive = archive.DayArchive(archive_dir)
+            start = time.perf_counter()
+            for daily_shift in backlog.values():
+                day_archive.append(daily_shift)
+            append_seconds = time.perf_counter() - start
+
+            json_totals, json_seconds, json_peak = _measure(lambda: _json_totals(json_path))
+            archive_totals, archive_seconds, archive_peak = _measure(lambda: _archive_totals(archive_dir))
+            assert json_totals.keys() == archive_totals.keys()
+            results.append(
+                {
+                    "days": days,
+                    "bills": days * bills_per_day,
+                    "json_bytes": os.path.getsize(json_path),
+                    "archive_bytes": sum(os.path.getsize(os.path.join(archive_dir, name)) for name in os.listdir(archive_dir)),
+                    "append_ms_per_day": round(append_seconds / days * 1000, 3),
+                    "json_ms": round(json_seconds * 1000, 1),
+                    "archive_ms": round(archive_seconds * 1000, 1),
+                    "json_peak_kb": json_peak // 1024,
+                    "archive_peak_kb": archive_peak // 1024,
+                    "numpy": archive.np is not None,
+                }
+            )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, nargs="+", default=[30, 90, 180])
+    parser.add_argument("--bills", type=int, default=1000)
+    args = parser.parse_args()
+    print(
+        json.dumps(
+            {"benchmark": "archive", "environment": report.environment(), "results": run(args.days, args.bills)},
+            indent=2,
+        )
+    )
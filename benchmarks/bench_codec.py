@@ -0,0 +1,37 @@
+"""
+Size and CPU trade-off of the compact day encoding against the JSON item.
+
+    python -m benchmarks.bench_codec
+"""
+
+import json
+
+from app.register import codec
+from benchmarks import report, synthetic
+
+BILLS_PER_DAY = (100, 1_000, 5_000)
+
+
+def run() -> list[dict]:
+    results = []
+    for bills_count in BILLS_PER_DAY:
+        daily_shift = synthetic.make_daily_shift(synthetic.FIRST_DAY, bills_count)
+        json_payload = json.dumps(daily_shift.model_dump()).encode()
+        payload = codec.encode_daily_shift(daily_shift)
+        results.append(
+            {
+                "bills": bills_count,
+                "json_bytes": len(json_payload),
+                "compressed_bytes": len(payload),
+                "ratio": round(len(json_payload) / len(payload), 2),
+                "json_encode_ms": round(report.best_of(lambda: json.dumps(daily_shift.model_dump())) * 1000, 3),
+                "encode_ms": round(report.best_of(lambda: codec.encode_daily_shift(daily_shift)) * 1000, 3),
+                "json_decode_ms": round(report.best_of(lambda: daily_shift.model_validate(json.loads(json_payload))) * 1000, 3),
+                "decode_ms": round(report.best_of(lambda: codec.decode_daily_shift(payload)) * 1000, 3),
+            }
+        )
+    return results
+
+
+if __name__ == "__main__":
+    print(json.dumps({"benchmark": "codec", "results": run()}, indent=2))
@@ -0,0 +1,207 @@
+"""
+Register and storage suite on synthetic high-volume shifts:
+
+- ``register``: add_item / save_bill latency with a current day of N bills
+- ``repo``: InMemoryRepo load (eager and lazy) and save of a day of N bills
+- ``lanes``: N checkout lanes saving bills at the same time into one
+  InMemoryRepo (saves are grouped into shared disk writes)
+- ``sync``: sync_bills of a backlog of unsynced days against the in-process
+  DynamoDB stand-in (day and bill layouts), then a sync with nothing new and
+  clean_daily_shifts
+
+    python -m benchmarks.bench_register [--bills 1000 10000 100000] [--days 1 10 60]
+        [--lanes 1 4 16] [--sync-bills 1000] [--output results.json]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import tempfile
+import time
+from typing import Iterator
+
+from app.commons import time as tm
+from app.register import adapters, serialization, usecases
+from app.register.entrypoints.cron import Sync
+from benchmarks import fakes, report, synthetic
+
+ITEMS_PER_BILL = 3
+
+
+@contextlib.contextmanager
+def _workdir() -> Iterator[str]:
+    # the repo and Sync keep their files in the working directory
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            yield directory
+        finally:
+            os.chdir(cwd)
+
+
+def _write_days(daily_shifts: dict) -> None:
+    with open("daily_shifts.json", "wb") as file:
+        file.write(serialization.dump_daily_shifts(daily_shifts))
+
+
+def _samples(bills: int) -> int:
+    # every save writes the whole day, keep big days to a few seconds
+    return max(10, min(200, 200_000 // bills))
+
+
+async def _bench_register(bills: int) -> dict:
+    current_day = tm.clock.current_day
+    _write_days({current_day: synthetic.make_daily_shift(current_day, bills)})
+    register = usecases.Register(repo=adapters.InMemoryRepo())
+    add_item, save_bill = [], []
+    for i in range(_samples(bills)):
+        for _ in range(ITEMS_PER_BILL):
+            start = time.perf_counter()
+            register.add_item(price=float(1000 + i))
+            add_item.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        await register.save_bill()
+        save_bill.append(time.perf_counter() - start)
+    return {"add_item": report.latency_summary(add_item), "save_bill": report.latency_summary(save_bill)}
+
+
+async def _bench_repo(bills: int) -> dict:
+    current_day = tm.clock.current_day
+    daily_shift = synthetic.make_daily_shift(current_day, bills)
+    _write_days({current_day: daily_shift})
+    rounds = max(3, _samples(bills) // 10)
+    load, lazy_load, save = [], [], []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        adapters.InMemoryRepo()
+        load.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        adapters.InMemoryRepo(lazy=True)
+        lazy_load.append(time.perf_counter() - start)
+    repo = adapters.InMemoryRepo()
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await repo.save(daily_shift)
+        save.append(time.perf_counter() - start)
+    return {
+        "load": report.latency_summary(load),
+        "lazy_load": report.latency_summary(lazy_load),
+        "save": report.latency_summary(save),
+    }
+
+
+async def _bench_lanes(lanes: int, bills: int) -> dict:
+    current_day = tm.clock.current_day
+    _write_days({current_day: synthetic.make_daily_shift(current_day, bills)})
+    repo = adapters.InMemoryRepo()
+    store = usecases.Lanes(repo=repo)
+    writes = 0
+    write_daily_shifts = repo._write_daily_shifts
+
+    def counting_write(*args, **kwargs) -> None:  # type: ignore
+        nonlocal writes
+        writes += 1
+        write_daily_shifts(*args, **kwargs)
+
+    repo._write_daily_shifts = counting_write  # type: ignore
+    rounds = _samples(bills)
+    save_bill: list[float] = []
+
+    async def lane(register: usecases.Register) -> None:
+        for i in range(rounds):
+            for _ in range(ITEMS_PER_BILL):
+                register.add_item(price=float(1000 + i))
+            start = time.perf_counter()
+            await register.save_bill()
+            save_bill.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(lane(store.get(str(lane_id))) for lane_id in range(lanes)))
+    elapsed = time.perf_counter() - start
+    return {
+        "save_bill": report.latency_summary(save_bill),
+        "bills_per_s": round(lanes * rounds / elapsed, 1),
+        "bills_per_write": round(lanes * rounds / writes, 1),
+    }
+
+
+def _build_db(layout: str) -> tuple[adapters.ports.Repository, fakes.FakeTable]:
+    if layout == "bill":
+        table = fakes.FakeTable(fakes.BILL_LAYOUT_KEYS)
+        return adapters.DynamoDbBills(table_name="", access_key="", secret_key="", table=table), table
+    table = fakes.FakeTable(fakes.DAY_LAYOUT_KEYS)
+    return adapters.DynamoDb(table_name="", access_key="", secret_key="", table=table), table
+
+
+async def _bench_sync(days: int, bills: int, layout: str) -> dict:
+    yesterday = tm.clock.current_day - synthetic.DAY_SECONDS
+    _write_days(synthetic.make_backlog(days, bills, last_day=yesterday))
+    db, table = _build_db(layout)
+    syncronizer = Sync(db=db, in_memory_repo=adapters.InMemoryRepo())
+
+    start = time.perf_counter()
+    await syncronizer.sync_bills()
+    first_sync = time.perf_counter() - start
+    requests = dict(table.requests)
+
+    start = time.perf_counter()
+    await syncronizer.sync_bills()
+    idle_sync = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await syncronizer.clean_daily_shifts()
+    clean = time.perf_counter() - start
+    return {
+        "sync_s": round(first_sync, 4),
+        "bills_per_s": round(days * bills / first_sync, 1),
+        "requests": requests,
+        "idle_sync_s": round(idle_sync, 4),
+        "clean_s": round(clean, 4),
+    }
+
+
+def run(bills_sizes: list[int], backlog_days: list[int], sync_bills: int, lanes_counts: list[int]) -> dict:
+    results: dict = {"register": [], "repo": [], "lanes": [], "sync": []}
+    for bills in bills_sizes:
+        with _workdir():
+            results["register"].append({"bills_in_day": bills, **asyncio.run(_bench_register(bills))})
+        with _workdir():
+            results["repo"].append({"bills_in_day": bills, **asyncio.run(_bench_repo(bills))})
+        for lanes in lanes_counts:
+            with _workdir():
+                results["lanes"].append({"bills_in_day": bills, "lanes": lanes, **asyncio.run(_bench_lanes(lanes, bills))})
+    for days in backlog_days:
+        for layout in ("day", "bill"):
+            with _workdir():
+                results["sync"].append(
+                    {"days": days, "bills_per_day": sync_bills, "layout": layout, **asyncio.run(_bench_sync(days, sync_bills, layout))}
+                )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bills", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--days", type=int, nargs="+", default=[1, 10, 60])
+    parser.add_argument("--lanes", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--sync-bills", type=int, default=1_000, help="bills per backlog day")
+    parser.add_argument("--output", help="also write the JSON to this file")
+    args = parser.parse_args()
+
+    result = {
+        "benchmark": "register",
+        "environment": report.environment(),
+        "results": run(args.bills, args.days, args.sync_bills, args.lanes),
+    }
+    output = json.dumps(result, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Keystroke to paint latency of the bill screen for growing bills: the old
+clear + reprint everything (clear spawns a process) against BillRenderer.
+
+    python -m benchmarks.bench_render
+"""
+
+import io
+import json
+import os
+import statistics
+import time
+
+from app.register import model
+from app.register.entrypoints.view import money_format
+from app.register.entrypoints.view.renderer import BillRenderer
+
+BILL_SIZES = (10, 100, 1_000)
+TERMINAL_ROWS = 40
+
+
+def _old_paint(out: io.StringIO):  # type: ignore
+    return lambda bill: _clear_and_reprint(bill, out)
+
+
+def _renderer_paint(out: io.StringIO):  # type: ignore
+    return BillRenderer(out=out, rows=TERMINAL_ROWS).render
+
+
+def _clear_and_reprint(bill: model.Bill, out: io.StringIO) -> None:
+    os.system("clear >/dev/null 2>&1" if os.name == "posix" else "cls >NUL")
+    out.write("+++++++++++++\nL I S T A  D E  P R O D U C T O S\n")
+    for item in bill.items:
+        out.write(money_format.SetMoneda(item.price) + "\n")  # type: ignore
+    out.write(f"Subtotal:  {money_format.SetMoneda(bill.get_total())}\n+++++++++++++\n")  # type: ignore
+
+
+def _measure(make_paint, items: int, samples: int) -> dict:  # type: ignore
+    out = io.StringIO()
+    paint = make_paint(out)
+    bill = model.Bill(items=[], total=0)
+    timings, written = [], []
+    for i in range(items):
+        bill.add_item(model.Item(id="1", price=float(1000 + i), quantity=1))
+        out.seek(0)
+        out.truncate()
+        if i >= items - samples:
+            start = time.perf_counter()
+            paint(bill)
+            timings.append(time.perf_counter() - start)
+            written.append(out.tell())
+        else:
+            paint(bill)
+    timings.sort()
+    return {
+        "p50_us": round(statistics.median(timings) * 1e6, 1),
+        "p99_us": round(timings[int(len(timings) * 0.99) - 1] * 1e6, 1),
+        "bytes_per_keystroke": int(statistics.mean(written)),
+    }
+
+
+def run(samples: int = 50) -> list[dict]:
+    results = []
+    for items in BILL_SIZES:
+        results.append(
+            {
+                "items": items,
+                "old": _measure(_old_paint, items, min(samples, items)),
+                "renderer": _measure(_renderer_paint, items, min(samples, items)),
+            }
+        )
+    return results
+
+
+if __name__ == "__main__":
+    print(json.dumps({"benchmark": "render", "terminal_rows": TERMINAL_ROWS, "results": run()}, indent=2))
@@ -0,0 +1,105 @@
+"""
+Reporter routes against the DynamoDB stand-in seeded with a synthetic year
+of shifts (through the register adapters, so items look like the synced
+ones). For each layout, route and range size it reports latency, table
+calls and read units consumed (eventually consistent, 4 KB per unit).
+
+    python -m benchmarks.bench_reporter [--days 365] [--bills 300] [--latency-ms 0] [--layout day bill]
+"""
+
+import argparse
+import asyncio
+import datetime
+import functools
+import json
+import logging
+import time
+from typing import Callable
+
+from app.commons import time as tm
+from app.register import adapters, ports
+from app.reporter import usecases
+from benchmarks import fakes, report, synthetic
+
+RANGES = (1, 7, 30, 90, 365)
+ROUNDS = 5
+
+
+def _date(day_id: int) -> str:
+    return datetime.datetime.fromtimestamp(day_id, tm.COLOMBIA_TZ).strftime("%d-%m-%Y")
+
+
+async def _seed(db: ports.Repository, days: int, bills: int, last_day: int) -> None:
+    for daily_shift in synthetic.make_backlog(days, bills, last_day=last_day).values():
+        await db.save(daily_shift)
+
+
+def _build_table(layout: str, days: int, bills: int, last_day: int) -> fakes.FakeTable:
+    if layout == "bill":
+        table = fakes.FakeTable(fakes.BILL_LAYOUT_KEYS)
+        db: ports.Repository = adapters.DynamoDbBills(table_name="", access_key="", secret_key="", table=table)
+    else:
+        table = fakes.FakeTable(fakes.DAY_LAYOUT_KEYS)
+        db = adapters.DynamoDb(table_name="", access_key="", secret_key="", table=table)
+    asyncio.run(_seed(db, days, bills, last_day))
+    return table
+
+
+def _measure(table: fakes.FakeTable, call) -> dict:  # type: ignore
+    timings = []
+    table.requests.clear()
+    table.read_units = 0.0
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    return {
+        **report.latency_summary(timings),
+        "calls": {operation: count // ROUNDS for operation, count in table.requests.items()},
+        "read_units": table.read_units / ROUNDS,
+    }
+
+
+def run(layouts: list[str], days: int, bills: int, latency_ms: float) -> list[dict]:
+    today = tm.clock.current_day
+    results = []
+    for layout in layouts:
+        table = _build_table(layout, days, bills, last_day=today)
+        table.latency = latency_ms / 1000
+        usecases.TABLE_LAYOUT = layout
+        routes: dict[str, Callable[[], str | dict]] = {
+            "daily_today": lambda: usecases.get_daily_report(None, table=table),
+            "monthly": lambda: usecases.get_monthly_report(table=table),
+        }
+        for range_days in (range_days for range_days in RANGES if range_days <= days):
+            params = {
+                "start-date": _date(today - (range_days - 1) * synthetic.DAY_SECONDS),
+                "end-date": _date(today),
+            }
+            routes[f"daily_range_{range_days}"] = functools.partial(usecases.get_daily_report, params, table=table)
+        for route, call in routes.items():
+            results.append({"layout": layout, "route": route, **_measure(table, call)})
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--bills", type=int, default=300, help="bills per day")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="simulated latency per table call")
+    parser.add_argument("--layout", nargs="+", choices=["day", "bill"], default=["day", "bill"])
+    args = parser.parse_args()
+
+    # the reporter logs every step at INFO to the console
+    usecases.logger.setLevel(logging.WARNING)
+    result = {
+        "benchmark": "reporter",
+        "environment": report.environment(),
+        "seed": {"days": args.days, "bills_per_day": args.bills},
+        "results": run(args.layout, args.days, args.bills, args.latency_ms),
+    }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Load and save throughput of daily_shifts.json: the old dict + json path,
+the pydantic-core bytes path and the trusted (checksum matched) path.
+
+    python -m benchmarks.bench_serialization
+"""
+
+import json
+import os
+import tempfile
+
+from app.register import adapters, model, serialization
+from benchmarks import report, synthetic
+
+BILLS_PER_DAY = (1_000, 10_000)
+DAYS = 3
+
+
+def _legacy_dump(daily_shifts: dict[int, model.DailyShift]) -> str:
+    return json.dumps({k: v.model_dump() for k, v in daily_shifts.items()})
+
+
+def _legacy_load(data: str) -> dict[int, model.DailyShift]:
+    return {int(k): model.DailyShift.model_validate(v) for k, v in json.loads(data).items()}
+
+
+def run() -> list[dict]:
+    results = []
+    for bills_count in BILLS_PER_DAY:
+        daily_shifts = {
+            day_id: synthetic.make_daily_shift(day_id, bills_count)
+            for day_id in range(synthetic.FIRST_DAY, synthetic.FIRST_DAY + DAYS * synthetic.DAY_SECONDS, synthetic.DAY_SECONDS)
+        }
+        total_bills = bills_count * DAYS
+        data = serialization.dump_daily_shifts(daily_shifts)
+        legacy_data = _legacy_dump(daily_shifts)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path_file = os.path.join(directory, "daily_shifts.json")
+            with open(path_file, "wb") as file:
+                file.write(data)
+            repo = adapters.InMemoryRepo(path_file=path_file, hot_days=DAYS, segments_dir=directory)
+            trusted_load = report.best_of(repo.read_stored_days)
+
+        timings = {
+            "legacy_save": report.best_of(lambda: _legacy_dump(daily_shifts)),
+            "save": report.best_of(lambda: serialization.dump_daily_shifts(daily_shifts)),
+            "legacy_load": report.best_of(lambda: _legacy_load(legacy_data)),
+            "load": report.best_of(lambda: serialization.load_daily_shifts(data)),
+            "trusted_load": trusted_load,
+        }
+        results.append(
+            {
+                "bills": total_bills,
+                **{f"{name}_ms": round(seconds * 1000, 2) for name, seconds in timings.items()},
+                **{f"{name}_bills_per_s": int(total_bills / seconds) for name, seconds in timings.items()},
+            }
+        )
+    return results
+
+
+if __name__ == "__main__":
+    print(json.dumps({"benchmark": "serialization", "results": run()}, indent=2))
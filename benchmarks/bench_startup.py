@@ -0,0 +1,82 @@
+"""
+Time from process start to the first cashier prompt (first ``ainput`` call).
+
+Each run starts a fresh interpreter in a temporary working directory seeded
+with a synthetic ``daily_shifts.json``.
+
+    python -m benchmarks.bench_startup [--days 3] [--bills 2000] [--max-ms 1500]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from app.register import model
+from benchmarks import synthetic
+
+CHILD = """
+import time
+started = time.perf_counter()
+import asyncio, json, os
+import aioconsole
+
+async def first_prompt(*args, **kwargs):
+    print(json.dumps({"first_prompt_ms": (time.perf_counter() - started) * 1000}), flush=True)
+    os._exit(0)
+
+aioconsole.ainput = first_prompt
+from app.register import main
+asyncio.run(main.start_app())
+"""
+
+CHILD_ENV = {
+    "AWS_ACCESS_KEY_ID": "benchmark",
+    "AWS_SECRET_ACCESS_KEY": "benchmark",
+    "TIME_TO_SYNC": "3600",
+    "TIME_TO_CLEAN": "3600",
+}
+
+
+def _seed(directory: str, days: int, bills: int) -> None:
+    current_day = model.DailyShift(bills=[], total=0).id
+    daily_shifts = {
+        day_id: synthetic.make_daily_shift(day_id, bills).model_dump()
+        for day_id in range(current_day - (days - 1) * synthetic.DAY_SECONDS, current_day + 1, synthetic.DAY_SECONDS)
+    }
+    with open(os.path.join(directory, "daily_shifts.json"), "w") as file:
+        json.dump(daily_shifts, file)
+
+
+def run(days: int, bills: int, rounds: int) -> dict:
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {**os.environ, **CHILD_ENV, "PYTHONPATH": project_root}
+    timings = []
+    for _ in range(rounds):
+        with tempfile.TemporaryDirectory() as directory:
+            _seed(directory, days, bills)
+            output = subprocess.run(
+                [sys.executable, "-c", CHILD], cwd=directory, env=env, capture_output=True, text=True, check=True
+            ).stdout
+            timings.append(json.loads(output.strip().splitlines()[-1])["first_prompt_ms"])
+    return {
+        "benchmark": "startup",
+        "days": days,
+        "bills_per_day": bills,
+        "first_prompt_ms": {"min": round(min(timings), 1), "max": round(max(timings), 1)},
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=3)
+    parser.add_argument("--bills", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=None, help="fail when the best run is slower than this")
+    args = parser.parse_args()
+    result = run(args.days, args.bills, args.rounds)
+    print(json.dumps(result, indent=2))
+    if args.max_ms is not None and result["first_prompt_ms"]["min"] > args.max_ms:
+        sys.exit(f"startup regression: {result['first_prompt_ms']['min']} ms > {args.max_ms} ms")
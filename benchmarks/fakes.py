@@ -0,0 +1,245 @@
+"""
+In-process stand-ins for the benchmarks (and the tests that run them): a DynamoDB table with the subset of
+the boto3 Table API the adapters use, with optional fault injection.
+"""
+
+import bisect
+import dataclasses
+import random
+import threading
+import time
+from decimal import Decimal
+from typing import Any, Callable
+
+DAY_LAYOUT_KEYS = ("id",)
+BILL_LAYOUT_KEYS = ("day", "bill_id")
+# DynamoDB returns at most 1 MB per query page, here a page is a number of items
+QUERY_PAGE_SIZE = 1_000
+MAX_ITEM_BYTES = 400 * 1024
+
+
+class FakeClientError(Exception):
+    """
+    Same ``response`` shape as botocore's ClientError
+    """
+
+    def __init__(self, code: str, message: str = "") -> None:
+        super().__init__(f"{code}: {message}")
+        self.response = {"Error": {"Code": code, "Message": message}}
+
+
+@dataclasses.dataclass
+class Faults:
+    """
+    What goes wrong with the table. Draws come from one seeded generator, so
+    a run is reproducible as long as requests arrive in the same order (use
+    one writer thread when batch failures are on).
+    """
+
+    # every request fails as if the network was down
+    offline: bool = False
+    # share of requests rejected with ProvisionedThroughputExceededException
+    throttle_rate: float = 0.0
+    # share of 25 item batch requests that fail after the previous ones were stored
+    batch_failure_rate: float = 0.0
+    # seconds per request, drawn from the generator
+    latency: Callable[[random.Random], float] | None = None
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        self.rng = random.Random(self.seed)
+
+
+def lognormal_latency(median_s: float, sigma: float = 0.5) -> Callable[[random.Random], float]:
+    # long tailed, like real request latencies
+    return lambda rng: rng.lognormvariate(0, sigma) * median_s
+
+
+def item_size(value: Any) -> int:
+    """
+    Approximate DynamoDB item size: names plus values, numbers as their digits
+    """
+    if isinstance(value, dict):
+        return sum(len(str(name)) + item_size(attribute) for name, attribute in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(item_size(attribute) for attribute in value) + 3
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode())
+    if isinstance(value, (int, float, Decimal)):
+        return len(str(value))
+    return len(getattr(value, "value", b"")) or 1
+
+
+def _key_equalities(condition: Any) -> dict[str, Any]:
+    # Key("day").eq(day) & Key("bill_id").eq(...) -> {"day": day, "bill_id": ...}
+    if condition.expression_operator == "AND":
+        return {**_key_equalities(condition._values[0]), **_key_equalities(condition._values[1])}
+    key, value = condition._values
+    return {key.name: value}
+
+
+def read_units(size: int, consistent: bool = False) -> float:
+    # 4 KB per read unit, eventually consistent reads cost half
+    units = -(-max(size, 1) // 4096)
+    return float(units) if consistent else units / 2
+
+
+def _project(item: dict, projection: str | None, names: dict[str, str] | None) -> dict:
+    if not projection:
+        return item
+    attributes = [(names or {}).get(name.strip(), name.strip()) for name in projection.split(",")]
+    return {name: item[name] for name in attributes if name in item}
+
+
+class FakeBatchWriter:
+    def __init__(self, table: "FakeTable") -> None:
+        self._table = table
+        self._items: list[dict] = []
+
+    def __enter__(self) -> "FakeBatchWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        # boto3 sends up to 25 items per BatchWriteItem request
+        for start in range(0, len(self._items), 25):
+            self._table._request("batch_write_item", batch=True)
+            for item in self._items[start : start + 25]:
+                self._table._store(item)
+
+    def put_item(self, Item: dict) -> None:
+        self._items.append(Item)
+
+
+class FakeTable:
+    """
+    Items live in a dict keyed by their primary key. ``latency`` seconds are
+    slept per request (the adapters call the table from worker threads, like
+    boto3) and ``requests`` counts the calls per operation. With ``sleep``
+    off the latency is only added to ``elapsed``, for simulations on a fake
+    clock. Items bigger than 400 KB are rejected like DynamoDB does.
+    """
+
+    def __init__(
+        self,
+        key_schema: tuple[str, ...] = DAY_LAYOUT_KEYS,
+        latency: float = 0.0,
+        faults: Faults | None = None,
+        sleep: bool = True,
+    ) -> None:
+        self.key_schema = key_schema
+        self.latency = latency
+        self.faults = faults or Faults()
+        self.sleep = sleep
+        self.items: dict[tuple, dict] = {}
+        # item sizes, computed once when stored
+        self._sizes: dict[tuple, int] = {}
+        self.requests: dict[str, int] = {}
+        self.errors: dict[str, int] = {}
+        self.bytes_written = 0
+        self.read_units = 0.0
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+        # sorted primary keys per partition key value, rebuilt after writes
+        self._partitions: dict[Any, list[tuple]] = {}
+        self._dirty_partitions: set[Any] = set()
+
+    def _request(self, operation: str, batch: bool = False) -> None:
+        faults = self.faults
+        with self._lock:
+            self.requests[operation] = self.requests.get(operation, 0) + 1
+            latency = faults.latency(faults.rng) if faults.latency else self.latency
+            error = None
+            if faults.offline:
+                error = "EndpointConnectionError"
+            elif faults.throttle_rate and faults.rng.random() < faults.throttle_rate:
+                error = "ProvisionedThroughputExceededException"
+            elif batch and faults.batch_failure_rate and faults.rng.random() < faults.batch_failure_rate:
+                error = "InternalServerError"
+            if error:
+                self.errors[error] = self.errors.get(error, 0) + 1
+            if not self.sleep:
+                self.elapsed += latency
+        if latency and self.sleep:
+            time.sleep(latency)
+        if error:
+            raise FakeClientError(error, f"{operation} failed")
+
+    def _key(self, item: dict) -> tuple:
+        return tuple(item[name] for name in self.key_schema)
+
+    def _store(self, item: dict) -> None:
+        key = self._key(item)
+        size = item_size(item)
+        if size > MAX_ITEM_BYTES:
+            raise FakeClientError("ValidationException", "Item size has exceeded the maximum allowed size")
+        with self._lock:
+            self.bytes_written += size
+            self._sizes[key] = size
+            if key not in self.items:
+                self._partitions.setdefault(key[0], []).append(key)
+                self._dirty_partitions.add(key[0])
+            self.items[key] = item
+
+    def _partition_keys(self, value: Any) -> list[tuple]:
+        with self._lock:
+            keys = self._partitions.get(value, [])
+            if value in self._dirty_partitions:
+                keys.sort()
+                self._dirty_partitions.discard(value)
+            return keys
+
+    def put_item(self, Item: dict, **kwargs: Any) -> dict:
+        self._request("put_item")
+        self._store(Item)
+        return {}
+
+    def get_item(
+        self,
+        Key: dict,
+        ProjectionExpression: str | None = None,
+        ExpressionAttributeNames: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> dict:
+        self._request("get_item")
+        item = self.items.get(self._key(Key))
+        consistent = kwargs.get("ConsistentRead", False)
+        if item is None:
+            self.read_units += read_units(0, consistent)
+            return {}
+        self.read_units += read_units(self._sizes[self._key(Key)], consistent)
+        return {"Item": _project(item, ProjectionExpression, ExpressionAttributeNames)}
+
+    def query(
+        self,
+        KeyConditionExpression: Any,
+        ProjectionExpression: str | None = None,
+        ExpressionAttributeNames: dict[str, str] | None = None,
+        ExclusiveStartKey: dict | None = None,
+        **kwargs: Any,
+    ) -> dict:
+        """
+        Only equality conditions on the partition key (and the sort key)
+        """
+        self._request("query")
+        equalities = _key_equalities(KeyConditionExpression)
+        keys = self._partition_keys(equalities[self.key_schema[0]])
+        if len(self.key_schema) > 1 and self.key_schema[1] in equalities:
+            key = (equalities[self.key_schema[0]], equalities[self.key_schema[1]])
+            keys = [key] if key in self.items else []
+        start = 0 if ExclusiveStartKey is None else bisect.bisect_right(keys, self._key(ExclusiveStartKey))
+        page = keys[start : start + QUERY_PAGE_SIZE]
+        # a query is charged for the items it reads, before the projection
+        self.read_units += read_units(sum(self._sizes[key] for key in page), kwargs.get("ConsistentRead", False))
+        response: dict[str, Any] = {"Items": [_project(self.items[key], ProjectionExpression, ExpressionAttributeNames) for key in page]}
+        if start + QUERY_PAGE_SIZE < len(keys):
+            response["LastEvaluatedKey"] = dict(zip(self.key_schema, page[-1]))
+        return response
+
+    def batch_writer(self, **kwargs: Any) -> FakeBatchWriter:
+        return FakeBatchWriter(self)
+
+    def scan(self, **kwargs: Any) -> dict:
+        self._request("scan")
+        return {"Items": list(self.items.values())}
@@ -0,0 +1,269 @@
+"""
+Replays a cashier session (recorded with RECORD_SESSION_FILE, or synthetic)
+against the register while Sync runs against the DynamoDB stand-in, and
+reports sustained bills per second plus the latency of every command kind.
+
+- ``--target view`` feeds the commands to ``start_view`` (rendering and
+  screens included, output discarded); ``--target register`` calls
+  ``usecases.Register`` directly.
+- ``--pace fast`` sends the next command as soon as the previous one is done;
+  ``cashier`` and ``scanner`` wait typical human / barcode scanner gaps;
+  ``recorded`` uses the gaps of the session file. ``--speed`` divides the
+  gaps. When the register cannot keep up, ``lateness`` grows.
+- A background sync starts every ``len(commands) / --syncs`` commands, so a
+  run syncs the same number of times at any pace.
+
+    python -m benchmarks.replay_session [--bills 2000] [--script session.txt]
+        [--target view|register] [--pace fast|cashier|scanner|recorded] [--speed 1] [--syncs 20]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import random
+import tempfile
+import time
+from typing import Iterator
+
+from app.register import adapters, usecases
+from app.register.entrypoints.cron import Sync
+from app.register.entrypoints.view import printing, session, view
+from app.register.entrypoints.view.renderer import BillRenderer
+from app.register.entrypoints.view.sales import SalesScreen
+from benchmarks import fakes, report
+
+# seconds before each command kind
+PACES = {
+    "fast": {},
+    "cashier": {"item": 1.2, "enter": 2.0, "b": 1.0, "nt": 2.0, "nt_value": 2.0, "t": 1.5, "s": 1.5},
+    "scanner": {"item": 0.25, "enter": 1.0, "b": 0.5, "nt": 1.5, "nt_value": 1.5, "t": 1.0, "s": 1.0},
+}
+
+
+def command_kind(command: str, previous: str | None) -> str:
+    if previous == "nt":
+        return "nt_value"
+    if command.isdigit():
+        return "item"
+    if command == "":
+        return "enter"
+    return {"sync": "s", "-": "t"}.get(command, command)
+
+
+def synthetic_script(bills: int, seed: int = 0) -> list[str]:
+    """
+    Bills of 1-6 items with some corrections (b), credit notes (nt) and
+    cashiers looking at the sales (t) and forcing a sync (s)
+    """
+    rng = random.Random(seed)
+    commands: list[str] = []
+    for bill in range(1, bills + 1):
+        if rng.random() < 0.02:
+            commands += ["nt", str(rng.randrange(500, 20_000, 100))]
+            continue
+        for _ in range(rng.randint(1, 6)):
+            commands.append(str(rng.randrange(500, 150_000, 100)))
+            if rng.random() < 0.05:
+                commands += ["b", str(rng.randrange(500, 150_000, 100))]
+        commands.append("")
+        if bill % 50 == 0:
+            commands.append("t")
+        if bill % 100 == 0:
+            commands.append("s")
+    return commands
+
+
+def load_script(path: str) -> tuple[list[str], list[float | None]]:
+    with open(path, encoding="utf-8") as file:
+        lines = [session.parse_session_line(line) for line in file]
+    return [command for _, command in lines], [delay for delay, _ in lines]
+
+
+class Feeder:
+    """
+    ``read_command`` for start_view: hands out the script at the given pace
+    and times each command until the view asks for the next one.
+    """
+
+    def __init__(self, commands: list[str], delays: list[float], sync_every: int = 0) -> None:
+        self.commands = commands
+        self.delays = delays
+        self.latencies: dict[str, list[float]] = {}
+        self.lateness: list[float] = []
+        self.finished = asyncio.Event()
+        # set every sync_every commands for the background sync
+        self.sync_due = asyncio.Event()
+        self._sync_every = sync_every
+        self._index = 0
+        self._issued: tuple[str, float] | None = None
+        self._previous: str | None = None
+        self._schedule = time.perf_counter()
+
+    def _done(self) -> None:
+        now = time.perf_counter()
+        if self._issued is not None:
+            kind, issued_at = self._issued
+            self.latencies.setdefault(kind, []).append(now - issued_at)
+            self._issued = None
+
+    async def next_command(self) -> str | None:
+        self._done()
+        if self._index == len(self.commands):
+            return None
+        command = self.commands[self._index]
+        self._schedule += self.delays[self._index]
+        self._index += 1
+        if self._sync_every and self._index % self._sync_every == 0:
+            self.sync_due.set()
+        wait = self._schedule - time.perf_counter()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        now = time.perf_counter()
+        self.lateness.append(max(now - self._schedule, 0.0))
+        self._issued = (command_kind(command, self._previous), now)
+        self._previous = command
+        return command
+
+    async def read_command(self, prompt: str) -> str:
+        command = await self.next_command()
+        if command is None:
+            self.finished.set()
+            # start_view is cancelled by the driver
+            await asyncio.Future()
+        return command  # type: ignore
+
+
+async def _run_view(feeder: Feeder, register: usecases.Register, syncronizer: Sync) -> None:
+    out = io.StringIO()
+    task = asyncio.get_running_loop().create_task(
+        view.start_view(
+            register,
+            syncronizer=syncronizer,
+            renderer=BillRenderer(out=out, rows=40),
+            sales_screen=SalesScreen(out=out, rows=40),
+            spooler=printing.PrintSpooler(printing.FileBackend(os.devnull)),
+            read_command=feeder.read_command,
+        )
+    )
+    with contextlib.redirect_stdout(out):
+        await feeder.finished.wait()
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+
+
+async def _run_register(feeder: Feeder, register: usecases.Register, syncronizer: Sync) -> None:
+    previous = None
+    while (command := await feeder.next_command()) is not None:
+        if previous == "nt":
+            await register.issue_credit_note(float(command))
+        elif command.isdigit():
+            register.add_item(price=float(command))
+        elif command == "b":
+            register.remove_last_item()
+        elif command == "":
+            await register.save_bill()
+        elif command in ("t", "-"):
+            await register.get_daily_shift()
+        elif command in ("s", "sync"):
+            await syncronizer.sync_bills()
+        previous = command
+
+
+async def _background_sync(syncronizer: Sync, feeder: Feeder, durations: list[float]) -> None:
+    while True:
+        await feeder.sync_due.wait()
+        feeder.sync_due.clear()
+        started = time.perf_counter()
+        await syncronizer.sync_bills()
+        durations.append(time.perf_counter() - started)
+
+
+@contextlib.contextmanager
+def _workdir() -> Iterator[None]:
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            yield
+        finally:
+            os.chdir(cwd)
+
+
+async def replay(
+    commands: list[str],
+    delays: list[float],
+    target: str = "view",
+    syncs: int = 20,
+    dynamo_latency_ms: float = 20.0,
+) -> dict:
+    table = fakes.FakeTable(latency=dynamo_latency_ms / 1000)
+    db = adapters.DynamoDb(table_name="", access_key="", secret_key="", table=table)
+    in_memory_repo = adapters.InMemoryRepo()
+    register = usecases.Register(repo=in_memory_repo)
+    syncronizer = Sync(db=db, in_memory_repo=in_memory_repo)
+    feeder = Feeder(commands, delays, sync_every=max(len(commands) // syncs, 1) if syncs else 0)
+    sync_durations: list[float] = []
+    sync_task = asyncio.get_running_loop().create_task(_background_sync(syncronizer, feeder, sync_durations))
+    started = time.perf_counter()
+    try:
+        await (_run_view if target == "view" else _run_register)(feeder, register, syncronizer)
+    finally:
+        sync_task.cancel()
+    elapsed = time.perf_counter() - started
+    bills = len(feeder.latencies.get("enter", [])) + len(feeder.latencies.get("nt_value", []))
+    return {
+        "commands": len(commands),
+        "bills": bills,
+        "elapsed_s": round(elapsed, 3),
+        "bills_per_s": round(bills / elapsed, 1),
+        "latency": {kind: report.latency_summary(timings) for kind, timings in sorted(feeder.latencies.items())},
+        "lateness_s": report.percentiles(feeder.lateness or [0.0]),
+        "background_syncs": len(sync_durations),
+        "background_sync_s": report.percentiles(sync_durations or [0.0]),
+        "dynamo_requests": dict(table.requests),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--script", help="session file, default a synthetic session")
+    parser.add_argument("--bills", type=int, default=2_000, help="bills of the synthetic session")
+    parser.add_argument("--target", choices=["view", "register"], default="view")
+    parser.add_argument("--pace", choices=[*PACES, "recorded"], default="fast")
+    parser.add_argument("--speed", type=float, default=1.0, help="divides the gaps between commands")
+    parser.add_argument("--syncs", type=int, default=20, help="background syncs spread over the session")
+    parser.add_argument("--dynamo-latency-ms", type=float, default=20.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.script:
+        commands, recorded = load_script(args.script)
+    else:
+        commands, recorded = synthetic_script(args.bills, args.seed), []
+    if args.pace == "recorded":
+        delays = [(delay or 0.0) / args.speed for delay in recorded]
+    else:
+        gaps, previous, delays = PACES[args.pace], None, []
+        for command in commands:
+            delays.append(gaps.get(command_kind(command, previous), 0.0) / args.speed)
+            previous = command
+
+    with _workdir():
+        result = asyncio.run(replay(commands, delays, args.target, args.syncs, args.dynamo_latency_ms))
+    output = {
+        "benchmark": "replay_session",
+        "environment": report.environment(),
+        "target": args.target,
+        "pace": args.pace,
+        "speed": args.speed,
+        **result,
+    }
+    print(json.dumps(output, indent=2))
+
+
+if __name__ == "__main__":
+    main()
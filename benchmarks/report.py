@@ -0,0 +1,58 @@
+"""
+Helpers to report benchmark results as JSON.
+"""
+
+import platform
+import statistics
+import subprocess
+import time
+from typing import Any, Callable
+
+
+def percentiles(values: list[float], digits: int = 4) -> dict:
+    """
+    p50/p95/p99/max of values, in their own unit
+    """
+    ordered = sorted(values)
+
+    def percentile(q: float) -> float:
+        return round(ordered[min(int(len(ordered) * q), len(ordered) - 1)], digits)
+
+    return {"p50": percentile(0.50), "p95": percentile(0.95), "p99": percentile(0.99), "max": round(ordered[-1], digits)}
+
+
+def best_of(func: Callable[[], Any], rounds: int = 5) -> float:
+    """
+    Fastest of rounds calls of func, in seconds
+    """
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def latency_summary(timings: list[float]) -> dict:
+    """
+    Percentiles in milliseconds and calls per second of a list of durations
+    in seconds
+    """
+    total = sum(timings)
+    return {
+        "samples": len(timings),
+        **{f"{name}_ms": value for name, value in percentiles([timing * 1000 for timing in timings]).items()},
+        "ops_per_s": round(len(timings) / total, 1) if total else None,
+        "mean_ms": round(statistics.mean(timings) * 1000, 4),
+    }
+
+
+def environment() -> dict:
+    """
+    What the numbers were measured on, to compare runs between versions
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {"commit": commit, "python": platform.python_version(), "machine": platform.machine()}
@@ -0,0 +1,241 @@
+"""
+Deterministic simulation of the register and Sync on a fake clock, against
+the DynamoDB stand-in with fault injection (network outages, flapping,
+throttling, partial batch failures, latency). Days of trading run in
+seconds and the report shows:
+
+- ``lag_s``: time from a bill being saved to it being stored in DynamoDB
+- ``write_amplification``: bytes written to DynamoDB per byte of bill data
+- ``recovery_s``: time from the end of each outage until every bill saved
+  before it is stored
+
+    python -m benchmarks.simulate_sync [--scenario week_offline flapping] [--layout day|bill]
+"""
+
+import argparse
+import asyncio
+import collections
+import contextlib
+import dataclasses
+import json
+import logging
+import os
+import random
+import tempfile
+import time
+from typing import Iterator
+
+from app.commons import time as tm
+from app.register import adapters, ports, usecases
+from app.register.entrypoints.cron import Sync
+from benchmarks import fakes, report, synthetic
+
+DAY = synthetic.DAY_SECONDS
+
+
+@dataclasses.dataclass
+class Scenario:
+    name: str
+    days: int = 3
+    bills_per_hour: int = 30
+    # local opening and closing hour
+    opening_hours: tuple[int, int] = (8, 20)
+    sync_interval: int = 300
+    clean_interval: int = 3600
+    layout: str = "day"
+    # (start, end) seconds from the start of the simulation without network
+    outages: list[tuple[int, int]] = dataclasses.field(default_factory=list)
+    # probability of the network being down at a sync tick
+    flapping: float = 0.0
+    throttle_rate: float = 0.0
+    batch_failure_rate: float = 0.0
+    median_latency_ms: float = 20.0
+    seed: int = 0
+
+
+SCENARIOS = {
+    "baseline": Scenario("baseline"),
+    "week_offline": Scenario("week_offline", days=9, outages=[(DAY, 8 * DAY)]),
+    "flapping": Scenario("flapping", days=3, flapping=0.5, throttle_rate=0.05, batch_failure_rate=0.05),
+}
+
+
+@contextlib.contextmanager
+def _simulation(start_time: float) -> Iterator[tm.ManualClock]:
+    clock = tm.ManualClock(start_time)
+    app_logger = logging.getLogger("app_logger")
+    previous_level = app_logger.level
+    # failed syncs are expected here, keep them off the console
+    app_logger.setLevel(logging.CRITICAL)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            yield clock
+        finally:
+            os.chdir(cwd)
+            app_logger.setLevel(previous_level)
+
+
+def _build_db(scenario: Scenario) -> tuple[ports.Repository, fakes.FakeTable]:
+    faults = fakes.Faults(
+        throttle_rate=scenario.throttle_rate,
+        batch_failure_rate=scenario.batch_failure_rate,
+        latency=fakes.lognormal_latency(scenario.median_latency_ms / 1000),
+        seed=scenario.seed,
+    )
+    if scenario.layout == "bill":
+        table = fakes.FakeTable(fakes.BILL_LAYOUT_KEYS, faults=faults, sleep=False)
+        # one writer thread keeps the fault draws in a reproducible order
+        db = adapters.DynamoDbBills(table_name="", access_key="", secret_key="", max_parallel_writes=1, table=table)
+        return db, table
+    table = fakes.FakeTable(fakes.DAY_LAYOUT_KEYS, faults=faults, sleep=False)
+    return adapters.DynamoDb(table_name="", access_key="", secret_key="", table=table), table
+
+
+def _stored_bills(table: fakes.FakeTable, layout: str, day_id: int) -> int:
+    if layout == "bill":
+        keys = table._partition_keys(day_id)
+        return len(keys) - ((day_id, adapters.SUMMARY_SORT_KEY) in table.items)
+    item = table.items.get((day_id,))
+    if item is None:
+        return 0
+    return int(item["bills_count"]) if "bills_count" in item else len(item["bills"])
+
+
+class Simulation:
+    def __init__(self, scenario: Scenario, clock: tm.ManualClock) -> None:
+        self.scenario = scenario
+        self.clock = clock
+        self.start = clock.time
+        self.rng = random.Random(scenario.seed)
+        self.repo = adapters.InMemoryRepo(clock=clock)
+        self.register = usecases.Register(repo=self.repo, clock=clock)
+        self.db, self.table = _build_db(scenario)
+        self.sync = Sync(db=self.db, in_memory_repo=self.repo, clock=clock)
+        clock.on_rollover(self.sync.on_day_closed)
+        # virtual save times of the bills not stored in DynamoDB yet, per day
+        self.pending: dict[int, collections.deque[float]] = collections.defaultdict(collections.deque)
+        self.stored: dict[int, int] = collections.defaultdict(int)
+        self.lags: list[float] = []
+        self.bill_bytes = 0
+        self.bills = 0
+        self.failed_ticks = 0
+        self.recovery: dict[tuple[int, int], float | None] = {outage: None for outage in scenario.outages}
+
+    def _is_open(self, moment: float) -> bool:
+        opening, closing = self.scenario.opening_hours
+        hour = (moment - tm.get_day_start(moment)) / 3600
+        return opening <= hour < closing
+
+    def _network_down(self, elapsed: float) -> bool:
+        if any(start <= elapsed < end for start, end in self.scenario.outages):
+            return True
+        return self.scenario.flapping > 0 and self.rng.random() < self.scenario.flapping
+
+    async def _advance_to(self, moment: float) -> None:
+        self.clock.advance(moment - self.clock.time)
+        if self.sync._tasks:
+            # midnight seals the closed day
+            await asyncio.gather(*self.sync._tasks)
+
+    async def _trade_until(self, moment: float) -> None:
+        seconds = moment - self.clock.time
+        expected = self.scenario.bills_per_hour * seconds / 3600
+        count = int(expected) + (self.rng.random() < expected - int(expected))
+        for bill_time in sorted(self.clock.time + self.rng.random() * seconds for _ in range(count)):
+            if not self._is_open(bill_time):
+                continue
+            await self._advance_to(bill_time)
+            for _ in range(self.rng.randint(1, 6)):
+                self.register.add_item(price=float(self.rng.randrange(500, 150_000, 100)))
+            bill = self.register.get_current_bill()
+            bill.created_at = self.clock.now_ns()  # type: ignore
+            self.bill_bytes += fakes.item_size(bill.model_dump(mode="json"))  # type: ignore
+            await self.register.save_bill()
+            self.pending[self.clock.current_day].append(bill_time)
+            self.bills += 1
+        await self._advance_to(moment)
+
+    def _confirm(self) -> None:
+        now = self.clock.time
+        for day_id, pending in self.pending.items():
+            if not pending:
+                continue
+            stored = _stored_bills(self.table, self.scenario.layout, day_id)
+            for _ in range(min(stored - self.stored[day_id], len(pending))):
+                self.lags.append(now - pending.popleft())
+            self.stored[day_id] = max(stored, self.stored[day_id])
+        oldest = min((pending[0] for pending in self.pending.values() if pending), default=float("inf"))
+        for (start, end), recovered in self.recovery.items():
+            if recovered is None and self.start + end <= now and oldest >= self.start + end:
+                self.recovery[(start, end)] = now - (self.start + end)
+
+    async def _tick(self, tick: int) -> None:
+        self.table.faults.offline = self._network_down(self.clock.time - self.start)
+        errors = sum(self.table.errors.values())
+        self.table.elapsed = 0.0
+        await self.sync.sync_bills()
+        if tick * self.scenario.sync_interval % self.scenario.clean_interval == 0:
+            await self.sync.clean_daily_shifts()
+        self.failed_ticks += sum(self.table.errors.values()) > errors
+        # the sync took the simulated request latencies
+        await self._advance_to(self.clock.time + self.table.elapsed)
+        self._confirm()
+
+    async def run(self, drain_days: int = 2) -> dict:
+        trading_end = self.start + self.scenario.days * DAY
+        deadline = trading_end + drain_days * DAY
+        tick = 0
+        while self.clock.time < deadline:
+            tick += 1
+            next_tick = self.start + tick * self.scenario.sync_interval
+            if next_tick < trading_end:
+                await self._trade_until(next_tick)
+            elif next_tick > self.clock.time:
+                await self._advance_to(next_tick)
+            await self._tick(tick)
+            if self.clock.time >= trading_end and not any(self.pending.values()):
+                break
+        unsynced = sum(len(pending) for pending in self.pending.values())
+        return {
+            "bills": self.bills,
+            "unsynced_bills": unsynced,
+            "simulated_hours": round((self.clock.time - self.start) / 3600, 1),
+            "sync_ticks": tick,
+            "failed_ticks": self.failed_ticks,
+            "lag_s": report.percentiles(self.lags or [0.0], digits=1),
+            "write_amplification": round(self.table.bytes_written / self.bill_bytes, 2) if self.bill_bytes else None,
+            "requests": dict(self.table.requests),
+            "errors": dict(self.table.errors),
+            "recovery_s": [recovered for recovered in self.recovery.values()],
+        }
+
+
+async def simulate(scenario: Scenario) -> dict:
+    with _simulation(synthetic.FIRST_DAY) as clock:
+        started = time.perf_counter()
+        result = await Simulation(scenario, clock).run()
+    return {"scenario": dataclasses.asdict(scenario), **result, "wall_s": round(time.perf_counter() - started, 2)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", nargs="+", choices=sorted(SCENARIOS), default=sorted(SCENARIOS))
+    parser.add_argument("--layout", choices=["day", "bill"])
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    results = []
+    for name in args.scenario:
+        scenario = SCENARIOS[name]
+        if args.layout:
+            scenario = dataclasses.replace(scenario, layout=args.layout)
+        if args.seed is not None:
+            scenario = dataclasses.replace(scenario, seed=args.seed)
+        results.append(asyncio.run(simulate(scenario)))
+    print(json.dumps({"benchmark": "simulate_sync", "environment": report.environment(), "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
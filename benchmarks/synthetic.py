@@ -0,0 +1,32 @@
+"""
+Synthetic register data for the benchmarks.
+"""
+
+import random
+
+from app.register import model
+
+DAY_SECONDS = 86400
+FIRST_DAY = 1704085200  # 2024-01-01 00:00 UTC-5
+OPENING_HOURS_NS = 12 * 3600 * 1_000_000_000
+
+
+def make_daily_shift(day_id: int, bills_count: int, max_items: int = 6, seed: int = 0) -> model.DailyShift:
+    rng = random.Random(seed + day_id)
+    opening_ns = (day_id + 8 * 3600) * 1_000_000_000
+    created_at = sorted(rng.randrange(OPENING_HOURS_NS) + opening_ns for _ in range(bills_count))
+    daily_shift = model.DailyShift(id=day_id, bills=[], total=0)
+    for bill_created_at in created_at:
+        bill = model.Bill(created_at=bill_created_at, items=[], total=0)
+        for _ in range(rng.randint(1, max_items)):
+            bill.add_item(model.Item(id="1", price=float(rng.randrange(500, 150_000, 100)), quantity=1))
+        daily_shift.add_bill(bill)
+    return daily_shift
+
+
+def make_backlog(days: int, bills_per_day: int, last_day: int, seed: int = 0) -> dict[int, model.DailyShift]:
+    """
+    ``days`` consecutive days ending on last_day, as if none of them was synced
+    """
+    first_day = last_day - (days - 1) * DAY_SECONDS
+    return {day_id: make_daily_shift(day_id, bills_per_day, seed=seed) for day_id in range(first_day, last_day + 1, DAY_SECONDS)}
@@ -0,0 +1,35 @@
+import json
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator
+
+import pytest
+
+from app.commons import time
+from tests.test_constants import DayIds, FileNames
+
+
+@pytest.fixture
+def clock() -> time.ManualClock:
+    """Clock at noon (UTC) of DAY_4, the current day of the test data"""
+    return time.ManualClock(start_time=DayIds.DAY_4 + 12 * 3600, utc_offset=0)
+
+
+@pytest.fixture
+def temp_dir(monkeypatch) -> Iterator[Path]:
+    """Create a temporary directory and change to it"""
+    with tempfile.TemporaryDirectory() as temp_dir_str:
+        temp_dir_path = Path(temp_dir_str)
+        monkeypatch.chdir(temp_dir_path)
+        yield temp_dir_path
+
+
+@pytest.fixture
+def write_test_data(temp_dir: Path) -> Callable[[Dict[str, Any]], None]:
+    """Write test data (DataFactory days by day id) to daily_shifts.json in temp_dir"""
+
+    def write(data: Dict[str, Any]) -> None:
+        with open(temp_dir / FileNames.DAILY_SHIFTS_JSON, "w") as f:
+            json.dump({k: v.to_dict() for k, v in data.items()}, f, indent=2)
+
+    return write
@@ -0,0 +1,109 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+from app.commons import time
+from app.register import adapters, usecases
+from app.register.entrypoints import api
+from tests.test_constants import FileNames
+
+
+class TestRegisterApi:
+    """Test suite for the register API over a Unix socket"""
+
+    @pytest_asyncio.fixture
+    async def server(self, temp_dir: Path, clock: time.ManualClock):
+        repo = adapters.InMemoryRepo(path_file=str(temp_dir / FileNames.DAILY_SHIFTS_JSON), clock=clock)
+        server = api.RegisterServer(usecases.Lanes(repo=repo, clock=clock))
+        await server.start(path=str(temp_dir / "register.sock"))
+        yield server
+        await server.close()
+
+    @pytest_asyncio.fixture
+    async def client(self, server: api.RegisterServer, temp_dir: Path):
+        client = await api.RegisterClient.connect(path=str(temp_dir / "register.sock"))
+        yield client
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_pipelined_bills_of_several_lanes(self, client: api.RegisterClient) -> None:
+        """Test requests sent without waiting keep the order of each lane"""
+        # Arrange
+        calls = []
+        for lane in ("1", "2", "3"):
+            for _ in range(10):
+                calls.append(client.call("add_item", lane=lane, price=1000))
+                calls.append(client.call("add_item", lane=lane, price=500))
+                calls.append(client.call("save_bill", lane=lane))
+
+        # Act
+        results = await asyncio.gather(*calls)
+        daily_shift = await client.call("daily_shift")
+
+        # Assert
+        saved = [result for result in results if result and "id" in result]
+        assert len(saved) == 30
+        assert all(bill["total"] == 1500 for bill in saved)
+        assert daily_shift["bills"] == 30
+        assert daily_shift["total"] == 45_000
+
+    @pytest.mark.asyncio
+    async def test_lanes_do_not_share_the_current_bill(self, client: api.RegisterClient) -> None:
+        """Test items of one lane are not in the bill of another"""
+        # Act
+        await client.call("add_item", lane="1", price=1000)
+        await client.call("add_item", lane="2", price=2500)
+        await client.call("remove_last_item", lane="2")
+
+        # Assert
+        assert (await client.call("current_bill", lane="1"))["total"] == 1000
+        assert (await client.call("current_bill", lane="2"))["items"] == []
+        assert await client.call("save_bill", lane="3") is None
+
+    @pytest.mark.asyncio
+    async def test_requests_without_lane_skip_the_console_lane(
+        self, client: api.RegisterClient, server: api.RegisterServer, temp_dir: Path
+    ) -> None:
+        """Test a request with no lane does not touch the bill of the console (lane 1)"""
+        # Arrange
+        console = server.lanes.get("1")
+        console.add_item(1000)
+        reader, writer = await asyncio.open_unix_connection(str(temp_dir / "register.sock"))
+
+        # Act
+        writer.write(json.dumps({"id": 1, "op": "add_item", "price": 2500}).encode() + b"\n")
+        response = json.loads(await reader.readline())
+        writer.close()
+
+        # Assert
+        assert response["ok"] is True
+        assert console.get_current_bill().total == 1000  # type: ignore
+        assert (await client.call("current_bill", lane=api.DEFAULT_LANE))["total"] == 2500
+
+    @pytest.mark.asyncio
+    async def test_invalid_requests_get_an_error(self, client: api.RegisterClient, temp_dir: Path) -> None:
+        """Test bad requests are answered with ok false and the connection keeps working"""
+        # Act / Assert
+        with pytest.raises(api.ApiError):
+            await client.call("unknown")
+        with pytest.raises(api.ApiError):
+            await client.call("add_item", price="not a price")
+        for price in ("nan", "inf", -5, 0, usecases.MAX_PRICE):
+            with pytest.raises(api.ApiError):
+                await client.call("add_item", price=price)
+        for value in ("nan", "-inf", 0):
+            with pytest.raises(api.ApiError):
+                await client.call("credit_note", value=value)
+        assert (await client.call("current_bill"))["items"] == []
+        assert (await client.call("daily_shift"))["bills"] == 0
+        assert await client.call("ping") == "pong"
+
+        reader, writer = await asyncio.open_unix_connection(str(temp_dir / "register.sock"))
+        writer.write(b"not json\n")
+        response = json.loads(await reader.readline())
+        writer.close()
+        assert response["ok"] is False
+        assert response["id"] is None
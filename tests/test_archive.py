@@ -0,0 +1,133 @@
+import os
+from pathlib import Path
+from unittest.mock import AsyncMock
+from typing import Any, Callable, Dict
+
+import pytest
+
+from app.commons import time
+from app.register import adapters, archive, model
+from app.register.entrypoints.cron import Sync
+from tests.test_constants import DayIds, FileNames, DataFactory
+
+
+class TestDayArchive:
+    """Test suite for the columnar archive of cleaned days"""
+
+    def test_columns_are_views_of_every_archived_bill(self, temp_dir: Path) -> None:
+        """Test days are stored as fixed width columns and read back per day"""
+        # Arrange
+        data = DataFactory.create_multi_day_scenario()
+        day_archive = archive.DayArchive(str(temp_dir / "archive"))
+
+        # Act
+        for daily_shift in data.values():
+            day_archive.append(daily_shift.to_model())
+        bill = model.Bill(items=[model.Item(id="1", price=10, quantity=1)] * 3, total=30)
+        day_archive.append(model.DailyShift(id=DayIds.DAY_4 + 86400, bills=[bill], total=30))
+        columns = day_archive.columns()
+        day_2 = day_archive.day(DayIds.DAY_2)
+
+        # Assert
+        assert list(columns.totals) == [100.0, 150.0, 200.0, 300.0, 400.0, 500.0, 30.0]
+        assert list(columns.items) == [0] * 6 + [3]
+        assert list(day_2.totals) == [200.0, 300.0]  # type: ignore
+        assert list(day_2.created_at) == [DayIds.DAY_2 * 1_000_000_000] * 2  # type: ignore
+        assert day_archive.day(DayIds.DAY_4 + 2 * 86400) is None
+        assert os.path.getsize(temp_dir / "archive" / "totals.f8") == 7 * 8
+
+    def test_append_is_idempotent_and_survives_reopen(self, temp_dir: Path) -> None:
+        """Test a day is archived once and a reopened archive sees the same days"""
+        # Arrange
+        day_1 = DataFactory.create_multi_day_scenario()[str(DayIds.DAY_1)].to_model()
+        day_archive = archive.DayArchive(str(temp_dir / "archive"))
+
+        # Act
+        first = day_archive.append(day_1)
+        second = day_archive.append(day_1)
+        reopened = archive.DayArchive(str(temp_dir / "archive"))
+
+        # Assert
+        assert first and not second
+        assert reopened.day_ids() == [DayIds.DAY_1]
+        assert reopened.daily_totals() == {DayIds.DAY_1: {"bills": 2, "total": 250.0, "items": 0}}
+
+    def test_reopen_drops_a_day_cut_short(self, temp_dir: Path) -> None:
+        """Test column bytes past the day table are truncated so the next day lines up"""
+        # Arrange
+        data = DataFactory.create_multi_day_scenario()
+        day_archive = archive.DayArchive(str(temp_dir / "archive"))
+        day_archive.append(data[str(DayIds.DAY_1)].to_model())
+        with open(temp_dir / "archive" / "totals.f8", "ab") as file:
+            file.write(b"\x00" * 12)
+        with open(temp_dir / "archive" / archive.DAYS_FILE, "ab") as file:
+            file.write(b"\x01" * 5)
+
+        # Act
+        reopened = archive.DayArchive(str(temp_dir / "archive"))
+        reopened.append(data[str(DayIds.DAY_2)].to_model())
+
+        # Assert
+        assert reopened.daily_totals(start_day=DayIds.DAY_2) == {DayIds.DAY_2: {"bills": 2, "total": 500.0, "items": 0}}
+        assert list(reopened.columns().totals) == [100.0, 150.0, 200.0, 300.0]
+
+    def test_failed_append_truncates_the_day_table(self, temp_dir: Path, monkeypatch) -> None:
+        """Test a day row cut short by a failed write is removed along with the columns"""
+        # Arrange
+        data = DataFactory.create_multi_day_scenario()
+        day_archive = archive.DayArchive(str(temp_dir / "archive"))
+        day_archive.append(data[str(DayIds.DAY_1)].to_model())
+        write = archive.DayArchive._write
+
+        def failing_write(self, file_name: str, values) -> None:
+            if file_name == archive.DAYS_FILE:
+                with open(self._path(file_name), "ab") as file:
+                    file.write(values.tobytes()[:5])
+                raise OSError("disk full")
+            write(self, file_name, values)
+
+        monkeypatch.setattr(archive.DayArchive, "_write", failing_write)
+
+        # Act
+        with pytest.raises(OSError):
+            day_archive.append(data[str(DayIds.DAY_2)].to_model())
+        monkeypatch.setattr(archive.DayArchive, "_write", write)
+        day_archive.append(data[str(DayIds.DAY_3)].to_model())
+        reopened = archive.DayArchive(str(temp_dir / "archive"))
+
+        # Assert
+        assert os.path.getsize(temp_dir / "archive" / archive.DAYS_FILE) == 2 * 3 * 8
+        assert reopened.day_ids() == [DayIds.DAY_1, DayIds.DAY_3]
+        assert list(reopened.columns().totals) == [100.0, 150.0, 400.0]
+
+    @pytest.mark.asyncio
+    async def test_cleanup_archives_removed_days(
+        self, temp_dir: Path, clock: time.ManualClock, write_test_data: Callable[[Dict[str, Any]], None]
+    ) -> None:
+        """Test synced days removed by the cleanup end up in the archive"""
+        # Arrange
+        data = DataFactory.create_multi_day_scenario()
+        write_test_data(data)
+        repo = adapters.InMemoryRepo(path_file=str(temp_dir / FileNames.DAILY_SHIFTS_JSON), hot_days=1, clock=clock)
+        remote = {}
+
+        async def mock_save(daily_shift):
+            remote[daily_shift.id] = daily_shift
+
+        async def mock_get(day_id: int):
+            return remote.get(day_id)
+
+        mock_db = AsyncMock()
+        mock_db.save.side_effect = mock_save
+        mock_db.get.side_effect = mock_get
+        day_archive = archive.DayArchive(str(temp_dir / "archive"))
+        sync_instance = Sync(db=mock_db, in_memory_repo=repo, archive=day_archive, clock=clock)
+
+        # Act
+        await sync_instance.sync_bills()
+        await sync_instance.clean_daily_shifts()
+
+        # Assert
+        assert repo.stored_day_ids() == [DayIds.DAY_4]
+        assert day_archive.day_ids() == [DayIds.DAY_1, DayIds.DAY_2, DayIds.DAY_3]
+        assert sum(day["total"] for day in day_archive.daily_totals().values()) == 1150.0
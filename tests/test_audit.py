@@ -0,0 +1,93 @@
+from pathlib import Path
+from unittest.mock import AsyncMock
+from typing import Any, Callable, Dict
+
+import pytest
+
+from app.commons import time
+from app.register import adapters
+from app.register.entrypoints.audit import Auditor, diff_bills
+from tests.test_constants import DayIds, BillIds, FileNames, DataFactory
+
+
+class TestAudit:
+    """Test suite for the local vs DynamoDB reconciliation"""
+
+    @pytest.fixture
+    def stored_days(
+        self, temp_dir: Path, clock: time.ManualClock, write_test_data: Callable[[Dict[str, Any]], None]
+    ) -> adapters.StoredDays:
+        """Store days 2 to 4 of the scenario with DAY_2 in the warm tier and open them read-only"""
+        test_data = DataFactory.create_multi_day_scenario()
+        del test_data[str(DayIds.DAY_1)]
+        write_test_data(test_data)
+        adapters.InMemoryRepo(path_file=str(temp_dir / FileNames.DAILY_SHIFTS_JSON), hot_days=1, clock=clock)
+        return adapters.StoredDays(path_file=str(temp_dir / FileNames.DAILY_SHIFTS_JSON))
+
+    @staticmethod
+    def _read_files(directory: Path) -> Dict[str, bytes]:
+        return {str(path.relative_to(directory)): path.read_bytes() for path in sorted(directory.rglob("*")) if path.is_file()}
+
+    def test_diff_bills(self) -> None:
+        """Test the merge finds missing, extra and mismatched bills"""
+        # Arrange
+        local = [DataFactory.create_bill(bill_id, DayIds.DAY_1).to_model() for bill_id in (BillIds.BILL_3, BillIds.BILL_1, BillIds.BILL_2)]
+        remote = [DataFactory.create_bill(bill_id, DayIds.DAY_1).to_model() for bill_id in (BillIds.BILL_4, BillIds.BILL_2, BillIds.BILL_1)]
+        remote[1].total = 1.0
+
+        # Act
+        audit = diff_bills(DayIds.DAY_1, local, remote)
+
+        # Assert
+        assert audit.missing == [BillIds.BILL_3]
+        assert audit.extra == [BillIds.BILL_4]
+        assert audit.mismatched == [BillIds.BILL_2]
+        assert not audit.is_consistent()
+
+    @pytest.mark.asyncio
+    async def test_audit_and_repair(self, stored_days: adapters.StoredDays) -> None:
+        """Test an audit over a range reports each day and repairs the broken ones"""
+        # Arrange
+        test_data = DataFactory.create_multi_day_scenario()
+        day_2 = test_data[str(DayIds.DAY_2)].to_model()
+        day_2.bills = day_2.bills[:1]
+        remote = {
+            DayIds.DAY_1: test_data[str(DayIds.DAY_1)].to_model(),
+            DayIds.DAY_2: day_2,
+            DayIds.DAY_3: test_data[str(DayIds.DAY_3)].to_model(),
+        }
+        mock_db = AsyncMock()
+        mock_db.get.side_effect = lambda day_id: remote.get(day_id)
+        auditor = Auditor(db=mock_db, stored_days=stored_days, batch_size=2)
+
+        # Act
+        report = await auditor.audit(DayIds.DAY_1, DayIds.DAY_4, repair=True)
+
+        # Assert
+        assert [day.day_id for day in report.days] == [DayIds.DAY_1, DayIds.DAY_2, DayIds.DAY_3, DayIds.DAY_4]
+        assert report.days[0].local_missing
+        assert [(day.day_id, day.missing) for day in report.inconsistent_days()] == [
+            (DayIds.DAY_2, [BillIds.BILL_4]),
+            (DayIds.DAY_4, [BillIds.BILL_6]),
+        ]
+        assert report.repaired == [DayIds.DAY_2, DayIds.DAY_4]
+        repaired_call = mock_db.repair.call_args_list[0]
+        assert repaired_call.args[0].id == DayIds.DAY_2
+        assert repaired_call.args[1] == {BillIds.BILL_4}
+
+    @pytest.mark.asyncio
+    async def test_audit_leaves_the_local_files_untouched(self, temp_dir: Path, stored_days: adapters.StoredDays) -> None:
+        """Test the audit reads hot and warm days without moving, rewriting or creating files"""
+        # Arrange
+        files_before = self._read_files(temp_dir)
+        mock_db = AsyncMock()
+        mock_db.get.return_value = None
+        auditor = Auditor(db=mock_db, stored_days=stored_days)
+
+        # Act
+        report = await auditor.audit(DayIds.DAY_2, DayIds.DAY_4)
+
+        # Assert
+        assert [day.missing for day in report.days] == [[BillIds.BILL_3, BillIds.BILL_4], [BillIds.BILL_5], [BillIds.BILL_6]]
+        assert self._read_files(temp_dir) == files_before
+        mock_db.repair.assert_not_called()
@@ -0,0 +1,132 @@
+from pathlib import Path
+
+import pytest
+
+from app.commons import time
+from app.register import adapters, events, projections, usecases
+from app.register.journal import EventJournal
+from tests.test_constants import FileNames
+
+
+class TestBillEvents:
+    """Test suite for the bill events recorded by the register and their projections"""
+
+    @pytest.fixture
+    def journal(self, temp_dir: Path) -> EventJournal:
+        return EventJournal(str(temp_dir / "journal"))
+
+    @pytest.fixture
+    def register(self, temp_dir: Path, clock: time.ManualClock, journal: EventJournal) -> usecases.Register:
+        repo = adapters.InMemoryRepo(path_file=str(temp_dir / FileNames.DAILY_SHIFTS_JSON), clock=clock)
+        return usecases.Register(repo=repo, clock=clock, journal=journal, lane="2")
+
+    @staticmethod
+    def _journaled(journal: EventJournal, day_id: int) -> list[events.Event]:
+        journal.flush()
+        with open(journal.path(day_id), "rb") as file:
+            return [events.load_event(line) for line in file]
+
+    @pytest.mark.asyncio
+    async def test_bill_lifecycle_is_journaled(self, register: usecases.Register, journal: EventJournal, clock: time.ManualClock) -> None:
+        """Test every change of the bill is an event and replaying them rebuilds the bill"""
+        # Arrange
+        register.add_item(price=1000)
+        register.add_item(price=2500)
+        register.remove_last_item()
+        register.add_item(price=700)
+        current_bill = register.get_current_bill().model_copy(deep=True)  # type: ignore
+
+        # Act
+        saved = await register.save_bill()
+        journaled = self._journaled(journal, clock.current_day)
+        replayed = projections.CurrentBill()
+        for event in journaled:
+            replayed.apply(event)
+
+        # Assert
+        assert [event.type for event in journaled] == ["item_added", "item_added", "item_removed", "item_added", "bill_saved"]
+        assert {event.lane for event in journaled} == {"2"}
+        assert replayed.bill == current_bill == saved
+        assert not replayed.open
+
+    @pytest.mark.asyncio
+    async def test_credit_note_keeps_the_open_bill(self, register: usecases.Register, clock: time.ManualClock) -> None:
+        """Test a credit note is stored as its own negative bill"""
+        # Arrange
+        register.add_item(price=5000)
+
+        # Act
+        credit_note = await register.issue_credit_note(1200)
+        register.add_item(price=300)
+        saved = await register.save_bill()
+
+        # Assert
+        daily_shift = await register.get_daily_shift()
+        assert [bill.total for bill in daily_shift.bills] == [-1200, 5300]
+        assert daily_shift.bills[0].id == credit_note.id
+        assert saved is not None and saved.total == 5300
+        for value in (-1, 0, float("nan"), float("inf")):
+            with pytest.raises(ValueError):
+                await register.issue_credit_note(value)
+        assert len((await register.get_daily_shift()).bills) == 2
+
+    def test_add_item_checks_the_price(self, register: usecases.Register) -> None:
+        """Test invalid prices are rejected and large ones need a confirmation"""
+        # Act
+        for price in (0, -100, float("nan"), float("inf"), usecases.MAX_PRICE):
+            with pytest.raises(ValueError):
+                register.add_item(price=price)
+        register.add_item(price=usecases.MAX_PRICE, confirmed=True)
+
+        # Assert
+        assert [item.price for item in register.get_current_bill().items] == [usecases.MAX_PRICE]  # type: ignore
+
+    @pytest.mark.asyncio
+    async def test_saved_bill_is_not_changed_afterwards(self, register: usecases.Register) -> None:
+        """Test removing an item after saving does not touch the stored bill"""
+        # Arrange
+        register.add_item(price=1000)
+        saved = await register.save_bill()
+
+        # Act
+        register.remove_last_item()
+
+        # Assert
+        daily_shift = await register.get_daily_shift()
+        assert daily_shift.bills[0].total == 1000
+        assert saved is not None and saved.items
+
+    @pytest.mark.asyncio
+    async def test_day_sales_projection(self, register: usecases.Register, journal: EventJournal, clock: time.ManualClock) -> None:
+        """Test the dashboard projection counts sales, credit notes and removed items"""
+        # Arrange
+        register.add_item(price=1000)
+        register.add_item(price=9000)
+        register.remove_last_item()
+        await register.save_bill()
+        register.add_item(price=3000)
+        await register.save_bill()
+        await register.issue_credit_note(500)
+        sales = projections.DaySales()
+
+        # Act
+        for event in self._journaled(journal, clock.current_day):
+            sales.apply(event)
+
+        # Assert
+        daily_shift = await register.get_daily_shift()
+        assert (sales.bills, sales.sales, sales.average_ticket) == (2, 4000, 2000)
+        assert (sales.credit_notes, sales.credit_notes_total, sales.items_removed) == (1, -500, 1)
+        assert sales.total == daily_shift.total == 3500
+
+    def test_bill_saved_lines_without_lane_are_read(self) -> None:
+        """Test journal lines written before lanes were recorded still load"""
+        # Arrange
+        line = b'{"type":"bill_saved","day":1704344400,"bill":{"id":"a","created_at":1,"items":[],"total":0.0}}\n'
+
+        # Act
+        event = events.load_event(line)
+
+        # Assert
+        assert isinstance(event, events.BillSaved)
+        assert event.lane == "1"
@@ -0,0 +1,137 @@
+from pathlib import Path
+from typing import Any, Callable, Dict
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.commons import time as tm
+from app.register import adapters, ports, usecases
+from tests.test_constants import DayIds, BillIds, FileNames, DataFactory
+
+
+class TestBillIndex:
+    """Test suite for looking bills up by id across the retained days"""
+
+    def _repo(self, temp_dir: Path, clock: tm.ManualClock, **kwargs) -> adapters.InMemoryRepo:
+        return adapters.InMemoryRepo(path_file=str(temp_dir / FileNames.DAILY_SHIFTS_JSON), hot_days=1, clock=clock, **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_find_bill_in_hot_and_warm_days(
+        self, temp_dir: Path, clock: tm.ManualClock, write_test_data: Callable[[Dict[str, Any]], None]
+    ) -> None:
+        """Test bills of memory days and of segments are found with their day"""
+        # Arrange
+        write_test_data(DataFactory.create_multi_day_scenario())
+        repo = self._repo(temp_dir, clock)
+
+        # Act
+        hot = await repo.find_bill(BillIds.BILL_5)
+        warm = await repo.find_bill(BillIds.BILL_2)
+        missing = await repo.find_bill(BillIds.NO_ID)
+
+        # Assert
+        assert hot is not None and hot[0].id == DayIds.DAY_3 and hot[1].id == BillIds.BILL_5
+        assert warm is not None and warm[0].id == DayIds.DAY_1 and warm[1].id == BillIds.BILL_2
+        assert missing is None
+        assert len(repo.bill_index) == 6
+
+    @pytest.mark.asyncio
+    async def test_restart_reads_ids_files_instead_of_segments(
+        self, temp_dir: Path, clock: tm.ManualClock, write_test_data: Callable[[Dict[str, Any]], None]
+    ) -> None:
+        """Test a restarted repo indexes warm days without decoding their segments"""
+        # Arrange
+        write_test_data(DataFactory.create_multi_day_scenario())
+        self._repo(temp_dir, clock)
+        repo = self._repo(temp_dir, clock)
+
+        # Act
+        await repo.load_deferred_days()
+
+        # Assert
+        assert repo.bill_index.get(BillIds.BILL_4) == (DayIds.DAY_2, 1)
+        assert len(repo.warm_days._cache) == 0
+        assert (temp_dir / "daily_shifts_segments" / f"{DayIds.DAY_1}{adapters.BILL_IDS_SUFFIX}").read_text() == (
+            f"{BillIds.BILL_1}\n{BillIds.BILL_2}"
+        )
+
+    @pytest.mark.asyncio
+    async def test_saved_and_removed_days_update_the_index(
+        self, temp_dir: Path, clock: tm.ManualClock, write_test_data: Callable[[Dict[str, Any]], None]
+    ) -> None:
+        """Test new bills are indexed on save and removed days leave the index"""
+        # Arrange
+        write_test_data(DataFactory.create_multi_day_scenario())
+        repo = self._repo(temp_dir, clock)
+        current_day = await repo.get(DayIds.DAY_4)
+        current_day.add_bill(DataFactory.create_bill("new_bill", DayIds.DAY_4).to_model())  # type: ignore
+
+        # Act
+        await repo.save(daily_shift=current_day)  # type: ignore
+        repo.remove_warm_days([DayIds.DAY_1])
+        repo.clean_daily_shifts()
+
+        # Assert
+        assert repo.bill_index.get("new_bill") == (DayIds.DAY_4, 1)
+        assert await repo.find_bill(BillIds.BILL_1) is None
+        assert await repo.find_bill(BillIds.BILL_5) is None
+        assert (await repo.find_bill(BillIds.BILL_3))[1].id == BillIds.BILL_3  # type: ignore
+
+    @pytest.mark.asyncio
+    async def test_void_bill_issues_a_credit_note_once(
+        self, temp_dir: Path, clock: tm.ManualClock, write_test_data: Callable[[Dict[str, Any]], None]
+    ) -> None:
+        """Test voiding a past bill stores a credit note for its total in today's shift"""
+        # Arrange
+        write_test_data(DataFactory.create_multi_day_scenario())
+        register = usecases.Register(repo=self._repo(temp_dir, clock), clock=clock)
+
+        # Act
+        credit_note = await register.void_bill(BillIds.BILL_4)
+
+        # Assert
+        assert credit_note.id == usecases.VOID_PREFIX + BillIds.BILL_4
+        assert credit_note.total == -300.0
+        daily_shift = await register.get_daily_shift()
+        assert daily_shift.bills[-1].id == credit_note.id
+        _, bill, voided = await register.find_bill(BillIds.BILL_4)  # type: ignore
+        assert bill.total == 300.0 and voided
+        with pytest.raises(ValueError):
+            await register.void_bill(BillIds.BILL_4)
+        with pytest.raises(ValueError):
+            await register.void_bill(credit_note.id)
+        with pytest.raises(ValueError):
+            await register.void_bill(BillIds.NO_ID)
+
+    @pytest.mark.asyncio
+    async def test_register_looks_bills_up_in_the_given_lookup(
+        self, temp_dir: Path, clock: tm.ManualClock, write_test_data: Callable[[Dict[str, Any]], None]
+    ) -> None:
+        """Test a register on a repository without index finds bills only through an explicit BillLookup"""
+        # Arrange
+        write_test_data(DataFactory.create_multi_day_scenario())
+        repo = AsyncMock(spec=ports.Repository)
+        without_lookup = usecases.Register(repo=repo, clock=clock)
+        with_lookup = usecases.Register(repo=repo, clock=clock, bills=self._repo(temp_dir, clock))
+
+        # Act
+        found = await with_lookup.find_bill(BillIds.BILL_4)
+
+        # Assert
+        assert found is not None and found[1].id == BillIds.BILL_4
+        with pytest.raises(ValueError):
+            await without_lookup.find_bill(BillIds.BILL_4)
+
+    def test_index_day_starts_over_when_the_day_shrinks(self) -> None:
+        """Test a replaced day with fewer bills is indexed again from scratch"""
+        # Arrange
+        index = adapters.BillIndex()
+        index.index_day(DayIds.DAY_1, ["a", "b", "c"])
+
+        # Act
+        index.index_day(DayIds.DAY_1, ["d"])
+
+        # Assert
+        assert index.get("d") == (DayIds.DAY_1, 0)
+        assert index.get("a") is None
+        assert len(index) == 1
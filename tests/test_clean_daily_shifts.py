@@ -1,3 +1,4 @@
+import asyncio
 import json
 import tempfile
 from pathlib import Path
@@ -7,6 +8,7 @@ from typing import Dict, Any
 import pytest
 import pytest_asyncio
 
+from app.commons import time
 from app.register.entrypoints.cron import Sync
 from app.register import adapters
 from tests.test_constants import (
@@ -24,10 +26,10 @@ class TestCleanDailyShifts:
         return AsyncMock()
 
     @pytest.fixture
-    def in_memory_repo(self, temp_dir: Path) -> adapters.InMemoryRepo:
+    def in_memory_repo(self, temp_dir: Path, clock: time.ManualClock) -> adapters.InMemoryRepo:
         """Create a real InMemoryRepo instance"""
         daily_shifts_path = temp_dir / FileNames.DAILY_SHIFTS_JSON
-        return adapters.InMemoryRepo(path_file=str(daily_shifts_path))
+        return adapters.InMemoryRepo(path_file=str(daily_shifts_path), clock=clock)
 
     @pytest.fixture
     def temp_dir(self, monkeypatch) -> Path:
@@ -38,9 +40,9 @@ class TestCleanDailyShifts:
             yield temp_dir_path
 
     @pytest.fixture
-    def sync_instance(self, mock_db: AsyncMock, in_memory_repo: adapters.InMemoryRepo) -> Sync:
+    def sync_instance(self, mock_db: AsyncMock, in_memory_repo: adapters.InMemoryRepo, clock: time.ManualClock) -> Sync:
         """Create a Sync instance with mocked DB and real in-memory repo"""
-        return Sync(db=mock_db, in_memory_repo=in_memory_repo)
+        return Sync(db=mock_db, in_memory_repo=in_memory_repo, clock=clock)
 
     def _write_test_data(self, temp_dir: Path, data: Dict[str, Any]) -> None:
         """Helper method to write test data to files"""
@@ -81,8 +83,7 @@ class TestCleanDailyShifts:
     async def test_clean_daily_shifts_conservative_cleanup(
         self, 
         sync_instance: Sync, 
-        temp_dir: Path,
-        monkeypatch
+        temp_dir: Path
     ) -> None:
         """Test conservative cleanup keeps current day and unsynced days"""
         # Arrange
@@ -90,9 +91,6 @@ class TestCleanDailyShifts:
         self._write_test_data(temp_dir, test_data)
         self._write_last_bill_id(temp_dir, BillIds.BILL_2)  # Only Day 1 synced
 
-        # Mock current day
-        monkeypatch.setattr("app.commons.time.get_posix_time_until_day", lambda: DayIds.DAY_4)
-
         # Mock DynamoDB - only Day 1 exists (synced)
         async def mock_get(day_id: int):
             if day_id == DayIds.DAY_1:
@@ -120,8 +118,7 @@ class TestCleanDailyShifts:
     async def test_clean_daily_shifts_all_days_synced(
         self, 
         sync_instance: Sync, 
-        temp_dir: Path,
-        monkeypatch
+        temp_dir: Path
     ) -> None:
         """Test cleanup when all days except current are synced"""
         # Arrange
@@ -129,9 +126,6 @@ class TestCleanDailyShifts:
         self._write_test_data(temp_dir, test_data)
         self._write_last_bill_id(temp_dir, BillIds.BILL_6)  # All synced
 
-        # Mock current day
-        monkeypatch.setattr("app.commons.time.get_posix_time_until_day", lambda: DayIds.DAY_4)
-
         # Mock DynamoDB - all days exist (synced)
         async def mock_get(day_id: int):
             if str(day_id) in test_data:
@@ -155,8 +149,7 @@ class TestCleanDailyShifts:
     async def test_clean_daily_shifts_no_cleanup_needed(
         self, 
         sync_instance: Sync, 
-        temp_dir: Path,
-        monkeypatch
+        temp_dir: Path
     ) -> None:
         """Test cleanup when no cleanup is needed (only current day exists)"""
         # Arrange
@@ -169,9 +162,6 @@ class TestCleanDailyShifts:
         self._write_test_data(temp_dir, current_day_data)
         self._write_last_bill_id(temp_dir, BillIds.BILL_5)  # Previous bill synced
 
-        # Mock current day
-        monkeypatch.setattr("app.commons.time.get_posix_time_until_day", lambda: DayIds.DAY_4)
-
         # Act
         await sync_instance.clean_daily_shifts()
 
@@ -186,8 +176,7 @@ class TestCleanDailyShifts:
     async def test_clean_daily_shifts_dynamodb_error_conservative(
         self, 
         sync_instance: Sync, 
-        temp_dir: Path,
-        monkeypatch
+        temp_dir: Path
     ) -> None:
         """Test cleanup is conservative when DynamoDB errors occur"""
         # Arrange
@@ -195,9 +184,6 @@ class TestCleanDailyShifts:
         self._write_test_data(temp_dir, test_data)
         self._write_last_bill_id(temp_dir, BillIds.BILL_2)  # Only Day 1 synced
 
-        # Mock current day
-        monkeypatch.setattr("app.commons.time.get_posix_time_until_day", lambda: DayIds.DAY_4)
-
         # Mock DynamoDB to raise errors (conservative approach)
         async def mock_get_with_error(day_id: int):
             if day_id == DayIds.DAY_1:
@@ -224,8 +210,7 @@ class TestCleanDailyShifts:
     async def test_clean_daily_shifts_current_day_unsynced(
         self, 
         sync_instance: Sync, 
-        temp_dir: Path,
-        monkeypatch
+        temp_dir: Path
     ) -> None:
         """Test cleanup when current day has unsynced bills"""
         # Arrange
@@ -233,9 +218,6 @@ class TestCleanDailyShifts:
         self._write_test_data(temp_dir, test_data)
         self._write_last_bill_id(temp_dir, BillIds.BILL_5)  # Up to Day 3 synced
 
-        # Mock current day
-        monkeypatch.setattr("app.commons.time.get_posix_time_until_day", lambda: DayIds.DAY_4)
-
         # Mock DynamoDB - Days 1, 2, 3 exist (synced)
         async def mock_get(day_id: int):
             if day_id in [DayIds.DAY_1, DayIds.DAY_2, DayIds.DAY_3]:
@@ -259,8 +241,7 @@ class TestCleanDailyShifts:
     async def test_clean_daily_shifts_mixed_sync_states(
         self, 
         sync_instance: Sync, 
-        temp_dir: Path,
-        monkeypatch
+        temp_dir: Path
     ) -> None:
         """Test cleanup with mixed sync states across multiple days"""
         # Arrange
@@ -268,9 +249,6 @@ class TestCleanDailyShifts:
         self._write_test_data(temp_dir, test_data)
         self._write_last_bill_id(temp_dir, BillIds.BILL_3)  # Day 1 and part of Day 2 synced
 
-        # Mock current day
-        monkeypatch.setattr("app.commons.time.get_posix_time_until_day", lambda: DayIds.DAY_4)
-
         # Mock DynamoDB - Day 1 fully synced, Day 2 partially synced
         async def mock_get(day_id: int):
             if day_id == DayIds.DAY_1:
@@ -300,8 +278,7 @@ class TestCleanDailyShifts:
     async def test_clean_daily_shifts_no_bills_in_days(
         self, 
         sync_instance: Sync, 
-        temp_dir: Path,
-        monkeypatch
+        temp_dir: Path
     ) -> None:
         """Test cleanup with days that have no bills"""
         # Arrange
@@ -313,9 +290,6 @@ class TestCleanDailyShifts:
         self._write_test_data(temp_dir, empty_days_data)
         self._write_last_bill_id(temp_dir, BillIds.NO_ID)
 
-        # Mock current day
-        monkeypatch.setattr("app.commons.time.get_posix_time_until_day", lambda: DayIds.DAY_4)
-
         # Act
         await sync_instance.clean_daily_shifts()
 
@@ -331,8 +305,7 @@ class TestCleanDailyShifts:
     async def test_clean_daily_shifts_file_write_preserves_data(
         self, 
         sync_instance: Sync, 
-        temp_dir: Path,
-        monkeypatch
+        temp_dir: Path
     ) -> None:
         """Test that file write operations preserve data integrity"""
         # Arrange
@@ -340,9 +313,6 @@ class TestCleanDailyShifts:
         self._write_test_data(temp_dir, test_data)
         self._write_last_bill_id(temp_dir, BillIds.BILL_2)
 
-        # Mock current day
-        monkeypatch.setattr("app.commons.time.get_posix_time_until_day", lambda: DayIds.DAY_4)
-
         # Mock DynamoDB - only Day 1 exists
         async def mock_get(day_id: int):
             if day_id == DayIds.DAY_1:
@@ -371,3 +341,40 @@ class TestCleanDailyShifts:
                 original_bill = original_day.bills[i]
                 assert bill["id"] == original_bill.id
                 assert bill["total"] == original_bill.total
+
+    @pytest.mark.asyncio
+    async def test_clean_daily_shifts_keeps_bills_saved_during_cleanup(
+        self,
+        sync_instance: Sync,
+        in_memory_repo: adapters.InMemoryRepo,
+        temp_dir: Path
+    ) -> None:
+        """Test a bill saved while DynamoDB is being checked is not lost by the cleanup"""
+        # Arrange
+        test_data = DataFactory.create_multi_day_scenario()
+        del test_data[str(DayIds.DAY_4)]
+        self._write_test_data(temp_dir, test_data)
+        self._write_last_bill_id(temp_dir, BillIds.BILL_2)
+        checking = asyncio.Event()
+        release = asyncio.Event()
+
+        async def mock_get(day_id: int):
+            checking.set()
+            await release.wait()
+            return test_data[str(day_id)].to_model() if day_id == DayIds.DAY_1 else None
+
+        sync_instance.db.get.side_effect = mock_get
+        new_day = DataFactory.create_daily_shift(DayIds.DAY_4, [DataFactory.create_bill("new_bill", DayIds.DAY_4)])
+
+        # Act
+        cleanup = asyncio.create_task(sync_instance.clean_daily_shifts())
+        await checking.wait()
+        await in_memory_repo.save(daily_shift=new_day.to_model())
+        release.set()
+        await cleanup
+
+        # Assert
+        result_data = self._read_daily_shifts(temp_dir)
+        assert {int(day_id) for day_id in result_data} == {DayIds.DAY_2, DayIds.DAY_3, DayIds.DAY_4}
+        assert [bill["id"] for bill in result_data[str(DayIds.DAY_4)]["bills"]] == ["new_bill"]
+        assert (await in_memory_repo.get(DayIds.DAY_4)).bills[0].id == "new_bill"  # type: ignore
@@ -0,0 +1,110 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.commons import time
+from app.register import ports, usecases
+from tests.test_constants import DayIds
+
+
+class TestClock:
+    """Test suite for the cached day clock"""
+
+    # 2024-01-01 00:00 in Colombia (UTC-5)
+    MIDNIGHT = DayIds.DAY_1 + 5 * 3600
+
+    def test_day_start_uses_colombian_midnight(self) -> None:
+        """Test day ids are the POSIX time of the local midnight"""
+        # Act & Assert
+        assert time.get_day_start(self.MIDNIGHT) == self.MIDNIGHT
+        assert time.get_day_start(self.MIDNIGHT + 86399) == self.MIDNIGHT
+        assert time.get_day_start(self.MIDNIGHT - 1) == self.MIDNIGHT - time.DAY_SECONDS
+
+    def test_manual_clock_rolls_over_exactly_at_midnight(self) -> None:
+        """Test the day changes on the first second of the next day and notifies listeners"""
+        # Arrange
+        clock = time.ManualClock(start_time=self.MIDNIGHT + 10)
+        rollovers = []
+        clock.on_rollover(lambda previous, current: rollovers.append((previous, current)))
+
+        # Act
+        clock.advance(time.DAY_SECONDS - 11)
+        day_before_midnight = clock.current_day
+        clock.advance(1)
+
+        # Assert
+        assert day_before_midnight == self.MIDNIGHT
+        assert clock.current_day == self.MIDNIGHT + time.DAY_SECONDS
+        assert rollovers == [(self.MIDNIGHT, self.MIDNIGHT + time.DAY_SECONDS)]
+
+    def test_manual_clock_simulates_weeks(self) -> None:
+        """Test a week of trading runs instantly with one rollover per day"""
+        # Arrange
+        clock = time.ManualClock(start_time=self.MIDNIGHT)
+        days = []
+        clock.on_rollover(lambda previous, current: days.append(current))
+
+        # Act
+        for _ in range(7 * 24):
+            clock.advance(3600)
+
+        # Assert
+        assert days == [self.MIDNIGHT + i * time.DAY_SECONDS for i in range(1, 8)]
+
+    @pytest.mark.asyncio
+    async def test_timer_rolls_over_on_the_event_loop(self) -> None:
+        """Test a started clock is updated by its timer, not by reads"""
+        # Arrange
+        now = [self.MIDNIGHT + time.DAY_SECONDS - 0.05]
+        clock = time.Clock(now=lambda: now[0])
+        clock.start()
+
+        # Act
+        now[0] += 0.05
+        await asyncio.sleep(0.1)
+
+        # Assert
+        assert clock._current_day == self.MIDNIGHT + time.DAY_SECONDS
+        clock.stop()
+
+    @pytest.mark.asyncio
+    async def test_started_clock_follows_wall_clock_jumps(self) -> None:
+        """Test reads notice a suspend or a clock step before the late timer fires"""
+        # Arrange
+        now = [self.MIDNIGHT + 3600]
+        clock = time.Clock(now=lambda: now[0])
+        clock.start()
+        days = []
+        clock.on_rollover(lambda previous, current: days.append(current))
+
+        # Act
+        now[0] += 2 * time.DAY_SECONDS
+        after_suspend = clock.current_day
+        now[0] -= time.DAY_SECONDS
+        after_step_back = clock.current_day
+
+        # Assert
+        assert after_suspend == self.MIDNIGHT + 2 * time.DAY_SECONDS
+        assert after_step_back == self.MIDNIGHT + time.DAY_SECONDS
+        assert days == [self.MIDNIGHT + 2 * time.DAY_SECONDS, self.MIDNIGHT + time.DAY_SECONDS]
+        clock.stop()
+
+    @pytest.mark.asyncio
+    async def test_register_saves_bills_in_the_clock_day(self) -> None:
+        """Test the register files bills under the injected clock's day"""
+        # Arrange
+        clock = time.ManualClock(start_time=self.MIDNIGHT + 3600)
+        repo = AsyncMock(spec=ports.Repository)
+        repo.get.return_value = None
+        register = usecases.Register(repo=repo, clock=clock)
+        register.add_item(price=1000)
+        clock.advance(time.DAY_SECONDS)
+
+        # Act
+        await register.save_bill()
+
+        # Assert
+        saved_shift = repo.save.call_args.kwargs["daily_shift"]
+        assert saved_shift.id == self.MIDNIGHT + time.DAY_SECONDS
+        repo.get.assert_called_once_with(self.MIDNIGHT + time.DAY_SECONDS)
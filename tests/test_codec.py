@@ -0,0 +1,67 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.register import adapters, codec, model
+from tests.test_constants import DayIds, BillIds, DataFactory
+
+
+class TestCodec:
+    """Test suite for the compact DailyShift encoding"""
+
+    @pytest.fixture
+    def daily_shift(self) -> model.DailyShift:
+        """Create a day with items so every column is populated"""
+        daily_shift = DataFactory.create_multi_day_scenario()[str(DayIds.DAY_2)].to_model()
+        daily_shift.bills[0].add_item(model.Item(id="7", price=1500.0, quantity=2))
+        daily_shift.bills[0].add_item(model.Item(id="1", price=-200.0, quantity=1))
+        return daily_shift
+
+    def test_round_trip(self, daily_shift: model.DailyShift) -> None:
+        """Test decoding returns the same day that was encoded"""
+        # Act
+        decoded = codec.decode_daily_shift(codec.encode_daily_shift(daily_shift))
+
+        # Assert
+        assert decoded == daily_shift
+
+    def test_round_trip_empty_day(self) -> None:
+        """Test a day without bills survives the encoding"""
+        # Arrange
+        daily_shift = DataFactory.create_daily_shift(DayIds.DAY_1, []).to_model()
+
+        # Act & Assert
+        assert codec.decode_daily_shift(codec.encode_daily_shift(daily_shift)) == daily_shift
+
+    def test_summary(self, daily_shift: model.DailyShift) -> None:
+        """Test the uncompressed summary keeps what the reporter reads"""
+        # Act
+        summary = codec.summarize_daily_shift(daily_shift)
+
+        # Assert
+        assert summary == {
+            "id": DayIds.DAY_2,
+            "total": daily_shift.total,
+            "bills_count": 2,
+            "last_bill_id": BillIds.BILL_4,
+            "digest": None,
+        }
+
+    @pytest.mark.asyncio
+    async def test_dynamodb_compressed_item(self, daily_shift: model.DailyShift) -> None:
+        """Test the day layout stores and reads back the compressed payload"""
+        # Arrange
+        table = MagicMock()
+        dynamo_db = adapters.DynamoDb(table_name="daily_shifts", access_key="", secret_key="", compress=True, table=table)
+
+        # Act
+        await dynamo_db.save(daily_shift=daily_shift)
+        stored = table.put_item.call_args.kwargs["Item"]
+        table.get_item.return_value = {"Item": stored}
+        loaded = await dynamo_db.get(DayIds.DAY_2)
+
+        # Assert
+        assert isinstance(stored["payload"], bytes)
+        assert "bills" not in stored
+        assert stored["total"] == daily_shift.total
+        assert loaded == daily_shift
@@ -0,0 +1,103 @@
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.register import adapters
+from tests.test_constants import DayIds, BillIds, DataFactory
+
+
+class TestDynamoDbBills:
+    """Test suite for the bill-level DynamoDB layout"""
+
+    @pytest.fixture
+    def table(self) -> MagicMock:
+        """Create a mock boto3 table with no stored bills"""
+        table = MagicMock()
+        table.query.return_value = {"Items": []}
+        return table
+
+    @pytest.fixture
+    def dynamo_db(self, table: MagicMock) -> adapters.DynamoDbBills:
+        """Create a DynamoDbBills adapter on top of the mock table"""
+        return adapters.DynamoDbBills(table_name="daily_shift_bills", access_key="", secret_key="", table=table)
+
+    @staticmethod
+    def _written_bill_ids(table: MagicMock) -> list[str]:
+        batch = table.batch_writer.return_value.__enter__.return_value
+        return [call.kwargs["Item"]["bill_id"] for call in batch.put_item.call_args_list]
+
+    @pytest.mark.asyncio
+    async def test_save_writes_bills_and_summary(self, dynamo_db: adapters.DynamoDbBills, table: MagicMock) -> None:
+        """Test the first save writes every bill plus the day summary"""
+        # Arrange
+        daily_shift = DataFactory.create_multi_day_scenario()[str(DayIds.DAY_2)].to_model()
+
+        # Act
+        await dynamo_db.save(daily_shift=daily_shift)
+
+        # Assert
+        assert sorted(self._written_bill_ids(table)) == [BillIds.BILL_3, BillIds.BILL_4]
+        summary = table.put_item.call_args.kwargs["Item"]
+        assert summary["bill_id"] == adapters.SUMMARY_SORT_KEY
+        assert summary["day"] == DayIds.DAY_2
+        assert summary["bills_count"] == 2
+        assert summary["last_bill_id"] == BillIds.BILL_4
+        assert summary["total"] == Decimal("500.0")
+
+    @pytest.mark.asyncio
+    async def test_save_only_writes_new_bills(self, dynamo_db: adapters.DynamoDbBills, table: MagicMock) -> None:
+        """Test a second save of the same day only writes the bills added since"""
+        # Arrange
+        daily_shift = DataFactory.create_daily_shift(DayIds.DAY_1, [DataFactory.create_bill(BillIds.BILL_1, DayIds.DAY_1)]).to_model()
+        await dynamo_db.save(daily_shift=daily_shift)
+        table.batch_writer.return_value.__enter__.return_value.put_item.reset_mock()
+        daily_shift.add_bill(DataFactory.create_bill(BillIds.BILL_2, DayIds.DAY_1).to_model())
+
+        # Act
+        await dynamo_db.save(daily_shift=daily_shift)
+
+        # Assert
+        assert self._written_bill_ids(table) == [BillIds.BILL_2]
+        assert table.query.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_save_skips_days_without_new_bills(self, dynamo_db: adapters.DynamoDbBills, table: MagicMock) -> None:
+        """Test nothing is written when DynamoDB already has every bill"""
+        # Arrange
+        table.query.return_value = {"Items": [{"bill_id": BillIds.BILL_5}, {"bill_id": adapters.SUMMARY_SORT_KEY}]}
+        daily_shift = DataFactory.create_multi_day_scenario()[str(DayIds.DAY_3)].to_model()
+
+        # Act
+        await dynamo_db.save(daily_shift=daily_shift)
+
+        # Assert
+        table.batch_writer.assert_not_called()
+        table.put_item.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_rebuilds_daily_shift(self, dynamo_db: adapters.DynamoDbBills, table: MagicMock) -> None:
+        """Test get assembles the day from its bill items in chronological order"""
+        # Arrange
+        table.query.return_value = {
+            "Items": [
+                {"day": DayIds.DAY_2, "bill_id": adapters.SUMMARY_SORT_KEY, "total": Decimal("500"), "bills_count": 2},
+                {"day": DayIds.DAY_2, "bill_id": BillIds.BILL_4, "created_at": Decimal(2), "items": [], "total": Decimal("300")},
+                {"day": DayIds.DAY_2, "bill_id": BillIds.BILL_3, "created_at": Decimal(1), "items": [], "total": Decimal("200")},
+            ]
+        }
+
+        # Act
+        daily_shift = await dynamo_db.get(DayIds.DAY_2)
+
+        # Assert
+        assert daily_shift is not None
+        assert daily_shift.id == DayIds.DAY_2
+        assert [bill.id for bill in daily_shift.bills] == [BillIds.BILL_3, BillIds.BILL_4]
+        assert daily_shift.total == 500.0
+
+    @pytest.mark.asyncio
+    async def test_get_missing_day(self, dynamo_db: adapters.DynamoDbBills) -> None:
+        """Test get returns None for a day without items"""
+        # Act & Assert
+        assert await dynamo_db.get(DayIds.DAY_1) is None
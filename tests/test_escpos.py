@@ -0,0 +1,40 @@
+import datetime
+
+from app.register import model
+from app.register.entrypoints.view import escpos
+
+PRINTED_AT = datetime.datetime(2025, 7, 31, 18, 5, 9)
+
+
+class TestReceiptTemplate:
+    def _bill(self) -> model.Bill:
+        items = [model.Item(id="1", price=price, quantity=1) for price in (1000, 2500)]
+        return model.Bill(items=items, total=3500)
+
+    def test_render_is_a_single_escpos_buffer(self):
+        # Arrange
+        template = escpos.ReceiptTemplate()
+        # Act
+        data = template.render(self._bill(), PRINTED_AT)
+        # Assert
+        assert data.startswith(escpos.INIT + escpos.ALIGN_CENTER + escpos.DOUBLE_HEIGHT + b"CACHARRERIA MUNOZ\n")
+        assert b"31-7-2025 18:5:9\n" in data
+        assert b"Productos: \n$ 1,000\n$ 2,500\n" in data
+        assert b"Total\n" + escpos.ALIGN_LEFT + b"$ 3,500\n" in data
+        assert data.endswith(escpos.CUT)
+
+    def test_drawer_kick_is_appended_on_request(self):
+        # Arrange
+        template = escpos.ReceiptTemplate()
+        # Act
+        data = template.render(self._bill(), PRINTED_AT, open_drawer=True)
+        # Assert
+        assert data.endswith(escpos.CUT + escpos.DRAWER_KICK)
+
+    def test_text_is_encoded_with_the_printer_code_page(self):
+        # Arrange
+        template = escpos.ReceiptTemplate(header=["Cacharrería"], encoding="cp437")
+        # Act
+        data = template.render(self._bill(), PRINTED_AT)
+        # Assert
+        assert "Cacharrería\n".encode("cp437") in data
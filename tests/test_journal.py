@@ -0,0 +1,108 @@
+from pathlib import Path
+
+import pytest
+
+from app.commons import time
+from app.register import adapters, events, model, usecases
+from app.register.journal import EventJournal, SalesTail
+from tests.test_constants import FileNames
+
+
+class TestJournal:
+    """Test suite for the bill journal and the dashboard tail"""
+
+    @staticmethod
+    def _saved(day_id: int, total: float, created_at: int) -> events.BillSaved:
+        bill = model.Bill(items=[model.Item(id="1", price=total, quantity=1)], total=total, created_at=created_at)
+        return events.BillSaved(day=day_id, bill=bill)
+
+    @pytest.mark.asyncio
+    async def test_saved_bills_are_journaled(self, temp_dir: Path, clock: time.ManualClock) -> None:
+        """Test every bill the registers save is appended to the day's journal"""
+        # Arrange
+        journal = EventJournal(str(temp_dir / "journal"))
+        repo = adapters.InMemoryRepo(path_file=str(temp_dir / FileNames.DAILY_SHIFTS_JSON), clock=clock)
+        lanes = usecases.Lanes(repo=repo, clock=clock, journal=journal)
+        tail = SalesTail(str(temp_dir / "journal"), clock=clock)
+
+        # Act
+        for lane, price in (("1", 1000), ("2", 3000), ("1", 2000)):
+            lanes.get(lane).add_item(price=price)
+            await lanes.get(lane).save_bill()
+        journal.flush()
+        tail.poll()
+
+        # Assert
+        assert (tail.sales.bills, tail.sales.total, tail.sales.average_ticket) == (3, 6000, 2000)
+        assert tail.offset == Path(journal.path(clock.current_day)).stat().st_size
+
+    def test_tail_reads_only_new_complete_lines(self, temp_dir: Path, clock: time.ManualClock) -> None:
+        """Test a poll reads from the previous offset and leaves half written lines"""
+        # Arrange
+        journal = EventJournal(str(temp_dir / "journal"))
+        tail = SalesTail(str(temp_dir / "journal"), clock=clock)
+        day_id = clock.current_day
+        journal.append(self._saved(day_id, 1000, (day_id + 8 * 3600) * 1_000_000_000))
+        journal.flush()
+        tail.poll()
+        offset = tail.offset
+
+        # Act
+        journal.append(self._saved(day_id, 4000, (day_id + 9 * 3600 + 60) * 1_000_000_000))
+        journal.flush()
+        with open(journal.path(day_id), "ab") as file:
+            file.write(b'{"type":"bill_saved","day":')
+        new_bills = tail.poll()
+        nothing_new = tail.poll()
+
+        # Assert
+        assert new_bills and not nothing_new
+        assert tail.offset > offset
+        assert tail.sales.bills == 2
+        assert {hour: tuple(values) for hour, values in tail.sales.by_hour.items()} == {8: (1, 1000), 9: (1, 4000)}
+        assert [bill.total for bill in tail.snapshot()["last_bills"]] == [1000, 4000]
+
+    def test_new_day_starts_over_and_old_journals_are_pruned(self, temp_dir: Path, clock: time.ManualClock) -> None:
+        """Test the tail follows the new day's file and the journal keeps keep_days days"""
+        # Arrange
+        journal = EventJournal(str(temp_dir / "journal"), keep_days=1)
+        tail = SalesTail(str(temp_dir / "journal"), clock=clock)
+        first_day = clock.current_day
+        journal.append(self._saved(first_day, 1000, (first_day + 3600) * 1_000_000_000))
+        journal.flush()
+        tail.poll()
+
+        # Act
+        clock.advance(time.DAY_SECONDS)
+        second_day = clock.current_day
+        journal.append(self._saved(second_day, 2500, (second_day + 3600) * 1_000_000_000))
+        journal.flush()
+        tail.poll()
+        clock.advance(time.DAY_SECONDS)
+        journal.append(self._saved(clock.current_day, 500, (clock.current_day + 3600) * 1_000_000_000))
+        journal.close()
+
+        # Assert
+        assert (tail.day_id, tail.sales.bills, tail.sales.total) == (second_day, 1, 2500)
+        assert not Path(journal.path(first_day)).exists()
+        assert Path(journal.path(second_day)).exists()
+
+    def test_writer_thread_writes_the_queued_events_in_batches(self, temp_dir: Path, clock: time.ManualClock) -> None:
+        """Test appended events reach the files in order, across a day change, and close stops the writer"""
+        # Arrange
+        journal = EventJournal(str(temp_dir / "journal"), batch_size=4)
+        first_day = clock.current_day
+        second_day = first_day + time.DAY_SECONDS
+
+        # Act
+        for total in range(1, 11):
+            journal.append(self._saved(first_day, total, (first_day + 3600) * 1_000_000_000))
+        journal.append(self._saved(second_day, 99, (second_day + 3600) * 1_000_000_000))
+        journal.close()
+
+        # Assert
+        with open(journal.path(first_day), "rb") as file:
+            assert [events.load_event(line).bill.total for line in file] == list(range(1, 11))  # type: ignore
+        with open(journal.path(second_day), "rb") as file:
+            assert [events.load_event(line).bill.total for line in file] == [99]  # type: ignore
+        assert journal._writer is None
@@ -0,0 +1,87 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from app.commons import time
+from app.register import adapters, usecases
+from benchmarks import fakes
+from tests.test_constants import FileNames
+
+
+class TestLanes:
+    """Test suite for several checkout lanes sharing one InMemoryRepo"""
+
+    LANES = 8
+    BILLS_PER_LANE = 25
+
+    @pytest.fixture
+    def repo(self, temp_dir: Path, clock: time.ManualClock) -> adapters.InMemoryRepo:
+        return adapters.InMemoryRepo(path_file=str(temp_dir / FileNames.DAILY_SHIFTS_JSON), clock=clock)
+
+    @staticmethod
+    async def _sell(register: usecases.Register, bills: int, price: float) -> None:
+        for _ in range(bills):
+            register.add_item(price=price)
+            register.add_item(price=price)
+            await register.save_bill()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lanes_keep_every_bill(self, temp_dir: Path, repo: adapters.InMemoryRepo, clock: time.ManualClock) -> None:
+        """Test lanes saving at the same time lose no bill and share disk writes"""
+        # Arrange
+        lanes = usecases.Lanes(repo=repo, clock=clock)
+        writes = []
+        write_daily_shifts = repo._write_daily_shifts
+
+        def counting_write(*args, **kwargs) -> None:
+            writes.append(1)
+            write_daily_shifts(*args, **kwargs)
+
+        repo._write_daily_shifts = counting_write  # type: ignore
+
+        # Act
+        await asyncio.gather(*(self._sell(lanes.get(str(lane)), self.BILLS_PER_LANE, 1000 * lane) for lane in range(1, self.LANES + 1)))
+
+        # Assert
+        bills = self.LANES * self.BILLS_PER_LANE
+        with open(temp_dir / FileNames.DAILY_SHIFTS_JSON) as file:
+            stored = json.load(file)[str(clock.current_day)]
+        assert len(stored["bills"]) == bills
+        assert len({bill["id"] for bill in stored["bills"]}) == bills
+        assert stored["total"] == sum(2000 * lane * self.BILLS_PER_LANE for lane in range(1, self.LANES + 1))
+        # about one write per round of the lanes, not one per bill
+        assert len(writes) <= 2 * self.BILLS_PER_LANE
+        assert lanes.ids() == [str(lane) for lane in range(1, self.LANES + 1)]
+
+    @pytest.mark.asyncio
+    async def test_each_lane_has_its_own_bill(self, repo: adapters.InMemoryRepo, clock: time.ManualClock) -> None:
+        """Test items typed in one lane do not show up in another"""
+        # Arrange
+        lanes = usecases.Lanes(repo=repo, clock=clock)
+
+        # Act
+        lanes.get("1").add_item(price=1000)
+        lanes.get("2").add_item(price=2500)
+        await lanes.get("2").save_bill()
+
+        # Assert
+        assert lanes.get("1").get_current_bill().total == 1000  # type: ignore
+        daily_shift = await repo.get(clock.current_day)
+        assert daily_shift is not None
+        assert [bill.total for bill in daily_shift.bills] == [2500]
+
+    def test_day_lock_is_one_lock_per_day(self, repo: adapters.InMemoryRepo) -> None:
+        """Test every repository hands out the same lock for a day and a different one for another day"""
+        # Arrange
+        repos = [
+            repo,
+            adapters.DynamoDb(table_name="", access_key="", secret_key="", table=fakes.FakeTable()),
+            adapters.DynamoDbBills(table_name="", access_key="", secret_key="", table=fakes.FakeTable(fakes.BILL_LAYOUT_KEYS)),
+        ]
+
+        # Act & Assert
+        for each_repo in repos:
+            assert each_repo.day_lock(1) is each_repo.day_lock(1)
+            assert each_repo.day_lock(1) is not each_repo.day_lock(2)
@@ -0,0 +1,47 @@
+import gzip
+import json
+import logging
+
+from app.commons import logger as log
+
+
+class TestQueueLogger:
+    def test_records_are_written_by_the_listener(self, tmp_path):
+        # Arrange
+        log_file = tmp_path / "app.log"
+        logger = log.setup_logger("test_text_logger", str(log_file))
+        # Act
+        for i in range(3):
+            logger.info(f"bill {i} saved")
+        log.stop_logger("test_text_logger")
+        # Assert
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 3
+        assert lines[0].endswith("INFO - test_logger.test_records_are_written_by_the_listener - bill 0 saved")
+
+    def test_json_lines(self, tmp_path):
+        # Arrange
+        log_file = tmp_path / "app.log"
+        logger = log.setup_logger("test_json_logger", str(log_file), json_lines=True)
+        # Act
+        logger.warning("printer offline")
+        log.stop_logger("test_json_logger")
+        # Assert
+        record = json.loads(log_file.read_text())
+        assert record["level"] == "WARNING"
+        assert record["message"] == "printer offline"
+
+    def test_rotated_files_are_compressed(self, tmp_path):
+        # Arrange
+        log_file = tmp_path / "app.log"
+        logger = log.setup_logger("test_rotating_logger", str(log_file), max_bytes=200, backup_count=2)
+        # Act
+        for i in range(10):
+            logger.info(f"day {i} synced")
+        log.stop_logger("test_rotating_logger")
+        # Assert
+        rotated = tmp_path / "app.log.1.gz"
+        assert rotated.exists()
+        assert b"synced" in gzip.decompress(rotated.read_bytes())
+        assert not (tmp_path / "app.log.3.gz").exists()
+        assert logging.getLogger("test_rotating_logger").handlers == []
@@ -0,0 +1,62 @@
+import pytest
+
+from app.commons.metrics import Histogram, Metrics
+
+
+class TestMetrics:
+    def test_disabled_metrics_record_nothing(self):
+        # Arrange
+        metrics = Metrics()
+
+        @metrics.timed("add_item_seconds")
+        def add_item() -> int:
+            return 1
+
+        # Act
+        result = add_item()
+        metrics.inc("bills_saved_total")
+        # Assert
+        assert result == 1
+        assert metrics.histograms == {}
+        assert metrics.counters == {}
+
+    @pytest.mark.asyncio
+    async def test_timed_coroutines_record_failed_calls(self):
+        # Arrange
+        metrics = Metrics(enabled=True)
+
+        @metrics.timed('dynamodb_seconds{op="save"}')
+        async def save() -> None:
+            raise OSError("throttled")
+
+        # Act
+        with pytest.raises(OSError):
+            await save()
+        # Assert
+        assert metrics.histograms['dynamodb_seconds{op="save"}'].count == 1
+
+    def test_render_prometheus_text(self):
+        # Arrange
+        metrics = Metrics(enabled=True)
+        metrics.inc("bills_saved_total", 2)
+        metrics.observe('dynamodb_seconds{op="get"}', 0.003)
+        metrics.observe('dynamodb_seconds{op="get"}', 2)
+        # Act
+        text = metrics.render()
+        # Assert
+        assert "# TYPE bills_saved_total counter\nbills_saved_total 2\n" in text
+        assert "# TYPE dynamodb_seconds histogram" in text
+        assert 'dynamodb_seconds_bucket{op="get",le="0.001"} 0' in text
+        assert 'dynamodb_seconds_bucket{op="get",le="0.005"} 1' in text
+        assert 'dynamodb_seconds_bucket{op="get",le="+Inf"} 2' in text
+        assert 'dynamodb_seconds_count{op="get"} 2' in text
+
+    def test_histogram_quantile_is_a_bucket_bound(self):
+        # Arrange
+        histogram = Histogram(buckets=(0.001, 0.01, 0.1))
+        # Act
+        for value in [0.0005] * 98 + [0.05, 0.05]:
+            histogram.observe(value)
+        # Assert
+        assert histogram.quantile(0.5) == 0.001
+        assert histogram.quantile(0.99) == 0.1
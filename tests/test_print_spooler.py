@@ -0,0 +1,84 @@
+import os
+
+import pytest
+
+from app.register import model
+from app.register.entrypoints.view import escpos, printing
+
+
+class FlakyBackend(printing.PrinterBackend):
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.printed: list[printing.Receipt] = []
+
+    def print_receipt(self, receipt: printing.Receipt) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise OSError("printer offline")
+        self.printed.append(receipt)
+
+
+class TestPrintSpooler:
+    @pytest.mark.asyncio
+    async def test_submit_returns_before_printing(self):
+        # Arrange
+        backend = FlakyBackend(failures=0)
+        spooler = printing.PrintSpooler(backend)
+        spooler.start()
+        # Act
+        job = spooler.submit(printing.drawer_kick())
+        # Assert
+        assert job.status == printing.JobStatus.QUEUED
+        await spooler.join()
+        assert job.status == printing.JobStatus.DONE
+        assert backend.printed == [job.receipt]
+        await spooler.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_jobs_are_retried(self):
+        # Arrange
+        spooler = printing.PrintSpooler(FlakyBackend(failures=1), max_attempts=3, retry_delay=0)
+        spooler.start()
+        # Act
+        job = spooler.submit(printing.drawer_kick())
+        await spooler.join()
+        # Assert
+        assert job.status == printing.JobStatus.DONE
+        assert job.attempts == 2
+        await spooler.stop()
+
+    @pytest.mark.asyncio
+    async def test_job_fails_after_max_attempts(self):
+        # Arrange
+        spooler = printing.PrintSpooler(FlakyBackend(failures=5), max_attempts=2, retry_delay=0)
+        spooler.start()
+        # Act
+        job = spooler.submit(printing.drawer_kick())
+        await spooler.join()
+        # Assert
+        assert job.status == printing.JobStatus.FAILED
+        assert job.error == "printer offline"
+        await spooler.stop()
+
+
+class TestFileBackends:
+    def test_file_backend_appends_the_receipt(self, tmp_path):
+        # Arrange
+        path = tmp_path / "printer.txt"
+        bill = model.Bill(items=[model.Item(id="1", price=2500, quantity=1)], total=2500)
+        # Act
+        printing.FileBackend(str(path)).print_receipt(printing.bill_receipt(bill))
+        printing.FileBackend(str(path)).print_receipt(printing.drawer_kick())
+        # Assert
+        data = path.read_bytes()
+        assert b"CACHARRERIA MUNOZ" in data
+        assert b"$ 2,500" in data
+        assert data.endswith(escpos.CUT + escpos.DRAWER_KICK)
+
+    def test_device_backend_is_never_created(self, tmp_path):
+        # Arrange
+        path = tmp_path / "lp0"
+        # Act / Assert
+        with pytest.raises(FileNotFoundError):
+            printing.DeviceBackend(str(path)).print_receipt(printing.drawer_kick())
+        assert not os.path.exists(path)
@@ -0,0 +1,25 @@
+import asyncio
+
+import pytest
+
+from app.commons.profiling import Profiler
+
+
+class TestProfiler:
+    @pytest.mark.asyncio
+    async def test_window_writes_timestamped_reports(self, tmp_path):
+        # Arrange
+        profiler = Profiler(str(tmp_path))
+        # Act
+        assert profiler.start(0.05)
+        assert not profiler.start(0.05)
+        _ = [{"bill": i} for i in range(1000)]
+        await asyncio.sleep(0.1)
+        # Assert
+        assert not profiler.running
+        report = profiler.last_report
+        assert report is not None and report.endswith(".txt")
+        assert (tmp_path / report.split("/")[-1].replace(".txt", ".prof")).exists()
+        text = open(report).read()
+        assert "cumulative" in text
+        assert "allocating lines" in text
@@ -0,0 +1,53 @@
+import io
+
+from app.register import model
+from app.register.entrypoints.view.renderer import CLEAR_SCREEN, CLEAR_TO_END, BillRenderer, move_to
+
+
+class TestBillRenderer:
+    def _bill(self, prices: list[float]) -> model.Bill:
+        bill = model.Bill(items=[], total=0)
+        for price in prices:
+            bill.add_item(model.Item(id="1", price=price, quantity=1))
+        return bill
+
+    def test_adding_an_item_only_repaints_from_its_line(self):
+        # Arrange
+        out = io.StringIO()
+        renderer = BillRenderer(out=out, rows=40)
+        bill = self._bill([1000, 2000])
+        renderer.render(bill)
+        out.seek(0)
+        out.truncate()
+        # Act
+        bill.add_item(model.Item(id="1", price=2500, quantity=1))
+        renderer.render(bill)
+        # Assert
+        painted = out.getvalue()
+        assert painted.startswith(move_to(5) + CLEAR_TO_END)
+        assert CLEAR_SCREEN not in painted
+        assert "2,000" not in painted
+
+    def test_invalidate_repaints_the_whole_bill(self):
+        # Arrange
+        out = io.StringIO()
+        renderer = BillRenderer(out=out, rows=40)
+        bill = self._bill([1000])
+        renderer.render(bill)
+        # Act
+        renderer.invalidate()
+        renderer.render(bill)
+        # Assert
+        assert out.getvalue().count(CLEAR_SCREEN) == 2
+
+    def test_tall_bill_shows_its_last_items(self):
+        # Arrange
+        out = io.StringIO()
+        renderer = BillRenderer(out=out, rows=10)
+        # Act
+        renderer.render(self._bill([float(1000 + i) for i in range(20)]))
+        # Assert
+        painted = out.getvalue()
+        assert "... 17 productos más" in painted
+        assert "1,019" in painted
+        assert "1,002" not in painted
@@ -0,0 +1,45 @@
+import pytest
+
+from app.register.entrypoints.view import session
+from benchmarks import replay_session
+
+
+class TestSessionFile:
+    def test_parse_session_line(self):
+        # Arrange / Act / Assert
+        assert session.parse_session_line("1.250\t12000\n") == (1.25, "12000")
+        assert session.parse_session_line("0.400\t\n") == (0.4, "")
+        assert session.parse_session_line("t 2\n") == (None, "t 2")
+
+    @pytest.mark.asyncio
+    async def test_recording_input_appends_every_command(self, tmp_path):
+        # Arrange
+        path = tmp_path / "session.txt"
+        typed = iter(["5000", "", "t"])
+
+        async def keyboard(prompt: str) -> str:
+            return next(typed)
+
+        read_command = session.recording_input(str(path), read_command=keyboard)
+        # Act
+        commands = [await read_command("") for _ in range(3)]
+        # Assert
+        assert commands == ["5000", "", "t"]
+        assert replay_session.load_script(str(path))[0] == ["5000", "", "t"]
+
+
+class TestReplaySession:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("target", ["view", "register"])
+    async def test_replay_saves_every_bill(self, target: str, tmp_path, monkeypatch):
+        # Arrange
+        monkeypatch.chdir(tmp_path)
+        commands = replay_session.synthetic_script(bills=100, seed=1)
+        # Act
+        result = await replay_session.replay(commands, [0.0] * len(commands), target=target, dynamo_latency_ms=0)
+        # Assert
+        assert result["bills"] == 100
+        assert result["latency"]["enter"]["samples"] + result["latency"].get("nt_value", {"samples": 0})["samples"] == 100
+        # the script forces a sync every 100 bills and the background sync runs along the session
+        assert sum(result["dynamo_requests"].values()) >= 1
+        assert result["background_syncs"] >= 1
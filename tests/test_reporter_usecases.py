@@ -0,0 +1,34 @@
+import pytest
+import pytest_asyncio
+
+from app.commons import time
+from app.register import adapters, model
+from app.reporter import usecases
+from benchmarks import fakes
+from tests.test_constants import BillIds
+
+
+class TestReporterWithInjectedTable:
+    @pytest_asyncio.fixture
+    async def table(self) -> fakes.FakeTable:
+        """Bill layout stand-in with two synced days"""
+        table = fakes.FakeTable(fakes.BILL_LAYOUT_KEYS)
+        db = adapters.DynamoDbBills(table_name="", access_key="", secret_key="", table=table)
+        days = [("01-01-2024", BillIds.BILL_1, 1000), ("02-01-2024", BillIds.BILL_2, 3000)]
+        for date, bill_id, total in days:
+            day_id = time.get_day_from_date(date)
+            daily_shift = model.DailyShift(id=day_id, bills=[], total=0)
+            daily_shift.add_bill(model.Bill(id=bill_id, items=[], total=total))
+            await db.save(daily_shift)
+        return table
+
+    @pytest.mark.asyncio
+    async def test_range_report_reads_one_summary_per_day(self, table: fakes.FakeTable, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(usecases, "TABLE_LAYOUT", "bill")
+        table.requests.clear()
+        # Act
+        result = usecases.get_daily_report({"start-date": "01-01-2024", "end-date": "02-01-2024"}, table=table)
+        # Assert
+        assert result == {"total": "$ 4,000", "max": "$ 3,000", "min": "$ 1,000", "avg": "$ 2,000"}
+        assert table.requests == {"query": 2}
@@ -0,0 +1,52 @@
+import io
+
+from app.register import model
+from app.register.entrypoints.view.sales import HOUR_NS, SalesScreen
+from tests.test_constants import DayIds
+
+NOW = 1_722_000_000 * 1_000_000_000
+
+
+class TestSalesScreen:
+    def _daily_shift(self, created_ats: list[int], day_id: int = DayIds.DAY_1) -> model.DailyShift:
+        daily_shift = model.DailyShift(id=day_id, bills=[], total=0)
+        for created_at in created_ats:
+            daily_shift.add_bill(model.Bill(created_at=created_at, items=[], total=1000))
+        return daily_shift
+
+    def test_only_new_bills_are_added_to_the_counters(self):
+        # Arrange
+        screen = SalesScreen(out=io.StringIO(), rows=20, now=lambda: NOW)
+        daily_shift = self._daily_shift([NOW - 2 * HOUR_NS, NOW - 10])
+        screen.update(daily_shift)
+        # Act
+        daily_shift.add_bill(model.Bill(created_at=NOW, items=[], total=500))
+        screen.update(daily_shift)
+        # Assert
+        assert screen.bills_count == 3
+        assert screen.total == daily_shift.total == 2500
+        assert screen.last_hour_total == 1500
+
+    def test_a_new_day_starts_over(self):
+        # Arrange
+        screen = SalesScreen(out=io.StringIO(), rows=20, now=lambda: NOW)
+        screen.update(self._daily_shift([NOW, NOW]))
+        # Act
+        screen.update(self._daily_shift([NOW], day_id=DayIds.DAY_2))
+        # Assert
+        assert screen.bills_count == 1
+        assert screen.total == 1000
+
+    def test_show_paints_only_the_requested_page(self):
+        # Arrange
+        out = io.StringIO()
+        screen = SalesScreen(out=out, rows=14, now=lambda: NOW)
+        daily_shift = self._daily_shift([NOW] * 12)
+        # Act
+        screen.show(daily_shift, page=1)
+        # Assert
+        painted = out.getvalue()
+        assert screen.page_size() == 5
+        assert "Página 1 de 3" in painted
+        assert painted.count("$ 1,000") == 5
+        assert "Facturas: 12" in painted
@@ -0,0 +1,80 @@
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock
+from typing import Any, Callable, Dict
+
+import pytest
+
+from app.commons import time
+from app.register.entrypoints.cron import Sync
+from app.register import adapters
+from tests.test_constants import DayIds, BillIds, FileNames, DataFactory
+
+
+class TestSealedDays:
+    """Test suite for sealing closed days and digest based sync checks"""
+
+    @pytest.fixture
+    def mock_db(self) -> AsyncMock:
+        """Create a mock DynamoDB repository"""
+        return AsyncMock()
+
+    @pytest.fixture
+    def in_memory_repo(
+        self, temp_dir: Path, clock: time.ManualClock, write_test_data: Callable[[Dict[str, Any]], None]
+    ) -> adapters.InMemoryRepo:
+        """Create a real InMemoryRepo loaded with the multi day scenario"""
+        write_test_data(DataFactory.create_multi_day_scenario())
+        return adapters.InMemoryRepo(path_file=str(temp_dir / FileNames.DAILY_SHIFTS_JSON), hot_days=3, clock=clock)
+
+    @pytest.fixture
+    def sync_instance(self, mock_db: AsyncMock, in_memory_repo: adapters.InMemoryRepo, clock: time.ManualClock) -> Sync:
+        """Create a Sync instance with mocked DB and real in-memory repo"""
+        return Sync(db=mock_db, in_memory_repo=in_memory_repo, clock=clock)
+
+    def test_sealed_day_rejects_bills(self) -> None:
+        """Test a sealed day keeps a digest of its bills and refuses new ones"""
+        # Arrange
+        daily_shift = DataFactory.create_multi_day_scenario()[str(DayIds.DAY_1)].to_model()
+
+        # Act
+        daily_shift.seal()
+
+        # Assert
+        assert daily_shift.sealed
+        assert daily_shift.digest == daily_shift.compute_digest()
+        with pytest.raises(ValueError):
+            daily_shift.add_bill(DataFactory.create_bill(BillIds.BILL_6, DayIds.DAY_1).to_model())
+
+    @pytest.mark.asyncio
+    async def test_seal_closed_days_persists_digests(self, sync_instance: Sync, temp_dir: Path) -> None:
+        """Test every day but the current one is sealed and written with its digest"""
+        # Act
+        await sync_instance.seal_closed_days()
+
+        # Assert
+        with open(temp_dir / FileNames.DAILY_SHIFTS_JSON, "r") as f:
+            stored = json.load(f)
+        assert {int(k) for k, v in stored.items() if v["sealed"]} == {DayIds.DAY_1, DayIds.DAY_2, DayIds.DAY_3}
+        assert stored[str(DayIds.DAY_4)]["digest"] is None
+
+    @pytest.mark.asyncio
+    async def test_sealed_days_checked_by_digest_once(self, sync_instance: Sync, temp_dir: Path) -> None:
+        """Test sealed days compare a single digest and are skipped once confirmed"""
+        # Arrange
+        await sync_instance.seal_closed_days()
+        digests = {day_id: (await sync_instance.in_memory_repo.get(day_id)).digest for day_id in (DayIds.DAY_1, DayIds.DAY_2)}  # type: ignore
+        sync_instance.db.get_digest.side_effect = lambda day_id: digests.get(day_id)
+        with open(temp_dir / FileNames.LAST_BILL_ID_JSON, "w") as f:
+            json.dump({"last_id": BillIds.BILL_6}, f)
+
+        # Act
+        await sync_instance.sync_bills()
+        await sync_instance.sync_bills()
+
+        # Assert
+        sync_instance.db.get.assert_not_called()
+        assert sync_instance.db.get_digest.call_count == 3 + 1  # Day 3 has no remote digest, checked again
+        saved_days = {call.kwargs["daily_shift"].id for call in sync_instance.db.save.call_args_list}
+        assert DayIds.DAY_3 in saved_days
+        assert not saved_days & {DayIds.DAY_1, DayIds.DAY_2}
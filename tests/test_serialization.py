@@ -0,0 +1,61 @@
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import pytest
+
+from app.commons import time
+from app.register import adapters, serialization
+from tests.test_constants import DayIds, FileNames, DataFactory
+
+
+class TestSerialization:
+    """Test suite for the pydantic-core serialization of daily shifts"""
+
+    @pytest.fixture
+    def in_memory_repo(self, temp_dir: Path, clock: time.ManualClock) -> adapters.InMemoryRepo:
+        """Create a real InMemoryRepo instance"""
+        return adapters.InMemoryRepo(path_file=str(temp_dir / FileNames.DAILY_SHIFTS_JSON), hot_days=3, clock=clock)
+
+    def test_round_trip(self) -> None:
+        """Test dumped bytes load back to the same days and stay plain JSON"""
+        # Arrange
+        daily_shifts = {int(k): v.to_model() for k, v in DataFactory.create_multi_day_scenario().items()}
+
+        # Act
+        data = serialization.dump_daily_shifts(daily_shifts)
+
+        # Assert
+        assert serialization.load_daily_shifts(data) == daily_shifts
+        assert json.loads(data)[str(DayIds.DAY_1)] == daily_shifts[DayIds.DAY_1].model_dump()
+        assert serialization.load_daily_shifts(b"") == {}
+
+    @pytest.mark.asyncio
+    async def test_trusted_read_reuses_live_days(self, in_memory_repo: adapters.InMemoryRepo) -> None:
+        """Test the file this repo wrote is not parsed again"""
+        # Arrange
+        daily_shift = DataFactory.create_multi_day_scenario()[str(DayIds.DAY_4)].to_model()
+        await in_memory_repo.save(daily_shift=daily_shift)
+
+        # Act
+        stored_days = in_memory_repo.read_stored_days()
+
+        # Assert
+        assert stored_days[DayIds.DAY_4] is daily_shift
+
+    @pytest.mark.asyncio
+    async def test_modified_file_is_validated(
+        self, in_memory_repo: adapters.InMemoryRepo, temp_dir: Path, write_test_data: Callable[[Dict[str, Any]], None]
+    ) -> None:
+        """Test a file changed behind the repo's back fails the checksum and is parsed"""
+        # Arrange
+        test_data = DataFactory.create_multi_day_scenario()
+        await in_memory_repo.save(daily_shift=test_data[str(DayIds.DAY_4)].to_model())
+        write_test_data(test_data)
+
+        # Act
+        stored_days = in_memory_repo.read_stored_days()
+
+        # Assert
+        assert set(stored_days) == {DayIds.DAY_1, DayIds.DAY_2, DayIds.DAY_3, DayIds.DAY_4}
+        assert stored_days[DayIds.DAY_2] == test_data[str(DayIds.DAY_2)].to_model()
@@ -7,6 +7,7 @@ from typing import Dict, Any
 import pytest
 import pytest_asyncio
 
+from app.commons import time
 from app.register.entrypoints.cron import Sync
 from app.register import adapters
 from tests.test_constants import (
@@ -24,10 +25,10 @@ class TestSyncBills:
         return AsyncMock()
 
     @pytest.fixture
-    def in_memory_repo(self, temp_dir: Path) -> adapters.InMemoryRepo:
+    def in_memory_repo(self, temp_dir: Path, clock: time.ManualClock) -> adapters.InMemoryRepo:
         """Create a real InMemoryRepo instance"""
         daily_shifts_path = temp_dir / FileNames.DAILY_SHIFTS_JSON
-        return adapters.InMemoryRepo(path_file=str(daily_shifts_path))
+        return adapters.InMemoryRepo(path_file=str(daily_shifts_path), clock=clock)
 
     @pytest.fixture
     def temp_dir(self, monkeypatch) -> Path:
@@ -38,9 +39,9 @@ class TestSyncBills:
             yield temp_dir_path
 
     @pytest.fixture
-    def sync_instance(self, mock_db: AsyncMock, in_memory_repo: adapters.InMemoryRepo) -> Sync:
+    def sync_instance(self, mock_db: AsyncMock, in_memory_repo: adapters.InMemoryRepo, clock: time.ManualClock) -> Sync:
         """Create a Sync instance with mocked DB and real in-memory repo"""
-        return Sync(db=mock_db, in_memory_repo=in_memory_repo)
+        return Sync(db=mock_db, in_memory_repo=in_memory_repo, clock=clock)
 
     def _write_test_data(self, temp_dir: Path, data: Dict[str, Any]) -> None:
         """Helper method to write test data to files"""
@@ -81,8 +82,7 @@ class TestSyncBills:
     async def test_sync_bills_all_days_synced(
         self, 
         sync_instance: Sync, 
-        temp_dir: Path,
-        monkeypatch
+        temp_dir: Path
     ) -> None:
         """Test sync_bills when all days are already synced"""
         # Arrange
@@ -90,9 +90,6 @@ class TestSyncBills:
         self._write_test_data(temp_dir, test_data)
         self._write_last_bill_id(temp_dir, BillIds.BILL_6)  # All synced
 
-        # Mock current day
-        monkeypatch.setattr("app.commons.time.get_posix_time_until_day", lambda: DayIds.DAY_4)
-
         # Mock DynamoDB to return existing data for all days
         async def mock_get(day_id: int):
             if str(day_id) in test_data:
@@ -111,8 +108,7 @@ class TestSyncBills:
     async def test_sync_bills_multi_day_sync_success(
         self, 
         sync_instance: Sync, 
-        temp_dir: Path,
-        monkeypatch
+        temp_dir: Path
     ) -> None:
         """Test sync_bills successfully syncing multiple unsynced days"""
         # Arrange
@@ -120,9 +116,6 @@ class TestSyncBills:
         self._write_test_data(temp_dir, test_data)
         self._write_last_bill_id(temp_dir, BillIds.BILL_2)  # Only Day 1 synced
 
-        # Mock current day
-        monkeypatch.setattr("app.commons.time.get_posix_time_until_day", lambda: DayIds.DAY_4)
-
         # Mock DynamoDB - only Day 1 exists
         async def mock_get(day_id: int):
             if day_id == DayIds.DAY_1:
@@ -153,8 +146,7 @@ class TestSyncBills:
     async def test_sync_bills_partial_failure(
         self, 
         sync_instance: Sync, 
-        temp_dir: Path,
-        monkeypatch
+        temp_dir: Path
     ) -> None:
         """Test sync_bills with partial failures during sync"""
         # Arrange
@@ -162,9 +154,6 @@ class TestSyncBills:
         self._write_test_data(temp_dir, test_data)
         self._write_last_bill_id(temp_dir, BillIds.BILL_2)  # Only Day 1 synced
 
-        # Mock current day
-        monkeypatch.setattr("app.commons.time.get_posix_time_until_day", lambda: DayIds.DAY_4)
-
         # Mock DynamoDB - only Day 1 exists
         async def mock_get(day_id: int):
             if day_id == DayIds.DAY_1:
@@ -198,8 +187,7 @@ class TestSyncBills:
     async def test_sync_bills_current_day_only(
         self, 
         sync_instance: Sync, 
-        temp_dir: Path,
-        monkeypatch
+        temp_dir: Path
     ) -> None:
         """Test sync_bills when only current day needs syncing"""
         # Arrange
@@ -207,9 +195,6 @@ class TestSyncBills:
         self._write_test_data(temp_dir, test_data)
         self._write_last_bill_id(temp_dir, BillIds.BILL_5)  # Up to Day 3 synced
 
-        # Mock current day
-        monkeypatch.setattr("app.commons.time.get_posix_time_until_day", lambda: DayIds.DAY_4)
-
         # Mock DynamoDB - Days 1, 2, 3 exist
         async def mock_get(day_id: int):
             if day_id in [DayIds.DAY_1, DayIds.DAY_2, DayIds.DAY_3]:
@@ -241,7 +226,7 @@ class TestSyncBills:
         self, 
         sync_instance: Sync, 
         temp_dir: Path,
-        monkeypatch
+        clock: time.ManualClock
     ) -> None:
         """Test sync_bills with days that have no bills"""
         # Arrange
@@ -251,8 +236,8 @@ class TestSyncBills:
         self._write_test_data(temp_dir, empty_day_data)
         self._write_last_bill_id(temp_dir, BillIds.NO_ID)
 
-        # Mock current day
-        monkeypatch.setattr("app.commons.time.get_posix_time_until_day", lambda: DayIds.DAY_1)
+        # Current day is DAY_1
+        clock.advance(DayIds.DAY_1 - DayIds.DAY_4)
 
         # Act
         await sync_instance.sync_bills()
@@ -264,8 +249,7 @@ class TestSyncBills:
     async def test_sync_bills_handles_read_only_file_gracefully(
         self, 
         sync_instance: Sync, 
-        temp_dir: Path,
-        monkeypatch
+        temp_dir: Path
     ) -> None:
         """Test sync_bills handles read-only last_bill_id.json gracefully"""
         # Arrange
@@ -278,9 +262,6 @@ class TestSyncBills:
             json.dump({"last_id": BillIds.BILL_2}, f)
         last_bill_path.chmod(0o444)  # Read-only
 
-        # Mock current day
-        monkeypatch.setattr("app.commons.time.get_posix_time_until_day", lambda: DayIds.DAY_4)
-
         # Mock DynamoDB
         sync_instance.db.get.return_value = None
 
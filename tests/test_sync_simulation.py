@@ -0,0 +1,50 @@
+import pytest
+
+from benchmarks import simulate_sync
+from benchmarks import fakes
+
+
+class TestFakeTable:
+    def test_items_over_400_kb_are_rejected(self):
+        # Arrange
+        table = fakes.FakeTable()
+        # Act / Assert
+        with pytest.raises(fakes.FakeClientError) as error:
+            table.put_item(Item={"id": 1, "payload": b"x" * (fakes.MAX_ITEM_BYTES + 1)})
+        assert error.value.response["Error"]["Code"] == "ValidationException"
+        assert table.items == {}
+
+    def test_failed_batch_keeps_the_previous_requests(self):
+        # Arrange
+        table = fakes.FakeTable(fakes.BILL_LAYOUT_KEYS, faults=fakes.Faults(batch_failure_rate=0.5, seed=3))
+        # Act
+        with pytest.raises(fakes.FakeClientError):
+            with table.batch_writer() as batch:
+                for i in range(500):
+                    batch.put_item(Item={"day": 1, "bill_id": f"bill_{i:03}"})
+        # Assert
+        assert len(table.items) % 25 == 0
+        assert len(table.items) < 500
+
+
+class TestSyncSimulation:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("layout", ["day", "bill"])
+    async def test_backlog_is_synced_after_an_outage(self, layout: str):
+        # Arrange
+        scenario = simulate_sync.Scenario(
+            "outage",
+            days=2,
+            bills_per_hour=4,
+            sync_interval=1800,
+            layout=layout,
+            outages=[(8 * 3600, 30 * 3600)],
+            throttle_rate=0.1,
+        )
+        # Act
+        result = await simulate_sync.simulate(scenario)
+        # Assert
+        assert result["bills"] > 0
+        assert result["unsynced_bills"] == 0
+        assert result["recovery_s"][0] is not None
+        assert result["errors"]["EndpointConnectionError"] > 0
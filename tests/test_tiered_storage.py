@@ -0,0 +1,165 @@
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock
+from typing import Any, Callable, Dict
+
+import pytest
+
+from app.commons import time
+from app.register.entrypoints.cron import Sync
+from app.register import adapters
+from tests.test_constants import DayIds, BillIds, FileNames, DataFactory
+
+
+class TestTieredStorage:
+    """Test suite for the hot/warm tiers of InMemoryRepo"""
+
+    def _read_daily_shifts(self, temp_dir: Path) -> Dict[str, Any]:
+        """Helper method to read daily_shifts.json"""
+        with open(temp_dir / FileNames.DAILY_SHIFTS_JSON, "r") as f:
+            return json.load(f)
+
+    @pytest.mark.asyncio
+    async def test_load_moves_old_days_to_segments(
+        self, temp_dir: Path, clock: time.ManualClock, write_test_data: Callable[[Dict[str, Any]], None]
+    ) -> None:
+        """Test a large backlog on disk is split into hot days and warm segments"""
+        # Arrange
+        write_test_data(DataFactory.create_multi_day_scenario())
+
+        # Act
+        repo = adapters.InMemoryRepo(path_file=str(temp_dir / FileNames.DAILY_SHIFTS_JSON), hot_days=1, clock=clock)
+
+        # Assert
+        assert set(repo._daily_shifts) == {DayIds.DAY_3, DayIds.DAY_4}
+        assert {int(k) for k in self._read_daily_shifts(temp_dir)} == {DayIds.DAY_3, DayIds.DAY_4}
+        assert list(repo.warm_days) == [DayIds.DAY_1, DayIds.DAY_2]
+        warm_day = await repo.get(DayIds.DAY_2)
+        assert warm_day is not None
+        assert [bill.id for bill in warm_day.bills] == [BillIds.BILL_3, BillIds.BILL_4]
+
+    @pytest.mark.asyncio
+    async def test_save_keeps_memory_bounded(self, temp_dir: Path, clock: time.ManualClock) -> None:
+        """Test saving days keeps only the current and most recent days as objects"""
+        # Arrange
+        repo = adapters.InMemoryRepo(path_file=str(temp_dir / FileNames.DAILY_SHIFTS_JSON), hot_days=0, warm_cache_size=1, clock=clock)
+
+        # Act
+        for daily_shift in DataFactory.create_multi_day_scenario().values():
+            await repo.save(daily_shift=daily_shift.to_model())
+
+        # Assert
+        assert set(repo._daily_shifts) == {DayIds.DAY_4}
+        assert len(repo.warm_days) == 3
+        for day_id in (DayIds.DAY_1, DayIds.DAY_2, DayIds.DAY_3):
+            assert (await repo.get(day_id)).id == day_id  # type: ignore
+        assert len(repo.warm_days._cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_sync_and_cleanup_cover_warm_days(
+        self, temp_dir: Path, clock: time.ManualClock, write_test_data: Callable[[Dict[str, Any]], None]
+    ) -> None:
+        """Test sync uploads warm days and cleanup drops their segments once synced"""
+        # Arrange
+        test_data = DataFactory.create_multi_day_scenario()
+        write_test_data(test_data)
+        repo = adapters.InMemoryRepo(path_file=str(temp_dir / FileNames.DAILY_SHIFTS_JSON), hot_days=0, clock=clock)
+        remote = {}
+
+        async def mock_save(daily_shift):
+            remote[daily_shift.id] = daily_shift
+
+        async def mock_get(day_id: int):
+            return remote.get(day_id)
+
+        mock_db = AsyncMock()
+        mock_db.save.side_effect = mock_save
+        mock_db.get.side_effect = mock_get
+        sync_instance = Sync(db=mock_db, in_memory_repo=repo, clock=clock)
+
+        # Act
+        await sync_instance.sync_bills()
+        await sync_instance.clean_daily_shifts()
+
+        # Assert
+        assert set(remote) == {DayIds.DAY_1, DayIds.DAY_2, DayIds.DAY_3, DayIds.DAY_4}
+        assert len(repo.warm_days) == 0
+        assert not list((temp_dir / "daily_shifts_segments").iterdir())
+        assert {int(k) for k in self._read_daily_shifts(temp_dir)} == {DayIds.DAY_4}
+
+    @pytest.mark.asyncio
+    async def test_sync_checks_warm_days_without_decoding_them(
+        self, temp_dir: Path, clock: time.ManualClock, write_test_data: Callable[[Dict[str, Any]], None], monkeypatch
+    ) -> None:
+        """Test synced warm days are checked from their summaries and unchecked days wait for the next sync"""
+        # Arrange
+        test_data = DataFactory.create_multi_day_scenario()
+        write_test_data(test_data)
+        repo = adapters.InMemoryRepo(path_file=str(temp_dir / FileNames.DAILY_SHIFTS_JSON), hot_days=0, clock=clock)
+        decoded = []
+        decode = adapters.codec.decode_daily_shift
+        monkeypatch.setattr(adapters.codec, "decode_daily_shift", lambda payload: decoded.append(1) or decode(payload))
+        saved = []
+
+        async def mock_get(day_id: int):
+            if day_id == DayIds.DAY_2:
+                raise ConnectionError("DynamoDB unreachable")
+            return test_data[str(day_id)].to_model() if day_id == DayIds.DAY_1 else None
+
+        async def mock_save(daily_shift):
+            saved.append(daily_shift.id)
+
+        mock_db = AsyncMock()
+        mock_db.get.side_effect = mock_get
+        mock_db.save.side_effect = mock_save
+        sync_instance = Sync(db=mock_db, in_memory_repo=repo, clock=clock)
+
+        # Act
+        await sync_instance.sync_bills()
+
+        # Assert
+        assert saved == [DayIds.DAY_3, DayIds.DAY_4]
+        assert len(decoded) == 1  # only DAY_3, to be sent
+        assert len(repo.warm_days._cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_lazy_load_defers_past_days(
+        self, temp_dir: Path, clock: time.ManualClock, write_test_data: Callable[[Dict[str, Any]], None]
+    ) -> None:
+        """Test lazy startup validates only the current day and keeps the rest on disk"""
+        # Arrange
+        write_test_data(DataFactory.create_multi_day_scenario())
+        repo = adapters.InMemoryRepo(path_file=str(temp_dir / FileNames.DAILY_SHIFTS_JSON), hot_days=1, lazy=True, clock=clock)
+        current_day = await repo.get(DayIds.DAY_4)
+
+        # Act
+        current_day.add_bill(DataFactory.create_bill(BillIds.BILL_1, DayIds.DAY_4).to_model())  # type: ignore
+        await repo.save(daily_shift=current_day)  # type: ignore
+        written_before_load = {int(k) for k in self._read_daily_shifts(temp_dir)}
+        await repo.load_deferred_days()
+
+        # Assert
+        assert set(repo._deferred_days) == set()
+        assert written_before_load == {DayIds.DAY_1, DayIds.DAY_2, DayIds.DAY_3, DayIds.DAY_4}
+        assert set(repo._daily_shifts) == {DayIds.DAY_3, DayIds.DAY_4}
+        assert list(repo.warm_days) == [DayIds.DAY_1, DayIds.DAY_2]
+        assert len(self._read_daily_shifts(temp_dir)[str(DayIds.DAY_4)]["bills"]) == 2
+
+    def test_segment_store_is_a_mutable_mapping(self, temp_dir: Path) -> None:
+        """Test days can be stored and deleted through the mapping interface"""
+        # Arrange
+        segments = adapters.SegmentStore(str(temp_dir / "segments"))
+        daily_shift = DataFactory.create_multi_day_scenario()[str(DayIds.DAY_1)].to_model()
+
+        # Act
+        segments[DayIds.DAY_1] = daily_shift
+        stored = list(segments)
+        del segments[DayIds.DAY_1]
+
+        # Assert
+        assert stored == [DayIds.DAY_1]
+        assert DayIds.DAY_1 not in segments
+        with pytest.raises(ValueError):
+            segments[DayIds.DAY_2] = daily_shift
+        with pytest.raises(KeyError):
+            del segments[DayIds.DAY_1]